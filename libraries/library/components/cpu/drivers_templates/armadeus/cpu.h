@@ -0,0 +1 @@
+#define CPU_NB /*$number_of_instances$*/
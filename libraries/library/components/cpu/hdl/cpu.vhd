@@ -0,0 +1,2 @@
+-- cpu
+entity cpu is end;
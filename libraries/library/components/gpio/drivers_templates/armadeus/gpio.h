@@ -0,0 +1,7 @@
+#define NB /*$number_of_instances$*/
+/*$foreach:instance$*/
+#define /*$instance_name$*/_BASE /*$registers_base_address:swb16$*/
+#define /*$instance_name$*/_NUM /*$instance_num$*/
+#define /*$instance_name$*/_ID /*$generic:id$*/
+#define /*$instance_name$*/_REG /*$register:swb16:reg1:offset$*/
+/*$foreach:instance:end$*/
@@ -0,0 +1,2 @@
+-- gpio
+entity gpio is end;
@@ -0,0 +1,114 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     codewriter.py
+# Purpose:  Streaming writer for generated code
+#
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+#
+# Created:  18/10/2026
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" Streaming writer for generated code """
+
+import os
+
+from periphondemand.bin.define import ONETAB
+
+# chunks kept in buffer so that trim() can still remove them
+TRIMMAX = 16
+# buffer size written in file at once
+BUFFERSIZE = 65536
+
+
+class CodeWriter(object):
+    """ Emit generated code in a list buffer, or in a file if a filename
+        is given. The file is written in filename.tmp and renamed when
+        writer is closed, so that a failed generation keep the old file.
+
+        with CodeWriter(filename) as writer:
+            writer.line("entity top is", tabs=0)
+
+        attributes:
+            position -- count of characters written
+    """
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.position = 0
+        self._chunks = []
+        self._buffered = 0
+        self._file = None
+        if filename is not None:
+            self._file = open(filename + ".tmp", "w")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def write(self, text, tabs=0):
+        """ write text, indented with tabs ONETAB """
+        if tabs:
+            text = ONETAB * tabs + text
+        if text:
+            self._chunks.append(text)
+            self.position = self.position + len(text)
+            self._buffered = self._buffered + len(text)
+            if self._file is not None and self._buffered > BUFFERSIZE:
+                self._flush(keep=TRIMMAX)
+
+    def line(self, text="", tabs=0):
+        """ write one line, indented with tabs ONETAB """
+        self.write(text + "\n", tabs)
+
+    def trim(self, count, start=0):
+        """ remove the last count characters written, but not those
+            written before position start """
+        count = min(count, self.position - start)
+        while count > 0:
+            if not self._chunks:
+                raise ValueError("Can't trim code already written")
+            last = self._chunks.pop()
+            removed = min(count, len(last))
+            if removed < len(last):
+                self._chunks.append(last[:-removed])
+            count = count - removed
+            self.position = self.position - removed
+            self._buffered = self._buffered - removed
+
+    def _flush(self, keep=0):
+        """ write buffer in file, except the last keep characters """
+        kept = []
+        size = 0
+        while self._chunks and size < keep:
+            kept.insert(0, self._chunks.pop())
+            size = size + len(kept[0])
+        self._file.write("".join(self._chunks))
+        self._chunks = kept
+        self._buffered = size
+
+    def getvalue(self):
+        """ return code written, for writer without file """
+        return "".join(self._chunks)
+
+    def close(self):
+        """ write what is left and replace file """
+        if self._file is not None:
+            self._flush()
+            self._file.close()
+            self._file = None
+            os.replace(self.filename + ".tmp", self.filename)
+
+    def abort(self):
+        """ forget code written, file is left untouched """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            os.remove(self.filename + ".tmp")
+        self._chunks = []
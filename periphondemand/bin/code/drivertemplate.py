@@ -0,0 +1,212 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     drivertemplate.py
+# Purpose:  Compiled drivers templates
+#
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+#
+# Created:  18/10/2026
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" Drivers templates compiled once in literal and placeholder segments.
+
+    Placeholders are written /*$name$*/ or /*$name:arguments$*/.
+    number_of_instances and main_clock are replaced outside foreach
+    blocks, instance placeholders are replaced in blocks written between
+    /*$foreach:instance$*/ and /*$foreach:instance:end$*/ lines.
+    Unknown placeholders are left as is.
+"""
+
+import io
+import os
+import re
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.utils.display import Display
+
+DISPLAY = Display()
+
+PLACEHOLDER = re.compile(r'/\*\$([^$]*)\$\*/')
+FOREACH_BEGIN = re.compile(r'^/\*\$foreach:instance\$\*/')
+FOREACH_END = re.compile(r'^/\*\$foreach:instance:end\$\*/')
+
+# placeholder name: count of arguments
+PROJECT_FIELDS = {"number_of_instances": 0,
+                  "main_clock": 0}
+INSTANCE_FIELDS = {"instance_name": 0,
+                   "instance_num": 0,
+                   "generic": 1,
+                   "registers_base_address": 1,
+                   "register": 3,
+                   "interrupt_number": 0}
+
+
+def tokenize(text, fields):
+    """ Split text in a list of literal strings and (name, arguments)
+        placeholders tuples, only placeholders in fields are kept """
+    segments = []
+    position = 0
+    for match in PLACEHOLDER.finditer(text):
+        name = match.group(1).split(":", 1)[0]
+        if name not in fields:
+            continue
+        words = match.group(1).split(":", fields[name])
+        if len(words) != fields[name] + 1:
+            continue
+        if match.start() > position:
+            segments.append(text[position:match.start()])
+        segments.append((name, tuple(words[1:])))
+        position = match.end()
+    if position < len(text):
+        segments.append(text[position:])
+    return segments
+
+
+class DriverTemplate(object):
+    """ Driver template compiled in blocks
+        attributes:
+            blocks -- list of (foreach, segments), segments of foreach
+                      blocks are rendered for each instance
+            stamp  -- modification time and size of template file
+    """
+
+    # templates already compiled, key is file name
+    cache = {}
+
+    def __init__(self, text):
+        self.blocks = []
+        self.stamp = None
+        foreach = None
+        literal = ""
+        for line in io.StringIO(text):
+            if foreach is None:
+                if FOREACH_BEGIN.match(line) is not None:
+                    self._add_block(False, literal)
+                    literal = ""
+                    foreach = ""
+                else:
+                    literal = literal + line
+            elif FOREACH_END.match(line) is not None:
+                self._add_block(True, foreach + "\n")
+                foreach = None
+            else:
+                foreach = foreach + line
+        # foreach blocks not ended are dropped
+        self._add_block(False, literal)
+
+    def _add_block(self, foreach, text):
+        """ compile text in a new block """
+        if text:
+            fields = INSTANCE_FIELDS if foreach else PROJECT_FIELDS
+            self.blocks.append((foreach, tokenize(text, fields)))
+
+    @classmethod
+    def load(cls, filename):
+        """ Get compiled template of filename, compiled again only if
+            file changed """
+        try:
+            stat = os.stat(filename)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            template = cls.cache.get(filename)
+            if template is None or template.stamp != stamp:
+                with open(filename, "r") as templatefile:
+                    template = DriverTemplate(templatefile.read())
+                template.stamp = stamp
+                cls.cache[filename] = template
+        except IOError as error:
+            raise PodError(str(error), 0)
+        return template
+
+    def render(self, project, component, messages=None):
+        """ Return template filled for component instances, messages
+            are appended in messages list if given, else displayed """
+        instances = project.get_instances_list_of_component(component.name)
+        out = []
+        values = {}
+        warnings = []
+        try:
+            for foreach, segments in self.blocks:
+                if not foreach:
+                    self._render(out, segments, values, project_value,
+                                 project, instances)
+                    continue
+                for instance in instances:
+                    self._render(out, segments, {}, instance_value,
+                                 instance, warnings)
+        finally:
+            if messages is None:
+                for message in warnings:
+                    DISPLAY.msg(*message)
+            else:
+                messages.extend(warnings)
+        return "".join(out)
+
+    @classmethod
+    def _render(cls, out, segments, values, get_value, *context):
+        """ append segments to out, values caches placeholders values """
+        for segment in segments:
+            if isinstance(segment, str):
+                out.append(segment)
+                continue
+            value = values.get(segment)
+            if value is None:
+                value = get_value(segment[0], segment[1], *context)
+                values[segment] = value
+            out.append(value)
+
+
+def project_value(name, arguments, project, instances):
+    """ Get value of project placeholder """
+    if name == "number_of_instances":
+        return str(len(instances))
+    return project.platform.main_clock
+
+
+def instance_value(name, arguments, instance, messages):
+    """ Get value of instance placeholder """
+    if name == "instance_name":
+        return instance.instancename.upper()
+    if name == "instance_num":
+        return instance.num
+    if name == "generic":
+        return instance.get_generic(arguments[0]).value
+    if name == "registers_base_address":
+        return hex(instance.get_interface(arguments[0]).base_addr)
+    if name == "register":
+        value = instance.get_interface(arguments[0]).get_register(
+            arguments[1]).get_attr_value(arguments[2])
+        if not value:
+            raise PodError("Wrong register value -> " +
+                           ":".join(arguments) + "\n", 0)
+        return value
+    return interrupt_number(instance, messages)
+
+
+def interrupt_number(instance, messages):
+    """ Get the interrupt number of instance, warnings are appended
+        in messages """
+    interruptlist = instance.interrupts
+    if len(interruptlist) == 0:
+        raise PodError("No interruption port in " +
+                       instance.instancename, 0)
+    elif len(interruptlist) > 1:
+        messages.append(("More than one interrupt port in " +
+                         instance.instancename + "." +
+                         interruptlist[0].name + " is used", 3))
+    interruptport = interruptlist[0]
+    try:
+        connect = interruptport.get_pin(0).connections
+    except PodError:
+        raise PodError("Interrupt " + interruptport.name +
+                       " not connected in " +
+                       interruptport.parent.parent.instancename +
+                       "." + interruptport.parent.name, 0)
+    if len(connect) == 0:
+        raise PodError("Interrupt " + interruptport.name +
+                       " is not connected", 0)
+    elif len(connect) > 1:
+        messages.append(("More than one connection for interruption " +
+                         "port " + interruptport.name + ". " +
+                         connect[0]["port_dest"] + " is used", 3))
+    return connect[0]["pin_dest"]
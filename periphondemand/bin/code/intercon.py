@@ -25,20 +25,53 @@
 # ----------------------------------------------------------------------------
 """ Manage intercon """
 
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from periphondemand.bin.define import COMPONENTSPATH
+from periphondemand.bin.define import HDLDIR
+
+from periphondemand.bin.utils import wrappersystem as sy
+from periphondemand.bin.utils import xmlbackend
+from periphondemand.bin.utils.wrapperxml import WrapperXml
 from periphondemand.bin.utils.display import Display
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.utils.settings import Settings
 
 from periphondemand.bin.core.component import Component
 from periphondemand.bin.core.port import Port
 from periphondemand.bin.core.interface import Interface
+from periphondemand.bin.core.hdl_file import HdlFile
 
 DISPLAY = Display()
+SETTINGS = Settings()
+
+# intercons written by the running pool, forked workers inherit them
+_POOL_INTERCONS = []
+
+
+def _generate_code(index):
+    """ process pool worker, write code of intercon number index.
+        return (hdl files xml strings, error message)
+    """
+    intercon = _POOL_INTERCONS[index]
+    try:
+        intercon.masterinterface.bus.generate_intercon(intercon)
+    except Exception as error:
+        return (None, Intercon.failure_message(intercon.masterinterface,
+                                               error))
+    return ([xmlbackend.tostring(hdl_file.tree)
+             for hdl_file in intercon.hdl_files], None)
 
 
 class Intercon(Component):
     """ Generate Intercon component """
 
-    def __init__(self, parent, masterinterface):
-        """ Init fonction
+    def __init__(self, parent, masterinterface, generate=True):
+        """ Init fonction, if generate is False xml and code are
+            written later by generate()
         """
         masterinstancename = masterinterface.parent.instancename
         masterinterfacename = masterinterface.name
@@ -48,16 +81,107 @@ class Intercon(Component):
         self.add_node(nodename="component")
 
         masterinstance = self.parent.get_instance(masterinstancename)
-        masterinterface = masterinstance.get_interface(masterinterfacename)
-
-        # Write xml description
-        self.generate_xml(masterinterface)
-        # Write Code for component
+        self.masterinterface =\
+            masterinstance.get_interface(masterinterfacename)
 
-        masterinterface.bus.generate_intercon(self)
+        if generate:
+            self.generate()
 
+    def generate(self):
+        """ Write xml description and code of component """
+        self.generate_xml(self.masterinterface)
+        self.masterinterface.bus.generate_intercon(self)
         DISPLAY.msg("Intercon with name : " + self.instancename + " Done")
 
+    @classmethod
+    def generate_codes(cls, intercons, jobs):
+        """ Write code of intercons which xml is generated with a pool of
+            jobs forked processes, each one writing its own intercon
+            directory. Hdl files are added to intercons by main process.
+            Return the list of error messages, None for success
+        """
+        global _POOL_INTERCONS
+        _POOL_INTERCONS = intercons
+        context = multiprocessing.get_context("fork")
+        try:
+            with ProcessPoolExecutor(max_workers=jobs,
+                                     mp_context=context) as executor:
+                results = list(executor.map(_generate_code,
+                                            range(len(intercons))))
+        finally:
+            _POOL_INTERCONS = []
+        errors = []
+        for intercon, (hdl_files, error) in zip(intercons, results):
+            for hdl_file in hdl_files or []:
+                intercon.add_hdl_file(
+                    HdlFile(intercon, node=WrapperXml(nodestring=hdl_file)))
+            errors.append(error)
+        return errors
+
+    @classmethod
+    def failure_message(cls, masterinterface, error):
+        """ Get message of error raised by masterinterface intercon
+            generation
+        """
+        if isinstance(error, PodError):
+            return error.message
+        return "Intercon generation of " +\
+            masterinterface.parent.instancename + "." +\
+            masterinterface.name + " failed: " +\
+            type(error).__name__ + ": " + str(error)
+
+    @classmethod
+    def intercon_name(cls, masterinterface):
+        """ Get the instance name of masterinterface intercon """
+        return masterinterface.parent.instancename + "_" +\
+            masterinterface.name + "_intercon"
+
+    @classmethod
+    def configuration(cls, masterinterface):
+        """ Return a digest of everything intercon generation reads:
+            bus plugin, master and slaves interfaces, base addresses,
+            sizes, ports and syscon ports
+        """
+        digest = hashlib.sha1()
+
+        def add(*values):
+            """ add values to digest """
+            digest.update((repr(values) + "\n").encode("utf-8"))
+
+        plugin = masterinterface.bus.load_plugin()
+        stat = os.stat(plugin.__file__)
+        add(masterinterface.bus_name, stat.st_mtime_ns, stat.st_size,
+            SETTINGS.author)
+        interfaces = [slave.get_interface()
+                      for slave in masterinterface.slaves]
+        interfaces.append(masterinterface)
+        for interface in interfaces:
+            add(interface.parent.instancename, interface.name,
+                interface.interface_class, interface.addr_port_size,
+                interface.get_attr_value("data_size"))
+            if interface.interface_class == "slave":
+                add(interface.base_addr, interface.mem_size)
+            syscon = interface.parent.get_one_syscon()
+            for port in interface.ports +\
+                    (syscon.ports if syscon is not None else []):
+                add(port.name, port.porttype, port.direction, port.size)
+        return digest.hexdigest()
+
+    @classmethod
+    def is_up_to_date(cls, component, masterinterface):
+        """ True if intercon component was generated with the same
+            masterinterface configuration and its code is still here
+        """
+        if component.get_attr_value("configuration") !=\
+                cls.configuration(masterinterface):
+            return False
+        for hdlfile in component.hdl_files:
+            if not sy.file_exist(SETTINGS.projectpath + COMPONENTSPATH +
+                                 "/" + component.instancename + "/" +
+                                 HDLDIR + "/" + hdlfile.filename):
+                return False
+        return component.hdl_files != []
+
     def generate_xml(self, masterinterface):
         """ Generate intercon code
         """
@@ -71,6 +195,7 @@ class Intercon(Component):
             "_intercon"
         self.description = "Connect slaves to " + masterinterface.name +\
             " from " + masterinstance.instancename
+        self.set_attr("configuration", self.configuration(masterinterface))
 
         # Save to make directories
         self.save()
@@ -28,12 +28,19 @@
 from periphondemand.bin.define import ONETAB
 from periphondemand.bin.define import SYNTHESISPATH
 from periphondemand.bin.define import VHDLEXT
+from periphondemand.bin.define import OBJSPATH
+from periphondemand.bin.define import TOPFINGERPRINTFILE
+
+from periphondemand.bin.code.codewriter import CodeWriter
 
 from periphondemand.bin.utils.display import Display
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.utils.settings import Settings
+from periphondemand.bin.utils import wrappersystem as sy
 
 import datetime
+import hashlib
+import os
 
 DISPLAY = Display()
 SETTINGS = Settings()
@@ -70,11 +77,12 @@ class TopGen(object):
                                 self.project.description)
         return header
 
-    def entity(self, entityname, portlist):
-        """ return code for Top entity """
+    def entity(self, writer, entityname, portlist):
+        """ write code for Top entity """
         raise NotImplementedError("method must be implemented", 0)
 
-    def architecture(self, entityname, portlist, incompleteportslist):
+    def architecture(self, writer, entityname, portlist,
+                     incompleteportslist):
         """ construct architecture part of the file """
         raise NotImplementedError("method must be implemented", 0)
 
@@ -157,15 +165,14 @@ class TopGen(object):
         """ return signal definition """
         raise NotImplementedError("method must be implemented", 0)
 
-    def entity_port_part(self, portlist):
-        """ return code for Top entity
+    def entity_port_part(self, writer, portlist):
+        """ write code for Top entity
         """
-        out = ""
+        start = writer.position
         for port in portlist:
             if port.force_defined():
                 portname = "force_" + port.name
-                out += ONETAB * 2 + self.add_scalar_sig(portname,
-                                                        "out")
+                writer.write(self.add_scalar_sig(portname, "out"), tabs=2)
             else:
                 portname = port.name
                 interfacename = port.parent.name
@@ -173,8 +180,9 @@ class TopGen(object):
 
                 if port.is_hidden:
                     continue
-                out += ONETAB + self.insert_comment(instancename +
-                                                    "-" + interfacename)
+                writer.write(self.insert_comment(instancename +
+                                                 "-" + interfacename),
+                             tabs=1)
                 if port.is_fully_connected():
                     if (port.direction == "in") or (port.direction == "inout"):
                         same_connections_ports = \
@@ -183,65 +191,49 @@ class TopGen(object):
                             raise PodError(str(port.extended_name) +
                                            " is left unconnected")
                         elif len(same_connections_ports) == 1:
-                            signame = ONETAB * 2 + instancename + "_" + \
-                                portname
-                            size = port.connected_msb
-                            if size < 1:
-                                out += self.add_scalar_sig(signame,
-                                                           port.direction)
-                            else:
-                                out += self.add_vector_sig(signame,
-                                                           port.direction,
-                                                           str(size), "0")
+                            self.entity_port_sig(writer, port)
                         else:
                             same_connections_ports_names = \
                                 sorted([aport.extended_name for
                                        aport in same_connections_ports])
                             if port.extended_name ==\
                                     same_connections_ports_names[0]:
-                                signame = ONETAB * 2 + instancename + \
-                                    "_" + portname
-                                size = port.connected_msb
-                                if size < 1:
-                                    out += self.add_scalar_sig(signame,
-                                                               port.direction)
-                                else:
-                                    out += self.add_vector_sig(signame,
-                                                               port.direction,
-                                                               str(size), "0")
+                                self.entity_port_sig(writer, port)
                     else:
                         # signal declaration
-                        signame = ONETAB * 2 + instancename + "_" + \
-                            portname
-                        size = port.connected_msb
-                        if size < 1:
-                            out += self.add_scalar_sig(signame,
-                                                       port.direction)
-                        else:
-                            out += self.add_vector_sig(signame,
-                                                       port.direction,
-                                                       str(size), "0")
+                        self.entity_port_sig(writer, port)
                 # port not completely connected
                 else:
                     for pin in port.pins:
                         if pin.is_connected_to_inst(self.project.platform):
-                            out += ONETAB * 2 + \
+                            writer.write(
                                 self.add_scalar_sig(instancename + "_" +
                                                     port.name + "_pin" +
                                                     str(pin.num),
-                                                    port.direction)
+                                                    port.direction),
+                                tabs=2)
         # Suppress the #!@ last semicolon
-        out = out[:-2]
-
-        return out
+        writer.trim(2, start)
+
+    def entity_port_sig(self, writer, port):
+        """ write entity signal of port connected to the platform """
+        signame = port.parent.parent.instancename + "_" + port.name
+        size = port.connected_msb
+        if size < 1:
+            writer.write(self.add_scalar_sig(signame, port.direction),
+                         tabs=2)
+        else:
+            writer.write(self.add_vector_sig(signame, port.direction,
+                                             str(size), "0"),
+                         tabs=2)
 
-    def declare_components(self):
+    def declare_components(self, writer):
         """ Declare components
         """
         if self.project.vhdl_version == "vhdl93":
-            return ""
+            return
 
-        out = self.insert_comment_block(ONETAB, "declare components")
+        writer.write(self.insert_comment_block(ONETAB, "declare components"))
         components = []
         for comp in self.project.instances:
             if comp.is_platform() is False:
@@ -256,49 +248,50 @@ class TopGen(object):
                 if comp.name == compname:
                     component = comp
                     break
-            out += "\n" + ONETAB + self.begin_component(compname)
+            writer.write("\n" + ONETAB + self.begin_component(compname))
             if component.fpga_generics != []:
-                out += ONETAB * 2 + self.begin_attributes()
+                writer.write(self.begin_attributes(), tabs=2)
                 for generic in component.fpga_generics:
-                    out += ONETAB * 3 + \
-                        self.insert_attribute(generic)
+                    writer.write(self.insert_attribute(generic), tabs=3)
                 # suppress comma
-                out = out[:-2] + "\n"
-                out += ONETAB * 2 + self.end_attributes()
+                writer.trim(2)
+                writer.write("\n")
+                writer.write(self.end_attributes(), tabs=2)
 
-            out += ONETAB * 2 + self.instance_begin_port()
+            writer.write(self.instance_begin_port(), tabs=2)
             for interface in component.interfaces:
-                out += ONETAB * 3 + \
-                    self.insert_comment(interface.name)
+                writer.write(self.insert_comment(interface.name), tabs=3)
                 for port in interface.ports:
                     if port.is_hidden:
                         continue
-                    out += ONETAB * 3 + \
-                        self.arch_add_line(port.name, port,
-                                           port.direction)
+                    writer.write(self.arch_add_line(port.name, port,
+                                                    port.direction),
+                                 tabs=3)
             # Suppress the #!@ last semicolon
-            out = out[:-2] + "\n"
-            out += ONETAB * 2 + self.instance_end_port()
-            out += ONETAB + self.end_component()
-        return out
+            writer.trim(2)
+            writer.write("\n")
+            writer.write(self.instance_end_port(), tabs=2)
+            writer.write(self.end_component(), tabs=1)
 
     def declare_signal(self, instancename, port):
         """ return signals declaration
         """
         raise NotImplementedError("method must be implemented", 0)
 
-    def declare_signals(self, componentslist, incomplete_external_ports_list):
+    def declare_signals(self, writer, componentslist,
+                        incomplete_external_ports_list):
         """ Declare signals ports
         """
         platformname = self.project.platform.instancename
 
-        out = self.insert_comment_block(ONETAB, "Signals declaration")
+        writer.write(self.insert_comment_block(ONETAB, "Signals declaration"))
         for component in componentslist:
             if component.is_platform() is True:
                 continue
-            out += "\n" + ONETAB + self.insert_comment(component.instancename)
+            writer.write("\n" + ONETAB +
+                         self.insert_comment(component.instancename))
             for interface in component.interfaces:
-                out += ONETAB + self.insert_comment(interface.name)
+                writer.write(self.insert_comment(interface.name), tabs=1)
 
                 for port in interface.ports:
                     if port.is_hidden:
@@ -313,28 +306,26 @@ class TopGen(object):
                     if connection_list[0]["instance_dest"] == platformname:
                         continue
                     instancename = component.instancename + "_" + port.name
-                    out += ONETAB + \
-                        self.declare_signal(instancename, port)
+                    writer.write(self.declare_signal(instancename, port),
+                                 tabs=1)
 
-        out += "\n" + ONETAB + self.insert_comment("void pins")
+        writer.write("\n" + ONETAB + self.insert_comment("void pins"))
 
         for port in incomplete_external_ports_list:
             if port.force_defined():
                 continue
-            out += "\n" + ONETAB + \
-                self.declare_signal(port.parent.parent.instancename + "_" +
-                                    port.name, port)
-        return out
+            writer.write("\n" + ONETAB +
+                         self.declare_signal(port.parent.parent.instancename +
+                                             "_" + port.name, port))
 
-    def declare_instance(self):
-        """ return instance declaration
+    def declare_instance(self, writer):
+        """ write instance declaration
         """
         raise NotImplementedError("method must be implemented", 0)
 
-    def connect_in_port(self, component, interface, port):
+    def connect_in_port(self, writer, component, interface, port):
         """ Connect all pins port"""
         platformname = self.project.platform.instancename
-        out = ""
         if len(port.pins) != 0:
             if port.dest_port is not None and\
                     (port.dest_port.size == port.size):
@@ -342,11 +333,12 @@ class TopGen(object):
                 # and only one other port
                 connect = port.pins[0].connections[0]
                 if connect["instance_dest"] != platformname:
-                    out += ONETAB * 2 + \
+                    writer.write(
                         self.connect_ports(component.instancename +
                                            "_" + port.name,
                                            connect["instance_dest"] +
-                                           "_" + connect["port_dest"])
+                                           "_" + connect["port_dest"]),
+                        tabs=2)
             else:
                 # If pins port are connected individualy
                 # to several other ports
@@ -355,8 +347,9 @@ class TopGen(object):
                     if pin.num is not None and len(pin.connections) != 0:
                         connect = pin.connections[0]
                         if connect["instance_dest"] != platformname:
-                            out += ONETAB * 2 + \
-                                self.instance_inc_sig(component, connect, pin)
+                            writer.write(
+                                self.instance_inc_sig(component, connect, pin),
+                                tabs=2)
         # if port is void, connect '0' or open
         else:
             message = "port " + component.instancename + \
@@ -365,17 +358,16 @@ class TopGen(object):
                 " It will be set to '" + \
                 str(port.unconnected_value) + "'"
             DISPLAY.msg(message, 2)
-        return out
 
     @classmethod
     def instance_add_port(cls, portname, sig_name):
         """ return port connection """
 
-    def instance_port_part(self, indent, component):
+    def instance_port_part(self, writer, indent, component):
         """ Declare instance signals ports """
-        out = ""
+        start = writer.position
         for interface in component.interfaces:
-            out += indent + self.insert_comment(interface.name)
+            writer.write(indent + self.insert_comment(interface.name))
             for port in interface.ports:
                 if port.is_hidden:
                     continue
@@ -389,40 +381,40 @@ class TopGen(object):
                                  port.ports_with_same_connection])[0]
                         except IndexError:
                             raise PodError("{} port {} has no connection"
-                                          .format(port.direction, port.name))
+                                           .format(port.direction, port.name))
                     else:
                         destname = port.extended_name
-                    out += indent + \
-                        self.instance_add_port(port.name, destname)
+                    writer.write(indent +
+                                 self.instance_add_port(port.name, destname))
 
                 else:
-                    out += 3 * ONETAB + self.instance_add_unc_port(port)
+                    writer.write(self.instance_add_unc_port(port), tabs=3)
 
         # Suppress the #!@ last comma
-        out = out[:-2] + "\n"
-        return out
+        writer.trim(2, start)
+        writer.write("\n")
 
-    def connect_forces(self, portlist):
+    def connect_forces(self, writer, portlist):
         """ Connecting Forces """
 
-        out = "\n"
-        out += self.insert_comment_block(ONETAB, "Set forces")
+        writer.write("\n")
+        writer.write(self.insert_comment_block(ONETAB, "Set forces"))
         for port in portlist:
             if port.is_hidden:
                 continue
             if port.force_defined():
                 if port.force == "gnd":
-                    out += ONETAB + \
-                        self.connect_ports("force_" + port.name, 0)
+                    writer.write(self.connect_ports("force_" + port.name, 0),
+                                 tabs=1)
                 else:
-                    out += ONETAB + \
-                        self.connect_ports("force_" + port.name, 1)
-        return out
+                    writer.write(self.connect_ports("force_" + port.name, 1),
+                                 tabs=1)
 
-    def connect_instance(self, incomplete_external_ports_list):
+    def connect_instance(self, writer, incomplete_external_ports_list):
         """ Connect instances
         """
-        out = self.insert_comment_block(ONETAB, "instances connections")
+        writer.write(self.insert_comment_block(ONETAB,
+                                               "instances connections"))
 
         # connect incomplete_external_ports_list
         for port in incomplete_external_ports_list:
@@ -430,33 +422,95 @@ class TopGen(object):
                 continue
             if not port.force_defined():
                 instancename = port.parent.parent.instancename
-                out += ONETAB + \
-                    self.insert_comment("connect incomplete " +
-                                        "external port " +
-                                        str(port.name) + " pins")
+                writer.write(self.insert_comment("connect incomplete " +
+                                                 "external port " +
+                                                 str(port.name) + " pins"),
+                             tabs=1)
                 for pinnum in range(port.real_size):
                     pin = port.get_pin(pinnum)
                     if pin.is_connected_to_inst(self.project.platform):
                         basename = instancename + "_" + port.name
-                        out += ONETAB + \
+                        writer.write(
                             self.connect_inc_signals(basename, basename,
-                                                     port.direction, pinnum)
+                                                     port.direction, pinnum),
+                            tabs=1)
 
         # connect all "in" ports pin
         for component in self.project.instances:
             if component.is_platform():
                 continue
-            out += "\n" + ONETAB + self.insert_comment("connect " +
-                                                       component.instancename)
+            writer.write("\n" + ONETAB +
+                         self.insert_comment("connect " +
+                                             component.instancename))
             for interface in component.interfaces:
-                out += ONETAB * 2 + self.insert_comment(interface.name)
+                writer.write(self.insert_comment(interface.name), tabs=2)
                 for port in interface.ports:
                     if port.direction == "in":
-                        out += self.connect_in_port(component, interface, port)
-        return out
+                        self.connect_in_port(writer, component,
+                                             interface, port)
+
+    @property
+    def filename(self):
+        """ return top file name """
+        return self.project.projectpath + SYNTHESISPATH +\
+            "/top_" + self.project.name + VHDLEXT
+
+    @property
+    def fingerprint_filename(self):
+        """ return file name of last generated top fingerprint """
+        return self.project.projectpath + OBJSPATH + TOPFINGERPRINTFILE
+
+    def fingerprint(self):
+        """ return a digest of everything top generation reads,
+            except the date written in header
+        """
+        digest = hashlib.sha1()
+
+        def add(*values):
+            """ add values to digest """
+            digest.update((repr(values) + "\n").encode("utf-8"))
 
-    def generate(self):
-        """ generate code for top component
+        with open(self.header_template_name(), "r") as afile:
+            header = afile.read()
+        add(header, SETTINGS.author, self.project.name,
+            self.project.description, self.project.vhdl_version,
+            self.file_extension())
+        for component in self.project.instances:
+            add("instance", component.instancename, component.name,
+                component.is_platform())
+            for generic in component.fpga_generics:
+                add("generic", generic.name, generic.generictype,
+                    generic.value)
+            for interface in component.interfaces:
+                add("interface", interface.name)
+                for port in interface.ports:
+                    add("port", port.name, port.direction, port.size,
+                        port.is_hidden, port.force, port.unconnected_value)
+                    # generation adds unconnected pins to ports, they
+                    # are left out
+                    for pin in port.pins:
+                        if not pin.connections:
+                            continue
+                        add("pin", pin.num,
+                            [sorted(connection.items())
+                             for connection in pin.connections])
+        return digest.hexdigest()
+
+    def is_up_to_date(self, fingerprint):
+        """ True if top file was generated with fingerprint """
+        if not sy.file_exist(self.filename):
+            return False
+        try:
+            with open(self.fingerprint_filename, "r") as afile:
+                return afile.read().strip() == fingerprint
+        except IOError:
+            return False
+
+    def generate(self, force=False):
+        """ generate code for top component, the file is written
+            while code is generated. Generation is skipped if nothing
+            used changed since last one, unless force is True.
+            Return False if generation was skipped
         """
         # checking if all intercons are done
         for masterinterface in self.project.interfaces_master:
@@ -472,23 +526,24 @@ class TopGen(object):
                                    " generated before generate top.\n" +
                                    str(error))
 
-        # header
-        out = self.header()
-        # entity
-        entityname = "top_" + self.project.name
-        portlist = self.project.platform.connect_ports
-        out += self.entity(entityname, portlist)
-
-        # architecture
-        incompleteportslist = self.project.platform.incomplete_ext_ports
-        out += self.architecture(entityname, portlist, incompleteportslist)
-
-        # save file
-        try:
-            top_file = open(self.project.projectpath + SYNTHESISPATH +
-                            "/top_" + self.project.name + VHDLEXT, "w")
-        except IOError as error:
-            raise error
-        top_file.write(out)
-        top_file.close()
-        return out
+        fingerprint = self.fingerprint()
+        if not force and self.is_up_to_date(fingerprint):
+            return False
+
+        with CodeWriter(self.filename) as writer:
+            # header
+            writer.write(self.header())
+            # entity
+            entityname = "top_" + self.project.name
+            portlist = self.project.platform.connect_ports
+            self.entity(writer, entityname, portlist)
+
+            # architecture
+            incompleteportslist = self.project.platform.incomplete_ext_ports
+            self.architecture(writer, entityname, portlist,
+                              incompleteportslist)
+
+        if sy.dir_exist(os.path.dirname(self.fingerprint_filename)):
+            with open(self.fingerprint_filename, "w") as afile:
+                afile.write(fingerprint + "\n")
+        return True
@@ -198,56 +198,56 @@ class TopVHDL(TopGen):
     def instance_end_port(cls):
         return ");\n"
 
-    def entity(self, entityname, portlist):
-        """ return code for Top entity
+    def entity(self, writer, entityname, portlist):
+        """ write code for Top entity
         """
-        out = "entity " + entityname + " is\n"
-        out += "\n" + ONETAB + "port\n" + ONETAB + "(\n"
-        out += self.entity_port_part(portlist)
+        writer.write("entity " + entityname + " is\n")
+        writer.write("\n" + ONETAB + "port\n" + ONETAB + "(\n")
+        self.entity_port_part(writer, portlist)
 
-        out += "\n" + ONETAB + ");\nend entity " + entityname + ";\n\n"
-        return out
+        writer.write("\n" + ONETAB + ");\nend entity " + entityname + ";\n\n")
 
-    def declare_instance(self):
+    def declare_instance(self, writer):
         """ Declaring instances """
-        out = self.insert_comment_block(ONETAB, "declare instances")
+        writer.write(self.insert_comment_block(ONETAB, "declare instances"))
         for component in self.project.instances:
             if component.is_platform() is False:
-                out += "\n" + ONETAB + component.instancename + " : "
+                writer.write("\n" + ONETAB + component.instancename + " : ")
                 if self.project.vhdl_version == "vhdl93":
-                    out += "entity work."
-                out += component.name + "\n"
+                    writer.write("entity work.")
+                writer.write(component.name + "\n")
                 if component.fpga_generics != []:
-                    out += ONETAB + "generic map (\n"
+                    writer.write("generic map (\n", tabs=1)
                     for generic in component.fpga_generics:
-                        out += ONETAB * 3 + generic.name + " => " + \
-                            str(generic.value) + ",\n"
+                        writer.write(generic.name + " => " +
+                                     str(generic.value) + ",\n", tabs=3)
                     # suppress comma
-                    out = out[:-2] + "\n"
-                    out += ONETAB * 2 + ")\n"
-
-                out += ONETAB + "port map (\n"
-                out += self.instance_port_part(ONETAB * 3, component)
-                out += ONETAB * 3 + ");\n"
-        out += "\n"
-        return out
-
-    def architecture(self, entityname, portlist, incompleteportslist):
-        """ construct architecture part of the file """
-        out = "architecture " + entityname + "_1 of " + entityname + " is\n"
+                    writer.trim(2)
+                    writer.write("\n")
+                    writer.write(")\n", tabs=2)
+
+                writer.write("port map (\n", tabs=1)
+                self.instance_port_part(writer, ONETAB * 3, component)
+                writer.write(");\n", tabs=3)
+        writer.write("\n")
+
+    def architecture(self, writer, entityname, portlist,
+                     incompleteportslist):
+        """ write architecture part of the file """
+        writer.write("architecture " + entityname + "_1 of " +
+                     entityname + " is\n")
         # declare components
-        out += self.declare_components()
+        self.declare_components(writer)
         # declare signals
-        out += self.declare_signals(self.project.instances,
-                                    incompleteportslist)
+        self.declare_signals(writer, self.project.instances,
+                             incompleteportslist)
         # begin
-        out += "\nbegin\n"
+        writer.write("\nbegin\n")
         # Connect forces
-        out += self.connect_forces(portlist)
+        self.connect_forces(writer, portlist)
         # declare Instance
-        out += self.declare_instance()
+        self.declare_instance(writer)
         # instance connection
-        out += self.connect_instance(incompleteportslist)
+        self.connect_instance(writer, incompleteportslist)
         # architecture foot
-        out += "\nend architecture " + entityname + "_1;\n"
-        return out
+        writer.write("\nend architecture " + entityname + "_1;\n")
@@ -68,7 +68,7 @@ generate a project drivers directory with templates
             self.driver.fill_all_templates()
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -82,7 +82,7 @@ fill drivers templates
             self.driver.fill_all_templates()
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -97,7 +97,7 @@ directory must be selected with setprojecttree
             self.driver.copy_bsp_drivers()
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -123,7 +123,7 @@ select software developpement tree, to copy driver
             self.driver.set_bsp_directory(line)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -145,7 +145,7 @@ select operating system to generate drivers
             self.checkargs(line, "[drivertoolchain]")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         if line.strip() == "":
             if len(self._project.get_driver_toolchains()) == 1:
@@ -162,6 +162,6 @@ select operating system to generate drivers
             try:
                 self._project.driver_toolchain = line
             except PodError as error:
-                print(error)
+                self.print_error(error)
                 return
         self.driver = self._project.driver
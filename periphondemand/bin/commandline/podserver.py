@@ -0,0 +1,236 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     podserver.py
+# Purpose:  POD daemon running commands received on a Unix socket
+#
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+#
+# Created:  18/10/2026
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" POD daemon.
+
+    Projects and libraries stay loaded between requests. A request is one
+    json line {"cwd": directory, "lines": commands, "color": 0/1,
+    "timings": bool, "stop": bool}, the answer is a stream of json lines
+    {"out": text} ended by {"status": value}.
+
+    Projects are kept by xml file name, the project opened from a
+    directory is found again by the next requests sent from it, and
+    directories opening the same xml file share one project. A project is
+    read again when its xml file, or the xml file of an instance it has
+    parsed, was changed by another program since the last request.
+    Requests are run one after the other, lines of a request are run like
+    a batch script and the project is saved once at the end of request.
+    The answer status is 1 if a command failed.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import traceback
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.utils.settings import Settings
+from periphondemand.bin.utils.dirindex import INDEX
+from periphondemand.bin.define import XMLEXT
+from periphondemand.bin.core.project import Project
+
+from periphondemand.bin.commandline.projectcli import ProjectCli
+from periphondemand.bin.commandline.scriptrunner import ScriptRunner
+
+SETTINGS = Settings()
+
+
+class StreamWriter(object):
+    """ File like object sending written text to the client """
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def write(self, text):
+        """ send text as an out message """
+        if text:
+            self.send({"out": text})
+        return len(text)
+
+    def flush(self):
+        """ messages are sent when written """
+        pass
+
+    def send(self, message):
+        """ send one json message """
+        self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+
+class PodRequestHandler(socketserver.StreamRequestHandler):
+    """ Run one request of a client """
+
+    def handle(self):
+        writer = StreamWriter(self.wfile)
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8"))
+        except ValueError:
+            writer.send({"out": str(PodError("Wrong request")) + "\n"})
+            writer.send({"status": 2})
+            return
+        try:
+            status = self.server.run_request(request, writer)
+        except BrokenPipeError:
+            # client left, nothing to answer
+            return
+        writer.send({"status": status})
+
+
+class PodServer(socketserver.UnixStreamServer):
+    """ POD daemon
+        attributes:
+            cli         -- ProjectCli running requests
+            projects    -- [project, xml files stamps] of each xml file name
+            directories -- project xml file name of each client working
+                           directory
+            stopped     -- True when a client asked to stop the daemon
+    """
+
+    def __init__(self, filename):
+        self.filename = os.path.expanduser(filename)
+        if os.path.exists(self.filename):
+            if self.is_running(self.filename):
+                raise PodError("POD daemon already running on " +
+                               self.filename, 0)
+            os.remove(self.filename)
+        # socket is created for user only, no other user can connect
+        # before permissions are set
+        umask = os.umask(0o177)
+        try:
+            socketserver.UnixStreamServer.__init__(self, self.filename,
+                                                   PodRequestHandler)
+        finally:
+            os.umask(umask)
+        os.chmod(self.filename, 0o600)
+        self.cli = ProjectCli()
+        self.projects = {}
+        self.directories = {}
+        self.stopped = False
+
+    @classmethod
+    def is_running(cls, filename):
+        """ True if a daemon answers on socket filename """
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client.connect(filename)
+        except OSError:
+            return False
+        finally:
+            client.close()
+        return True
+
+    def serve(self):
+        """ Run requests until a client stops the daemon """
+        print("POD daemon listening on " + self.filename)
+        try:
+            while not self.stopped:
+                self.handle_request()
+        finally:
+            self.server_close()
+            os.remove(self.filename)
+
+    @classmethod
+    def stamp(cls, filename):
+        """ modification time of filename, None if it can't be read """
+        try:
+            return os.stat(filename).st_mtime_ns
+        except OSError:
+            return None
+
+    @classmethod
+    def stamps(cls, project, filename):
+        """ modification times of project xml file filename and of its
+            instances xml files already parsed, files not parsed yet are
+            read when used """
+        filenames = [filename]
+        for instance in project.instances:
+            if instance.is_loaded:
+                filenames.append(
+                    project.instance_filename(instance.instancename))
+        return dict([(name, cls.stamp(name)) for name in filenames])
+
+    def get_project(self, cwd):
+        """ Get the project of working directory cwd, project is read
+            again if one of its xml files changed since the last request
+        """
+        filename = self.directories.get(cwd)
+        if filename is None:
+            return None
+        project, stamps = self.projects[filename]
+        for name, stamp in stamps.items():
+            if self.stamp(name) not in (stamp, None):
+                print("Project " + project.name + " changed, read again")
+                project = Project(filename)
+                self.projects[filename] = [project,
+                                           self.stamps(project, filename)]
+                break
+        return project
+
+    def keep_project(self, cwd, project):
+        """ Keep project opened by a request sent from cwd """
+        if project is None or project.void:
+            self.directories.pop(cwd, None)
+        else:
+            filename = os.path.abspath(project.projectpath + "/" +
+                                       project.name + XMLEXT)
+            self.projects[filename] = [project,
+                                       self.stamps(project, filename)]
+            self.directories[cwd] = filename
+        # forget projects no more used by a directory
+        for filename in list(self.projects):
+            if filename not in self.directories.values():
+                del self.projects[filename]
+
+    def run_request(self, request, writer):
+        """ Run commands of request, output is written in writer,
+            return exit status """
+        if request.get("stop"):
+            self.stopped = True
+            writer.write("POD daemon stopped\n")
+            return 0
+        cwd = request.get("cwd", os.getcwd())
+        try:
+            os.chdir(cwd)
+        except OSError as error:
+            writer.write(str(PodError(str(error))) + "\n")
+            return 2
+        cli = self.cli
+        runner = ScriptRunner(cli)
+        stdout = sys.stdout
+        color = SETTINGS.color_status
+        sys.stdout = cli.stdout = writer
+        SETTINGS.projectpath = cwd
+        SETTINGS.color_status = request.get("color", 0)
+        try:
+            cli.project = self.get_project(cwd)
+            runner.parse_lines(request.get("lines", []), "request")
+            runner.run()
+            if request.get("timings"):
+                writer.write(runner.report())
+        except PodError as error:
+            print(error)
+            return 1
+        except BrokenPipeError:
+            raise
+        except Exception:
+            # keep daemon alive, the error is for the client
+            writer.write(traceback.format_exc())
+            return 2
+        finally:
+            self.keep_project(cwd, cli.project)
+            cli.project = None
+            sys.stdout = cli.stdout = stdout
+            SETTINGS.color_status = color
+            # daemon could be killed before exit
+            INDEX.save()
+        return runner.status
@@ -33,6 +33,7 @@ from periphondemand.bin.define import XMLEXT
 from periphondemand.bin.define import PODSCRIPTEXT
 
 from periphondemand.bin.utils import wrappersystem as sy
+from periphondemand.bin.utils import xmlbackend
 from periphondemand.bin.utils.display import Display
 
 from periphondemand.bin.commandline.synthesiscli import SynthesisCli
@@ -59,6 +60,16 @@ class ProjectCli(BaseCli):
         BaseCli.__init__(self, parent)
         self._project = None
 
+    @property
+    def project(self):
+        """ project opened, None if there is none """
+        return self._project
+
+    @project.setter
+    def project(self, project):
+        """ open project """
+        self._project = project
+
     def do_synthesis(self, arg):
         """\
 Usage : synthesis
@@ -68,7 +79,7 @@ synthesis commands
             self.is_project_open()
             self.isPlatformSelected()
         except PodError as error:
-            print(error)
+            self.print_error(error)
             return
 
         cli = SynthesisCli(self, self._project)
@@ -91,7 +102,7 @@ Simulation generation environment
             self.is_project_open()
             self.isPlatformSelected()
         except PodError as error:
-            print(error)
+            self.print_error(error)
             return
 
         # test if only one toolchain for simulation in library
@@ -115,7 +126,7 @@ Driver generation environment
             self.is_project_open()
             self.isPlatformSelected()
         except PodError as error:
-            print(error)
+            self.print_error(error)
             return
 
         # test if only one toolchain for simulation in library
@@ -138,12 +149,12 @@ create new project
         try:
             self.checkargs(line, "<projectname>")
         except PodError as error:
-            print(error)
+            self.print_error(error)
             return
         try:
             sy.check_name(line)
         except PodError as error:
-            print(error)
+            self.print_error(error)
             return 0
         dirname = os.path.abspath(line)
         if sy.dir_exist(dirname):
@@ -153,7 +164,7 @@ create new project
             try:
                 self._project = Project(dirname, void=0)
             except PodError as error:
-                print(error)
+                self.print_error(error)
                 return
 
         self.setPrompt("POD", self._project.name)
@@ -181,21 +192,23 @@ Load a project
         try:
             self.checkargs(line, "<projectfilename>.xml")
         except PodError as error:
-            print(error)
+            self.print_error(error)
             return
         if sy.dir_exist(line):
             head, projectname = os.path.split(line)
             line = os.path.join(head, projectname, projectname + ".xml")
         if not sy.file_exist(line):
-            print(PodError("File doesn't exists"))
+            self.print_error(PodError("File doesn't exists"))
             return
         try:
+            # instances are parsed on first use, base addresses are
+            # displayed by the first command using busses
             self._project = Project(line)
         except PodError as error:
-            print(error)
+            self.print_error(error)
             return
         except IOError as error:
-            print(error)
+            self.print_error(error)
             return
         self.setPrompt("POD:" + self._project.name)
         print(DISPLAY)
@@ -214,13 +227,13 @@ Setting speedgrade of FPGA
             self.checkargs(line, "<speedgrade>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         try:
             self._project.fpga_speed_grade = line
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -237,7 +250,7 @@ Print FPGA speed grade information
             speedgrade = self._project.fpga_speed_grade
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print("FPGA speed grade : " + speedgrade)
 
@@ -255,13 +268,13 @@ Setting FPGA device
             self.checkargs(line, "<fpgatype>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         try:
             self._project.fpga_device = line
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -279,13 +292,13 @@ Select VHDL version
             self.checkargs(line, "<vhdlversion>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         try:
             self._project.vhdl_version = line
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -302,7 +315,7 @@ Print FPGA device information
             fpgadevice = self._project.fpga_device
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print("FPGA model : " + fpgadevice)
 
@@ -320,7 +333,7 @@ Adding components library
             self.checkargs(line, "<componentslibpath>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         try:
             self._project.add_component_lib(line)
@@ -344,13 +357,13 @@ Adding platforms library
             self.checkargs(line, "<platformslibpath>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         try:
             self._project.add_platforms_lib(line)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -383,7 +396,7 @@ Add component in project
                 "[newinstancename]")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         arg = line.split(' ')
         subarg = arg[0].split(".")
@@ -420,7 +433,7 @@ Add component in project
                     instancename=instancename)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -462,7 +475,7 @@ List all project instances
         try:
             self.is_project_open()
         except PodError as error:
-            print(error)
+            self.print_error(error)
             return
         return self.columnize(self.listinstances())
 
@@ -485,7 +498,7 @@ Select the platform to use
             self.is_project_open()
             self.checkargs(line, "<platformlib>.<platformname>")
         except PodError as error:
-            print(error)
+            self.print_error(error)
             return
         try:
             args = line.strip().split(".")
@@ -493,7 +506,7 @@ Select the platform to use
             self._project.save()
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -505,13 +518,13 @@ List platform available
         try:
             self.is_project_open()
         except PodError as error:
-            print(error)
+            self.print_error(error)
             return
         try:
             return self.columnize(
                 self._project.availables_plat())
         except AttributeError as error:
-            print(error)
+            self.print_error(error)
 
     def complete_listinterfaces(self, text, line, begidx, endidx):
         """ complete listinterfaces command """
@@ -537,7 +550,7 @@ List instance interface
                         line).interfaces]
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
         return self.columnize(interfacelist)
@@ -570,7 +583,7 @@ Connect pin between instances
                 "<instancename>.<interfacename>.<portname>.[pinnum]")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         arg = line.split(' ')
         source = arg[0].split('.')
@@ -590,7 +603,7 @@ Connect pin between instances
                         dest[1]).get_port(dest[2]).get_pin(dest[3]))
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -618,7 +631,7 @@ Force input port unconnected value
                 "<instancename>.<interfacename>.<portname> <uvalue>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         arg = line.split(' ')
         source = arg[0].split('.')
@@ -637,7 +650,7 @@ Force input port unconnected value
             self._project.set_unconnected_value(portdict, uvalue)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -668,7 +681,7 @@ Connect all pins of two same size ports.
                 "<instancename>.<interfacename>.<portname>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         arg = line.split(' ')
         source = arg[0].split('.')
@@ -688,7 +701,7 @@ Connect all pins of two same size ports.
                  "port": dest[2]})
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -718,7 +731,7 @@ Connect interface between two components
                            "<instancename>.<interfacename>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         arg = line.split(' ')
         source = arg[0].split('.')
@@ -734,7 +747,7 @@ Connect interface between two components
             print("<<interface " + source[1] +
                   " and interface " + dest[1] + " are not compatible>>")
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -767,7 +780,7 @@ Suppress a pin connection
                 "<slaveinstancename>.<slaveinterfacename>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         arg = line.split(' ')
         source = arg[0].split('.')
@@ -781,7 +794,7 @@ Suppress a pin connection
             self._project.del_bus(masterdict, slavedict)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -813,7 +826,7 @@ Connect slave to master bus
                 "<slaveinstancename>.<slaveinterfacename>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         arg = line.split(' ')
         source = arg[0].split('.')
@@ -827,7 +840,7 @@ Connect slave to master bus
             self._project.connect_bus(masterdict, slavedict)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -841,7 +854,7 @@ Autoconnect bus if only one master in project
             self._project.auto_connect_busses()
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -875,7 +888,7 @@ Suppress a pin connection
                 "[instancename].[interfacename].[portname].[pinnum]")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         # get arguments
         arg = line.split(' ')
@@ -901,7 +914,7 @@ Suppress a pin connection
                  "port": dest[2], "num": dest[3]})
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
         print("Connection deleted")
@@ -925,13 +938,13 @@ Suppress a component from project
             self.checkargs(line, "<instancename>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         try:
             self._project.del_instance(line)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -942,11 +955,33 @@ Check the project before code generation
         """
         try:
             self.is_project_open()
-            self._project.check()
+            report = self._project.check()
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
+            return
         print(DISPLAY)
+        if report:
+            print("Check found " + str(len(report)) + " problem(s):")
+            for problem in report:
+                print("  " + self.check_problem_str(problem))
+        else:
+            print("Check passed")
+
+    @classmethod
+    def check_problem_str(cls, problem):
+        """ Get a one line description of a problem of check report """
+        if problem["type"] == "unconnected":
+            return problem["instance"] + "." + problem["interface"] +\
+                " is not connected on a master bus"
+        if problem["type"] == "window_overlap":
+            return problem["master"] + ": " +\
+                " and ".join(problem["slaves"]) + " overlap at " +\
+                hex(problem["address"]) + " on " +\
+                hex(problem["size"]) + " bytes"
+        return problem["master"] + ": " +\
+            " and ".join(problem["registers"]) + " share address " +\
+            hex(problem["address"])
 
     def complete_setaddr(self, text, line, begidx, endidx):
         """ setaddr command completion """
@@ -973,7 +1008,7 @@ Set the base address of slave interface
                 "<slaveinstancename>.<slaveinterfacename> <addressinhexa>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         arg = line.split(' ')
         names = arg[0].split('.')
@@ -994,7 +1029,7 @@ Set the base address of slave interface
             interfacemaster.alloc_mem.set_slave_addr(interfaceslave, arg[1])
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
         print("Base address " + arg[1] + " set")
@@ -1008,7 +1043,7 @@ List master interface
             self.is_project_open()
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         for master in self._project.interfaces_master:
             print(master.parent.instancename + "." + master.name)
@@ -1035,7 +1070,7 @@ Return mapping for a master interface
             self.checkargs(line, "<masterinstancename>.<masterinterfacename>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         arg = line.split(' ')
         names = arg[0].split('.')
@@ -1046,7 +1081,88 @@ Return mapping for a master interface
             print(str(masterinterface.alloc_mem))
         except PodError as error:
             print(DISPLAY)
+            self.print_error(error)
+        print(DISPLAY)
+
+    def complete_setalloc(self, text, line, begidx, endidx):
+        """ complete setalloc command """
+        strategylist = []
+        try:
+            strategylist = self.completeargs(
+                text, line,
+                "<masterinstancename>.<masterinterfacename> <allocstrategy>")
+        except PodError as error:
+            print(error)
+        return strategylist
+
+    def do_setalloc(self, line=None):
+        """\
+Usage : setalloc <masterinstancename>.<masterinterfacename> <allocstrategy>
+Set how base addresses are given to new slaves of a master interface:
+append     : after the slave with the highest address (default)
+first_fit  : in the lowest hole large enough
+best_fit   : in the smallest hole large enough
+compact    : all slaves are packed again, largest first, when a new
+             slave is connected or with repack command
+        """
+        try:
+            self.is_project_open()
+            self.checkargs(line, "<masterinstancename>.<masterinterfacename>" +
+                           " <allocstrategy>")
+        except PodError as error:
+            print(DISPLAY)
+            self.print_error(error)
+            return
+        arg = line.split(' ')
+        names = arg[0].split('.')
+        try:
+            masterinterface =\
+                self._project.get_instance(
+                    names[0]).get_interface(names[1])
+            masterinterface.alloc_mem.strategy = arg[1]
+            self._project.save()
+        except (PodError, AttributeError) as error:
+            print(DISPLAY)
+            self.print_error(error)
+            return
+        print(DISPLAY)
+        print("Allocation strategy " + arg[1] + " set")
+
+    def complete_repack(self, text, line, begidx, endidx):
+        """ complete repack command """
+        masterlist = []
+        try:
+            masterlist = self.completeargs(
+                text, line,
+                "<masterinstancename>.<masterinterfacename>")
+        except PodError as error:
             print(error)
+        return masterlist
+
+    def do_repack(self, line=None):
+        """\
+Usage : repack <masterinstancename>.<masterinterfacename>
+Set base addresses of all slaves of a master interface again without
+holes, largest slaves first
+        """
+        try:
+            self.is_project_open()
+            self.checkargs(line, "<masterinstancename>.<masterinterfacename>")
+        except PodError as error:
+            print(DISPLAY)
+            self.print_error(error)
+            return
+        names = line.split('.')
+        try:
+            masterinterface =\
+                self._project.get_instance(
+                    names[0]).get_interface(names[1])
+            masterinterface.alloc_mem.repack()
+            self._project.save()
+        except (PodError, AttributeError) as error:
+            print(DISPLAY)
+            self.print_error(error)
+            return
         print(DISPLAY)
 
     def complete_printxml(self, text, line, begidx, endidx):
@@ -1068,7 +1184,7 @@ Print instance in XML format
             self.checkargs(line, "<instancename>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(self._project.get_instance(line))
         print(DISPLAY)
@@ -1093,7 +1209,7 @@ Print instance information
             instance = self._project.get_instance(line)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print("Instance name :" + instance.instancename)
         print("Component  name :" + instance.name)
@@ -1157,7 +1273,7 @@ Set generic parameter
                            "<instancename>.<genericname> <genericvalue>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         args = line.split(" ")
         names = args[0].split(".")
@@ -1170,7 +1286,7 @@ Set generic parameter
                 raise PodError("this generic can't be modified by user", 0)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
         print("Done")
@@ -1194,12 +1310,70 @@ Close the project
             self.is_project_open()
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
+            return
+        try:
+            self.commit_batches()
+        except PodError as error:
+            print(DISPLAY)
+            self.print_error(error)
             return
         self._project = None
         print(DISPLAY)
         print("Project closed")
 
+    def do_quit(self, arg):
+        """\
+Usage : quit
+Exits from the command line interpreter, batch left open is committed
+        """
+        try:
+            self.commit_batches()
+        except PodError as error:
+            print(DISPLAY)
+            self.print_error(error)
+            return
+        return True
+
+    do_exit = do_quit
+
+    def do_EOF(self, args):
+        """Exit on system end of file character.\n"""
+        # end of a sourced script, batch may be committed by next commands
+        if SETTINGS.is_script():
+            return True
+        return self.do_quit(args)
+
+    do_eof = do_EOF
+
+    def do_begin(self, line):
+        """\
+Usage : begin
+Begin a batch of commands, project is saved only once at commit
+        """
+        try:
+            self.is_project_open()
+        except PodError as error:
+            self.print_error(error)
+            return
+        self._project.begin_batch()
+        print("Batch begun")
+
+    def do_commit(self, line):
+        """\
+Usage : commit
+End a batch of commands and save the project
+        """
+        try:
+            self.is_project_open()
+            self._project.commit_batch()
+        except PodError as error:
+            print(DISPLAY)
+            self.print_error(error)
+            return
+        print(DISPLAY)
+        print("Batch committed")
+
     # Generate CODE
     def complete_generateintercon(self, text, line, begidx, endidx):
         """ generateintercon command completion """
@@ -1216,13 +1390,18 @@ Close the project
     def do_generateintercon(self, line=None):
         """\
 Usage : generateintercon <masterinstancename>.<masterinterfacename>
-Generate intercon for master given in argument
+        generateintercon --all
+Generate intercon for master given in argument, or for all masters
         """
         try:
             self.is_project_open()
+            if line.strip() == "--all":
+                self._project.generate_intercons()
+                print(DISPLAY)
+                return
             self.checkargs(line, "<instancename>.<masterinterfacename>")
         except PodError as error:
-            print(error)
+            self.print_error(error)
             return
         arg = line.split(' ')
         names = arg[0].split('.')
@@ -1233,26 +1412,38 @@ Generate intercon for master given in argument
             interfacedict = {"instance": names[0], "interface": names[1]}
             self._project.generate_intercon(interfacedict)
         except PodError as error:
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
     def do_generatetop(self, line):
         """\
-Usage : generatetop
-Generate top component
+Usage : generatetop [force]
+Generate top component, if nothing changed since last generation
+top is generated again only with force
         """
         try:
             self.is_project_open()
+            self.checkargs(line, "[force]")
+            if line.strip() not in ["", "force"]:
+                raise PodError("Unknown argument " + line.strip(), 0)
+        except PodError as error:
+            self.print_error(error)
+            return
+        try:
             self._project.check()
             top = TopVHDL(self._project)
-            top.generate()
+            generated = top.generate(force=(line.strip() == "force"))
         except PodError as error:
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
-        print("Top generated with name : top_" +
-              self._project.name + ".vhd")
+        if generated:
+            print("Top generated with name : top_" +
+                  self._project.name + ".vhd")
+        else:
+            print("Top top_" + self._project.name +
+                  ".vhd is up to date")
 
     def do_report(self, line):
         """\
@@ -1264,7 +1455,7 @@ Generate a report of the project
             text = self._project.generate_report()
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
         print("report : ")
@@ -1287,7 +1478,7 @@ List all force configured for this project
                       " is forced to " + port.force)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
 
     def complete_setforce(self, text, line, begidx, endidx):
@@ -1310,7 +1501,7 @@ Set fpga pin state in 'gnd', 'vcc'. To unset use 'undef' value
             self.checkargs(line, "<forcename> <forcestate>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
 
         arg = line.split(' ')
@@ -1321,11 +1512,10 @@ Set fpga pin state in 'gnd', 'vcc'. To unset use 'undef' value
             self._project.set_force(portname, state)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
 
-    @classmethod
-    def do_setcolor(cls, line):
+    def do_setcolor(self, line):
         """\
 Usage: setcolor [0/1]
 Set 1 if you want color output, 0 else
@@ -1337,8 +1527,37 @@ Set 1 if you want color output, 0 else
             SETTINGS.set_color(value)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
+            return
+
+    def do_setjobs(self, line):
+        """\
+Usage: setjobs <number>
+Set number of processes writing intercons code and drivers templates
+        """
+        try:
+            SETTINGS.set_jobs(line.strip())
+        except PodError as error:
+            print(DISPLAY)
+            self.print_error(error)
+            return
+
+    def do_setloadjobs(self, line):
+        """\
+Usage: setloadjobs <number>
+Set number of processes parsing instances files when a project is
+loaded. Files are parsed on first use when number is 1 or with lxml
+        """
+        try:
+            SETTINGS.set_load_jobs(line.strip())
+        except PodError as error:
+            print(DISPLAY)
+            self.print_error(error)
             return
+        if SETTINGS.load_jobs > 1 and xmlbackend.BACKEND == "lxml":
+            print(PodError("Load jobs are not used with lxml, files are " +
+                           "parsed on first use. Set POD_XML_BACKEND=etree " +
+                           "to parse them in processes", 1))
 
     def complete_source(self, text, line, begidx, endidx):
         """ complete load command with files under directory """
@@ -0,0 +1,200 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     scriptrunner.py
+# Purpose:  Run pod scripts without the interactive command loop
+#
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+#
+# Created:  18/10/2026
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" Headless runner of pod scripts.
+
+    The script is read and checked once before any command is run, then
+    commands are run in a batch of the opened project: the project is
+    saved when it is closed or replaced and at the end of the script,
+    not after each command. Only commands names are checked before
+    running, arguments are checked by the commands. Commands printing an
+    error are failed commands, the script goes on but its exit status is
+    not zero.
+"""
+
+import time
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.utils.settings import Settings
+
+from periphondemand.bin.commandline.projectcli import ProjectCli
+from periphondemand.bin.commandline.synthesiscli import SynthesisCli
+from periphondemand.bin.commandline.simulationcli import SimulationCli
+from periphondemand.bin.commandline.drivercli import DriverCli
+
+SETTINGS = Settings()
+
+# sub command line interfaces, key is ProjectCli command
+SUB_CLIS = {"synthesis": SynthesisCli,
+            "simulation": SimulationCli,
+            "driver": DriverCli}
+# commands ending the script
+STOP_COMMANDS = ["exit", "quit", "eof"]
+# commands closing or replacing the opened project
+RELEASE_COMMANDS = ["load", "create", "closeproject"]
+
+
+class ScriptRunner(object):
+    """ Run a pod script
+        attributes:
+            cli      -- ProjectCli running commands
+            commands -- list of (line number, command, line) of script
+            timings  -- list of (line, seconds) of commands run
+            failures -- list of (line number, line) of failed commands
+    """
+
+    def __init__(self, cli=None):
+        if cli is None:
+            cli = ProjectCli()
+        self.cli = cli
+        self.commands = []
+        self.timings = []
+        self.failures = []
+        self._project = None
+
+    def parse(self, filename):
+        """ Read script filename and check its commands, all errors are
+            raised in one PodError """
+        try:
+            with open(filename, "r") as script:
+                lines = script.readlines()
+        except IOError as error:
+            raise PodError(str(error), 0)
+        self.parse_lines(lines, filename)
+
+    def parse_lines(self, lines, name):
+        """ Check commands of lines, name is used in errors messages """
+        errors = []
+        self.commands = []
+        for number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line[0] in self.cli.comment_marks:
+                continue
+            command = self.command_of(line)
+            error = self.check(command, line)
+            if error is not None:
+                errors.append(name + ":" + str(number) + ": " + error)
+                continue
+            self.commands.append((number, command, line))
+            if command[0] in STOP_COMMANDS:
+                break
+        if errors:
+            raise PodError("\n".join(errors), 0)
+
+    def command_of(self, line):
+        """ Get (command, sub command) of line, sub command is None if
+            command has no sub command line interface """
+        shortcut = self.cli.shortcuts.get(line[0])
+        if shortcut is not None:
+            return (shortcut, None)
+        words = line.split(None, 1)
+        command = words[0]
+        args = words[1] if len(words) > 1 else ""
+        if "." in command:
+            command, subcommand = command.split(".", 1)
+        else:
+            subcommand = args.split(None, 1)[0] if args else None
+        if self.cli.case_insensitive:
+            command = command.lower()
+            if subcommand is not None:
+                subcommand = subcommand.lower()
+        if command not in SUB_CLIS:
+            subcommand = None
+        return (command, subcommand)
+
+    def check(self, command, line):
+        """ Return error message if line can't be run, else None.
+            Arguments are not checked, commands check them when run """
+        name, subname = command
+        if not hasattr(self.cli, "do_" + name):
+            return "Unknown command " + name
+        if name in SUB_CLIS and subname is None:
+            # sub command loop would read standard input
+            return "No " + name + " command given"
+        if subname is not None and\
+                not hasattr(SUB_CLIS[name], "do_" + subname):
+            return "Unknown " + name + " command " + subname
+        return None
+
+    def run(self):
+        """ Run parsed commands, return True if script ended on an exit
+            command """
+        self.timings = []
+        self.failures = []
+        stopped = False
+        SETTINGS.set_script(1)
+        try:
+            for number, command, line in self.commands:
+                if command[0] in STOP_COMMANDS:
+                    stopped = True
+                    break
+                if command[0] in RELEASE_COMMANDS:
+                    self.release()
+                start = time.perf_counter()
+                self.cli.failed = False
+                line = self.cli.precmd(line)
+                stop = self.cli.onecmd(line)
+                self.cli.postcmd(stop, line)
+                self.timings.append((line, time.perf_counter() - start))
+                if self.cli.failed:
+                    self.failures.append((number, line))
+                self.hold()
+        finally:
+            SETTINGS.set_script(0)
+            self.release()
+        return stopped
+
+    def hold(self):
+        """ Begin a batch on the project opened by last command """
+        project = self.cli.project
+        if project is not self._project:
+            self.release()
+            if project is not None:
+                project.begin_batch()
+                self._project = project
+
+    def release(self):
+        """ Commit the batch of the project and batches left open by
+            the script, project is saved """
+        project = self._project
+        self._project = None
+        if project is None or not project.in_batch:
+            return
+        start = time.perf_counter()
+        try:
+            while project.in_batch:
+                project.commit_batch()
+        except PodError as error:
+            print(error)
+            self.failures.append((None, "save " + project.name))
+        self.timings.append(("save " + project.name,
+                             time.perf_counter() - start))
+
+    @property
+    def status(self):
+        """ exit status of script, 1 if a command failed """
+        if self.failures:
+            return 1
+        return 0
+
+    def report(self):
+        """ Get commands timings report """
+        total = sum([seconds for _, seconds in self.timings])
+        out = "Commands timings:\n"
+        for line, seconds in self.timings:
+            out = out + "%10.3f ms  %s\n" % (seconds * 1000, line)
+        out = out + "%10.3f ms  total\n" % (total * 1000)
+        for number, line in self.failures:
+            if number is None:
+                out = out + "Failed: " + line + "\n"
+            else:
+                out = out + "Failed line " + str(number) + ": " + line + "\n"
+        return out
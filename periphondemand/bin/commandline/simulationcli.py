@@ -61,7 +61,7 @@ select toolchain used for simulation
         try:
             self.checkargs(line, "[simulationtoolchain]")
         except PodError as error:
-            print(str(error))
+            self.print_error(error)
             return
 
         if line.strip() == "":
@@ -80,7 +80,7 @@ select toolchain used for simulation
             try:
                 self._project.simulation_toolchain = line
             except PodError as error:
-                print(str(error))
+                self.print_error(error)
                 return
 
     def do_generateproject(self, line):
@@ -92,14 +92,15 @@ Make projects files for simulation (makefile and testbench sources)
             try:
                 self.do_selecttoolchain(line)
             except PodError as error:
-                print(str(error))
+                self.print_error(error)
                 return
         elif self._project.simulation is None:
-            print(PodError("Simulation toolchain must be selected before"))
+            self.print_error(
+                PodError("Simulation toolchain must be selected before"))
             return
 
         if self._project.simulation_toolchain is None:
-            print(PodError("Choose a toolchain before", 0))
+            self.print_error(PodError("Choose a toolchain before", 0))
             for toolchain in \
                     self._project.get_simulation_toolchains():
                 print(str(toolchain.name))
@@ -108,7 +109,7 @@ Make projects files for simulation (makefile and testbench sources)
             filename = self._project.simulation.generate_template()
             filename = self._project.simulation.generate_makefile()
         except PodError as error:
-            print(str(error))
+            self.print_error(error)
             return
         print(str(DISPLAY))
         print("Testbench with name : " + filename + " Done")
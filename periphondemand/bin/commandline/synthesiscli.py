@@ -64,7 +64,7 @@ select toolchain used for simulation
         try:
             self.checkargs(line, "[synthesistoolchain]")
         except PodError as error:
-            print(str(error))
+            self.print_error(error)
             return
 
         if line.strip() == "":
@@ -82,7 +82,7 @@ select toolchain used for simulation
             try:
                 self._project.synthesis_toolchain = line
             except PodError as error:
-                print(str(error))
+                self.print_error(error)
                 return
 
     def complete_generateproject(self, text, line, begidx, endidx):
@@ -105,17 +105,17 @@ generate the project for synthesis tool
         try:
             self.checkargs(line, "[synthesistoolchain]")
         except PodError as error:
-            print(str(error))
+            self.print_error(error)
             return
         # select toolchain
         if line.strip() != "":
             try:
                 self.do_selecttoolchain(line)
             except PodError as error:
-                print(str(error))
+                self.print_error(error)
                 return
         elif self._project.synthesis is None:
-            print(str(PodError("Toolchain must be selected before")))
+            self.print_error(PodError("Toolchain must be selected before"))
             return
 
         # generate project
@@ -126,10 +126,46 @@ generate the project for synthesis tool
             print(str(DISPLAY))
             self._project.synthesis.generate_tcl(None)
         except PodError as error:
-            print(str(error))
+            self.print_error(error)
             return
         print(str(DISPLAY))
 
+    def complete_setsyncmode(self, text, line, begidx, endidx):
+        """ setsyncmode command completion """
+        del begidx
+        del endidx
+        modelist = []
+        try:
+            modelist = self.completeargs(text, line, "<syncmode>")
+        except PodError as error:
+            print(str(error))
+        return modelist
+
+    def do_setsyncmode(self, line):
+        """\
+Usage : setsyncmode <syncmode>
+Set how generateproject put hdl files in synthesis directory:
+copy : delete components directories and copy all files
+sync : copy changed files only and delete stale files, only
+       components directories of earlier generateproject are deleted
+link : like sync, but hard link files instead of copying
+Mode is saved in project
+        """
+        try:
+            self.checkargs(line, "<syncmode>")
+        except PodError as error:
+            self.print_error(error)
+            return
+        if self._project.synthesis is None:
+            self.print_error(PodError("Select toolchain before"))
+            return
+        try:
+            self._project.synthesis.sync_mode = line.strip()
+            self._project.save()
+        except PodError as error:
+            self.print_error(error)
+            return
+
     def do_generatetcl(self, line):
         """\
 Usage : generatetcl [filename]
@@ -138,7 +174,7 @@ ise
         """
 
         if self._project.synthesis is None:
-            print(PodError("Select toolchain before"))
+            self.print_error(PodError("Select toolchain before"))
             return
         if line.strip() != "":
             filename = SETTINGS.path + TOOLCHAINPATH +\
@@ -148,7 +184,7 @@ ise
         try:
             self._project.synthesis.generate_tcl(filename)
         except PodError as error:
-            print(str(error))
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -159,7 +195,7 @@ generate ucf file, tool supported are :
 ise
         """
         if self._project.synthesis is None:
-            print(str(PodError("Select toolchain before")))
+            self.print_error(PodError("Select toolchain before"))
             return
         if line.strip() != "":
             filename = SETTINGS.path + TOOLCHAINPATH +\
@@ -169,7 +205,7 @@ ise
         try:
             self._project.synthesis.generate_pinout(filename)
         except PodError as error:
-            print(str(error))
+            self.print_error(error)
             return
         print(str(DISPLAY))
 
@@ -180,12 +216,12 @@ generate the bitstream for fpga configuration
         """
         del line
         if self._project.synthesis is None:
-            print(PodError("Select toolchain before"))
+            self.print_error(PodError("Select toolchain before"))
             return
         try:
             self._project.synthesis.generate_bitstream()
         except PodError as error:
-            print(str(error))
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -209,7 +245,7 @@ set IO standard value
             self.checkargs(line, "<IO_name> <standard_value>")
         except PodError as error:
             print(str(DISPLAY))
-            print(str(error))
+            self.print_error(error)
             return
         arg = line.split(' ')
         io_name = arg[0]
@@ -218,7 +254,7 @@ set IO standard value
             self._project.get_io(io_name).standard = standard_value
         except PodError as error:
             print(str(DISPLAY))
-            print(str(error))
+            self.print_error(error)
             return
 
     def complete_getiostandard(self, text, line, begidx, endidx):
@@ -241,7 +277,7 @@ get IO standard value
             self.checkargs(line, "<IO_name>")
         except PodError as error:
             print(str(DISPLAY))
-            print(str(error))
+            self.print_error(error)
             return
         arg = line.split(' ')
         io_name = arg[0]
@@ -249,7 +285,7 @@ get IO standard value
             print(self._project.get_io(io_name).standard)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -273,7 +309,7 @@ set IO standard value
             self.checkargs(line, "<IO_name> <port_option_value>")
         except PodError as error:
             print(str(DISPLAY))
-            print(str(error))
+            self.print_error(error)
             return
         arg = line.split(' ')
         io_name = arg[0]
@@ -283,7 +319,7 @@ set IO standard value
                 io_name).port_option = port_option_value
         except PodError as error:
             print(str(DISPLAY))
-            print(str(error))
+            self.print_error(error)
             return
 
     def complete_getportoption(self, text, line, begidx, endidx):
@@ -306,7 +342,7 @@ get IO Port option value
             self.checkargs(line, "<IO_name>")
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         arg = line.split(' ')
         io_name = arg[0]
@@ -314,7 +350,7 @@ get IO Port option value
             print(self._project.get_io(io_name).port_option)
         except PodError as error:
             print(DISPLAY)
-            print(error)
+            self.print_error(error)
             return
         print(DISPLAY)
 
@@ -338,7 +374,7 @@ set IO drive value
             self.checkargs(line, "<IO_name> <drive_value>")
         except PodError as error:
             print(str(DISPLAY))
-            print(str(error))
+            self.print_error(error)
             return
         arg = line.split(' ')
         io_name = arg[0]
@@ -347,7 +383,7 @@ set IO drive value
             self._project.get_io(io_name).drive = drive_value
         except PodError as error:
             print(str(DISPLAY))
-            print(str(error))
+            self.print_error(error)
             return
 
     def complete_getiodrive(self, text, line, begidx, endidx):
@@ -370,7 +406,7 @@ get IO drive value
             self.checkargs(line, "<IO_name>")
         except PodError as error:
             print(str(DISPLAY))
-            print(str(error))
+            self.print_error(error)
             return
         arg = line.split(' ')
         io_name = arg[0]
@@ -378,7 +414,7 @@ get IO drive value
             print(self._project.get_io(io_name).drive)
         except PodError as error:
             print(str(DISPLAY))
-            print(str(error))
+            self.print_error(error)
             return
         print(str(DISPLAY))
 
@@ -402,7 +438,7 @@ Set fpga attributes
             self.checkargs(line, "<fpga_attributes> <attribute_value>")
         except PodError as error:
             print(str(DISPLAY))
-            print(str(error))
+            self.print_error(error)
             return
         arg = line.split(' ')
         att_name = arg[0]
@@ -412,7 +448,7 @@ Set fpga attributes
             platform.set_attr(att_name, att_value, "fpga")
         except PodError as error:
             print(str(DISPLAY))
-            print(str(error))
+            self.print_error(error)
             return
         print(str(DISPLAY))
 
@@ -436,7 +472,7 @@ get fpga attributes values
             self.checkargs(line, "<fpga_attributes>")
         except PodError as error:
             print(str(DISPLAY))
-            print(str(error))
+            self.print_error(error)
             return
         arg = line.split(' ')
         att_name = arg[0]
@@ -445,6 +481,6 @@ get fpga attributes values
             print(str(platform.get_attr_value(att_name, "fpga")))
         except PodError as error:
             print(str(DISPLAY))
-            print(str(error))
+            self.print_error(error)
             return
         print(str(DISPLAY))
@@ -25,20 +25,36 @@
 # ----------------------------------------------------------------------------
 """ Class that manage memory map for bus assignement """
 
+from bisect import bisect_left
+from bisect import bisect_right
+
 from periphondemand.bin.utils.display import Display
 from periphondemand.bin.utils.poderror import PodError
 
 DISPLAY = Display()
 
+# append     : after the slave with the highest address
+# first_fit  : in the lowest hole large enough
+# best_fit   : in the smallest hole large enough
+# compact    : all slaves are packed again, largest first, when a slave
+#              without base address is added or on repack command
+ALLOC_STRATEGIES = ["append", "first_fit", "best_fit", "compact"]
+
 
 class AllocMem(object):
     """ Manage memory mapping, and instances identifiers
+
+        attributes:
+            listinterfaceslave -- slaves interfaces sorted by base address
+            _bases             -- base addresses of listinterfaceslave
+            _maxsize           -- largest memory size of slaves
     """
 
     def __init__(self, parent):
         self.parent = parent
         self.listinterfaceslave = []
-        self.lastaddress = 0
+        self._bases = []
+        self._maxsize = 0
         self.instancescount = 1
 
     def __str__(self):
@@ -60,44 +76,179 @@ class AllocMem(object):
         self.instancescount = self.instancescount + 1
         return self.instancescount - 1
 
+    @property
+    def strategy(self):
+        """ Get the allocation strategy of master interface """
+        strategy = self.parent.get_attr_value("alloc_strategy")
+        if strategy is None:
+            return "append"
+        return strategy
+
+    @strategy.setter
+    def strategy(self, strategy):
+        """ Set the allocation strategy of master interface """
+        if strategy not in ALLOC_STRATEGIES:
+            raise PodError("Unknown allocation strategy " + str(strategy) +
+                           ", availables strategies are " +
+                           ", ".join(ALLOC_STRATEGIES), 0)
+        self.parent.set_attr("alloc_strategy", strategy)
+
+    def _insert(self, interface, base):
+        """ insert interface in sorted slaves list """
+        index = bisect_right(self._bases, base)
+        self._bases.insert(index, base)
+        self.listinterfaceslave.insert(index, interface)
+        self._maxsize = max(self._maxsize, interface.mem_size)
+
+    def _remove(self, interface):
+        """ remove interface from sorted slaves list """
+        for index, slave in enumerate(self.listinterfaceslave):
+            if slave is interface:
+                del self._bases[index]
+                del self.listinterfaceslave[index]
+                if interface.mem_size >= self._maxsize:
+                    self._maxsize = max([slave.mem_size for slave
+                                         in self.listinterfaceslave] + [0])
+                return
+        raise ValueError("interface is not a slave of this master")
+
+    def _layout(self):
+        """ yield (address, size, interface) for each slave and
+            (address, size, None) for each hole between slaves
+        """
+        baseaddress = 0
+        for base, interface in zip(self._bases, self.listinterfaceslave):
+            if baseaddress < base:
+                size = base - baseaddress
+                yield (baseaddress, size, None)
+                baseaddress = baseaddress + size
+            size = interface.mem_size
+            yield (base, size, interface)
+            baseaddress = baseaddress + size
+
+    @property
+    def voids(self):
+        """ return the list of (address, size) of holes between slaves """
+        return [(address, size)
+                for address, size, interface in self._layout()
+                if interface is None]
+
+    @property
+    def end_address(self):
+        """ first address after all slaves """
+        end = 0
+        for base, interface in zip(self._bases, self.listinterfaceslave):
+            end = max(end, base + interface.mem_size)
+        return end
+
+    def overlaps(self, base, size, ignore=None):
+        """ return the list of slaves that use addresses in
+            [base, base + size[, except ignore """
+        slaves = []
+        index = bisect_left(self._bases, base + size) - 1
+        while index >= 0 and self._bases[index] + self._maxsize > base:
+            slave = self.listinterfaceslave[index]
+            if slave is not ignore and\
+                    self._bases[index] + slave.mem_size > base:
+                slaves.insert(0, slave)
+            index = index - 1
+        return slaves
+
+    @classmethod
+    def _align(cls, address, size):
+        """ round address up to a multiple of size """
+        return ((address + size - 1) // size) * size
+
+    def _find_base(self, size):
+        """ return a free base address for a slave of size """
+        append = self._align(self.end_address, size)
+        if self.strategy not in ("first_fit", "best_fit"):
+            return append
+        best = None
+        for address, voidsize in self.voids:
+            base = self._align(address, size)
+            if base + size > address + voidsize:
+                continue
+            if self.strategy == "first_fit":
+                return base
+            if best is None or voidsize < best[1]:
+                best = (base, voidsize)
+        if best is None:
+            return append
+        return best[0]
+
     def add_slave_interface(self, interface):
         """ adding slave interface """
         if interface.interface_class != "slave":
             raise PodError(interface.name + " is not a slave", 0)
 
-        # add slave interface to list
-        self.listinterfaceslave.append(interface)
         # set base address
         size = interface.mem_size
         if size > 0:
             try:
                 base = interface.base_addr
             except PodError:
-                base = int(self.lastaddress / size)
-                if (self.lastaddress % size) != 0:
-                    base = base + 1
-                interface.base_addr = base * size
+                base = self._find_base(size)
+                interface.base_addr = base
                 DISPLAY.msg("setting base address " +
-                            hex(base * size) + " for  " +
+                            hex(base) + " for  " +
                             interface.parent.instancename +
                             "." + interface.name)
+                # add slave interface to list
+                self._insert(interface, base)
+                if self.strategy == "compact":
+                    self.repack()
             else:
                 DISPLAY.msg("Base address is " + hex(base) + " for " +
                             interface.parent.instancename +
                             "." + interface.name)
-            self.lastaddress = size * (base + 1)
+                # add slave interface to list
+                self._insert(interface, base)
         else:
+            self._insert(interface, 0)
             DISPLAY.msg("No addressing value in this type of bus")
 
     def del_slave_interface(self, interface):
         """ delete slave interface from list """
-        self.listinterfaceslave.remove(interface)
+        self._remove(interface)
 
-    @classmethod
-    def set_slave_addr(cls, interfaceslave, address):
+    def set_slave_addr(self, interfaceslave, address):
         """ set base address for interfaceslave,
             address in hexa """
         interfaceslave.base_addr = address
+        try:
+            self._remove(interfaceslave)
+        except ValueError:
+            return
+        base = interfaceslave.base_addr
+        self._insert(interfaceslave, base)
+        for slave in self.overlaps(base, interfaceslave.mem_size,
+                                   interfaceslave):
+            DISPLAY.msg(interfaceslave.parent.instancename +
+                        "." + interfaceslave.name + " overlaps " +
+                        slave.parent.instancename + "." + slave.name, 1)
+
+    def repack(self):
+        """ Set slaves base addresses again without holes,
+            largest slaves first """
+        slaves = sorted(self.listinterfaceslave,
+                        key=lambda slave: -slave.mem_size)
+        self.listinterfaceslave = []
+        self._bases = []
+        address = 0
+        for slave in slaves:
+            size = slave.mem_size
+            base = 0
+            if size > 0:
+                base = self._align(address, size)
+                address = base + size
+                if slave.base_addr != base:
+                    slave.base_addr = base
+                    DISPLAY.msg("setting base address " +
+                                hex(base) + " for  " +
+                                slave.parent.instancename +
+                                "." + slave.name)
+            self._insert(slave, base)
 
     @property
     def mapping(self):
@@ -108,22 +259,16 @@ class AllocMem(object):
                                  ...               ]
         """
         mappinglist = []
-        # sorting slave interface
-        self.listinterfaceslave.sort(key=lambda x: x.base_addr)
-
-        baseaddress = 0
-        for interface in self.listinterfaceslave:
-            if baseaddress < interface.base_addr:
-                size = interface.base_addr - baseaddress
-                mappinglist.append(["0x%02x" % baseaddress,
+        for address, size, interface in self._layout():
+            if interface is None:
+                mappinglist.append(["0x%02x" % address,
                                     "--void--",
                                     str(size),
                                     "void"])
-                baseaddress = baseaddress + size
-            mappinglist.append([hex(interface.base_addr),
-                                interface.parent.instancename +
-                                "." + interface.name,
-                                interface.mem_size,
-                                interface.unique_id])
-            baseaddress = baseaddress + interface.mem_size
+            else:
+                mappinglist.append([hex(address),
+                                    interface.parent.instancename +
+                                    "." + interface.name,
+                                    size,
+                                    interface.unique_id])
         return mappinglist
@@ -25,14 +25,70 @@
 # ----------------------------------------------------------------------------
 """ Manage busses """
 
+import copy
+import os
+import time
+
 from periphondemand.bin.define import BUSPATH
 
 from periphondemand.bin.utils.wrapperxml import WrapperXml
+from periphondemand.bin.utils.plugins import BUS_PLUGINS
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils.poderror import PodError
 
 SETTINGS = Settings()
 
+# bus xml files are checked for changes at most every CHECK_DELAY ns
+CHECK_DELAY = 1000000000
+
+
+class BusDefinition(WrapperXml):
+    """ Bus xml description, parsed once and copied by all Bus objects
+        of the same name
+        attributes:
+            signals -- signal names, key is (class type, signal type)
+            stamp   -- modification time and size of bus xml file
+            checked -- time of last stamp check
+    """
+
+    # definitions already parsed, key is bus name
+    registry = {}
+
+    def __init__(self, filename, stamp):
+        WrapperXml.__init__(self, file=filename)
+        self.stamp = stamp
+        self.checked = time.monotonic_ns()
+        self.signals = {}
+        for classnode in self.get_nodes("class"):
+            classname = classnode.get_attr_value("type")
+            for signal in classnode.get_nodes("type"):
+                self.signals.setdefault(
+                    (classname, signal.get_attr_value("type")),
+                    signal.get_attr_value("name"))
+
+    @classmethod
+    def get(cls, name):
+        """ Get the definition of bus name, bus xml file is parsed again
+            only if it changed """
+        definition = cls.registry.get(name)
+        now = time.monotonic_ns()
+        if definition is not None and now - definition.checked < CHECK_DELAY:
+            return definition
+        filename = SETTINGS.path + BUSPATH + "/" + name + "/" + name + ".xml"
+        if not os.path.isfile(filename) and name in BUS_PLUGINS.names:
+            # out-of-tree bus, xml file is next to its plugin
+            filename = BUS_PLUGINS.directory_of(name) + "/" + name + ".xml"
+        try:
+            stat = os.stat(filename)
+        except OSError as error:
+            raise PodError(str(error), 0)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if definition is None or definition.stamp != stamp:
+            definition = BusDefinition(filename, stamp)
+            cls.registry[name] = definition
+        definition.checked = now
+        return definition
+
 
 class Bus(WrapperXml):
     """ Class for bus type
@@ -42,8 +98,10 @@ class Bus(WrapperXml):
 
     def __init__(self, parent, name):
         self.parent = parent
-        WrapperXml.__init__(self, file=(SETTINGS.path + BUSPATH + "/" +
-                            name + "/" + name + ".xml"))
+        definition = BusDefinition.get(name)
+        # each bus has its own tree, definition stays as read from file
+        WrapperXml.__init__(self, etnode=copy.deepcopy(definition.tree))
+        self._signals = definition.signals
 
     @property
     def data_size(self):
@@ -57,21 +115,14 @@ class Bus(WrapperXml):
     def sig_name(self, classname, typename):
         """ return the signal name for a given type
         """
-        for classnode in self.get_nodes("class"):
-            if classnode.get_attr_value("type") == classname:
-                for signal in classnode.get_nodes("type"):
-                    if signal.get_attr_value("type") == typename:
-                        return signal.get_attr_value("name")
-        return None
+        return self._signals.get((classname, typename))
+
+    def load_plugin(self):
+        """ Get the bus code generation module """
+        return BUS_PLUGINS.get(self.name)
 
     def generate_intercon(self, intercon):
         """ generate intercon
         """
         masterinterface = self.parent
-        import sys
-        # load module path
-        sys.path.append(SETTINGS.path + BUSPATH + "/" + self.name)
-        plugin = __import__(self.name)
-        sys.path.remove(SETTINGS.path + BUSPATH + "/" + self.name)
-
-        plugin.generate_intercon(masterinterface, intercon)
+        self.load_plugin().generate_intercon(masterinterface, intercon)
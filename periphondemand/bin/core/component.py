@@ -17,6 +17,7 @@
 """ Manage component class """
 
 from periphondemand.bin.define import COMPONENTSPATH
+from periphondemand.bin.define import STOREPATH
 from periphondemand.bin.define import XMLEXT
 
 from periphondemand.bin.utils import wrappersystem as sy
@@ -40,6 +41,8 @@ class Component(WrapperXml):
     attributes:
         _interfaceslist -- list of interfaces
         _genericslist   -- list of generics
+        _lazy_file      -- xml file not yet loaded for lazy loaded instance
+        _lazy_tree      -- tree already parsed from _lazy_file, or None
 
     """
 
@@ -48,6 +51,7 @@ class Component(WrapperXml):
             __init__(self)
         """
 
+        self._lazy_file = None
         if node is not None:
             WrapperXml.__init__(self, node=node)
         elif afile is not None:
@@ -56,6 +60,7 @@ class Component(WrapperXml):
             WrapperXml.__init__(self, nodename="void")
 
         self._interfaceslist = []
+        self._interfacesdict = None
         self._genericslist = []
         self._hdl_fileslist = []
         self._driver_templateslist = []
@@ -99,10 +104,12 @@ class Component(WrapperXml):
                 componentname + "%02d" %\
                 len(project.get_instances_list_of_component(componentname))
 
-        # copy and rename directory
-        sy.cp_dir(project.library.library_path(libraryname) +
-                  "/" + componentname,
-                  self.parent.projectpath + COMPONENTSPATH)
+        # copy and rename directory, library files are read only links
+        # shared by instances in project store
+        sy.cp_dir_stored(project.library.library_path(libraryname) +
+                         "/" + componentname,
+                         self.parent.projectpath + COMPONENTSPATH,
+                         self.parent.projectpath + STOREPATH)
         try:
             sy.rename_dir(self.parent.projectpath +
                           COMPONENTSPATH + "/" + componentname,
@@ -123,13 +130,50 @@ class Component(WrapperXml):
         # Connect platform connection
         self.autoconnect_pins()
 
-    def load(self, instancename):
-        """ Load an instance from project directory
+    def load(self, instancename, lazy=False, tree=None):
+        """ Load an instance from project directory, if lazy is True
+            component is loaded on first access. tree is the xml tree
+            already parsed from instance file
+        """
+        filename = self.parent.instance_filename(instancename)
+        if lazy and (tree is not None or sy.file_exist(filename)):
+            self._lazy_file = filename
+            self._lazy_instancename = instancename
+            self._lazy_tree = tree
+            return
+        self.load_file(filename, instancename, tree)
+
+    def _load_lazy(self):
+        """ Parse xml file of a lazy loaded instance """
+        if self._lazy_file is not None:
+            filename = self._lazy_file
+            self._lazy_file = None
+            tree = self._lazy_tree
+            self._lazy_tree = None
+            self.load_file(filename, self._lazy_instancename, tree)
+
+    @property
+    def is_loaded(self):
+        """ False if component xml file has not been parsed yet """
+        return self._lazy_file is None
+
+    @property
+    def tree(self):
+        """ Get the xml tree, parse the file if not done yet """
+        self._load_lazy()
+        return self._tree
+
+    @tree.setter
+    def tree(self, tree):
+        """ Set the xml tree """
+        self._tree = tree
+
+    def load_file(self, filename, instancename, tree=None):
+        """ Load instance named instancename from xml filename,
+            tree is the xml tree already parsed from filename
         """
         # load xml file
-        WrapperXml.__init__(self, file=self.parent.projectpath +
-                            COMPONENTSPATH + "/" + instancename +
-                            "/" + instancename + XMLEXT)
+        WrapperXml.__init__(self, file=filename, parsed=tree)
 
         # Fill objects list
         if self.get_node("interfaces") is not None:
@@ -166,6 +210,7 @@ class Component(WrapperXml):
     @property
     def constraints(self):
         """ Get list of constraints """
+        self._load_lazy()
         return self._constraintslist
 
     def autoconnect_pins(self):
@@ -177,6 +222,7 @@ class Component(WrapperXml):
     @property
     def hdl_files(self):
         """ Get list of HDL files """
+        self._load_lazy()
         return self._hdl_fileslist
 
     def get_hdl_top(self):
@@ -195,17 +241,20 @@ class Component(WrapperXml):
 
     def add_hdl_file(self, hdl_file):
         """ add hdl file """
+        self._load_lazy()
         self.add_subnode(nodename="hdl_files", subnode=hdl_file)
         return self._hdl_fileslist.append(hdl_file)
 
     @property
     def interrupts(self):
         """ Get interrupt list """
+        self._load_lazy()
         return self._interruptslist
 
     @property
     def generics(self):
         """ Get generics parameters list """
+        self._load_lazy()
         return self._genericslist
 
     @property
@@ -227,9 +276,15 @@ class Component(WrapperXml):
 
     def get_interface(self, interfacename):
         """ Get an interface by name """
-        for interface in self._interfaceslist:
-            if interface.name == interfacename:
-                return interface
+        self._load_lazy()
+        if self._interfacesdict is None:
+            index = {}
+            for interface in self._interfaceslist:
+                index.setdefault(interface.name, interface)
+            self._interfacesdict = index
+        interface = self._interfacesdict.get(interfacename)
+        if interface is not None and interface.name == interfacename:
+            return interface
         raise PodError("Interface " + str(interfacename) +
                        " does not exists", 0)
 
@@ -268,18 +323,27 @@ class Component(WrapperXml):
 
     def add_interface(self, interface):
         """ Add an interface in component """
+        self._load_lazy()
         interface.parent = self
         self._interfaceslist.append(interface)
+        self._interfacesdict = None
         self.add_subnode(nodename="interfaces", subnode=interface)
 
     @property
     def interfaces(self):
         """ Get the list of interfaces """
+        self._load_lazy()
         return self._interfaceslist
 
+    def invalidate_interfaces_index(self):
+        """ Forget interfaces name index, to call when an interface is
+            renamed """
+        self._interfacesdict = None
+
     @property
     def driver_templates(self):
         """ get the driver template list """
+        self._load_lazy()
         return self._driver_templateslist
 
     def get_driver_template(self, architecturename):
@@ -291,6 +355,8 @@ class Component(WrapperXml):
 
     def save(self):
         """ Save component in project directory files """
+        if not self.is_loaded:
+            return
         if not sy.dir_exist(self.parent.projectpath + COMPONENTSPATH +
                             "/" + self.instancename):
             sy.mkdir(self.parent.projectpath + COMPONENTSPATH +
@@ -304,16 +370,23 @@ class Component(WrapperXml):
         if not self.is_platform():
             sy.rm_dir(self.parent.projectpath + COMPONENTSPATH +
                       "/" + self.instancename)
+            sy.prune_store(self.parent.projectpath + STOREPATH)
 
     @property
     def instancename(self):
         """ get the name of this component instance"""
+        if not self.is_loaded:
+            return self._lazy_instancename
         return self.get_attr_value("instance_name")
 
     @instancename.setter
     def instancename(self, instancename):
         """ set the name of this instance """
-        return self.set_attr("instance_name", instancename)
+        oldname = self.get_attr_value("instance_name")
+        self.set_attr("instance_name", instancename)
+        if self.parent is not None:
+            self.parent.invalidate_instances_index(oldname)
+        return instancename
 
     @classmethod
     def inv_direction(cls, dirname):
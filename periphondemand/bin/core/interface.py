@@ -59,12 +59,15 @@ class Interface(WrapperXml):
             raise PodError("Keys unknown in Interface", 0)
 
         self._registerslist = []
+        self._registersdict = None
         self.portslist = []
+        self._portsdict = None
+        self._portstypedict = None
         self._slaveslist = []
         self._bus = None
 
         if self.interface_class == "master":
-            self.alloc_mem = AllocMem(self)
+            self._alloc_mem = AllocMem(self)
         if self.interface_class == "slave":
             self.interfacemaster = None
 
@@ -84,11 +87,26 @@ class Interface(WrapperXml):
         if self.bus_name is not None:
             self.bus = self.bus_name
 
+    def _wire_busses(self):
+        """ master-slave links of a loaded project are set on first use """
+        try:
+            wire_busses = self.parent.parent.wire_busses
+        except AttributeError:
+            return
+        wire_busses()
+
+    @property
+    def alloc_mem(self):
+        """ Get memory allocator of master interface """
+        self._wire_busses()
+        return self._alloc_mem
+
     @property
     def master(self):
         """ Get the master bus if exist """
         if self.interface_class != "slave":
             raise PodError("Only slave interface could have a master", 0)
+        self._wire_busses()
         if self.interfacemaster is None:
             raise PodError("Interface " + self.name +
                            " is not connected on a master", 0)
@@ -104,6 +122,18 @@ class Interface(WrapperXml):
                            " must be master", 0)
         self.interfacemaster = masterinterface
 
+    @property
+    def name(self):
+        """ Get interface name """
+        return self.get_attr_value("name")
+
+    @name.setter
+    def name(self, value):
+        """ Set interface name """
+        self.set_attr("name", value)
+        if self.parent is not None:
+            self.parent.invalidate_interfaces_index()
+
     @property
     def interface_class(self):
         """ Get the class interface """
@@ -210,24 +240,41 @@ class Interface(WrapperXml):
 
     def get_port(self, portname):
         """ Get port by its name """
-        for port in self.portslist:
-            if port.name == portname:
-                return port
+        if self._portsdict is None:
+            index = {}
+            for port in self.portslist:
+                index.setdefault(port.name, port)
+            self._portsdict = index
+        port = self._portsdict.get(portname)
+        if port is not None and port.name == portname:
+            return port
         raise PodError("Port " + portname + " does not exists", 1)
 
     def add_port(self, port):
         """ Adding a port """
         port.parent = self
         self.portslist.append(port)
+        self.invalidate_ports_index()
         self.add_subnode(nodename="ports", subnode=port)
 
     def get_port_by_type(self, porttypename):
         """ Get port using port type name as argument"""
-        for port in self.portslist:
-            if port.porttype == porttypename:
-                return port
+        if self._portstypedict is None:
+            index = {}
+            for port in self.portslist:
+                index.setdefault(port.porttype, port)
+            self._portstypedict = index
+        port = self._portstypedict.get(porttypename)
+        if port is not None and port.porttype == porttypename:
+            return port
         raise PodError("No port with type " + str(porttypename), 1)
 
+    def invalidate_ports_index(self):
+        """ Forget ports name and type index, to call when a port is
+            added, deleted or renamed """
+        self._portsdict = None
+        self._portstypedict = None
+
     def del_pin(self, instancedest, interfacedest=None, portdest=None,
                 pindest=None, portsource=None, pinsource=None):
         """ Delete all interface pins
@@ -411,9 +458,14 @@ class Interface(WrapperXml):
 
     def get_register(self, registername):
         """ Get register by name """
-        for register in self.registers:
-            if register.name == registername:
-                return register
+        if self._registersdict is None:
+            index = {}
+            for register in self._registerslist:
+                index.setdefault(register.name, register)
+            self._registersdict = index
+        register = self._registersdict.get(registername)
+        if register is not None and register.name == registername:
+            return register
         raise PodError("No register with name " + registername, 0)
 
     @property
@@ -29,7 +29,7 @@ from periphondemand.bin.define import LIBRARYPATH
 
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.utils.settings import Settings
-from periphondemand.bin.utils import wrappersystem as sy
+from periphondemand.bin.utils.dirindex import INDEX
 
 SETTINGS = Settings()
 
@@ -45,7 +45,7 @@ class Library(object):
     @property
     def libraries(self):
         """ Return a list of libraries availables """
-        componentlist = sy.list_dir(SETTINGS.path + LIBRARYPATH)
+        componentlist = INDEX.list_dir(SETTINGS.path + LIBRARYPATH)
         componentlist.extend(self.personnal_libraries())
         componentlist.extend(self.get_component_lib_name())
         return componentlist
@@ -53,7 +53,7 @@ class Library(object):
     @classmethod
     def official_libraries(cls):
         """ Get list of official libraries"""
-        return sy.list_dir(SETTINGS.path + LIBRARYPATH)
+        return INDEX.list_dir(SETTINGS.path + LIBRARYPATH)
 
     def library_path(self, libraryname=None):
         """ Get the library path """
@@ -78,15 +78,15 @@ class Library(object):
         componentlist = []
         if libraryname in official_component_type:
             componentlist =\
-                sy.list_dir(SETTINGS.path +
-                            LIBRARYPATH + "/" +
-                            libraryname)
+                INDEX.list_dir(SETTINGS.path +
+                               LIBRARYPATH + "/" +
+                               libraryname)
         elif libraryname in self.personnal_libraries():
             componentlist =\
-                sy.list_dir(self.get_pers_lib_path(libraryname))
+                INDEX.list_dir(self.get_pers_lib_path(libraryname))
         elif libraryname in self.get_component_lib_name():
             componentlist =\
-                sy.list_dir(self.get_component_lib_path(libraryname))
+                INDEX.list_dir(self.get_component_lib_path(libraryname))
         return componentlist
 
     def add_library(self, path):
@@ -107,17 +107,21 @@ class Library(object):
     def check_lib(self, path):
         """ check if lib and component are not duplicated """
         libname = path.split("/")[-1]
+        libraries = self.libraries
         # check if lib name exist
-        if libname in self.libraries:
+        if libname in libraries:
             raise PodError("Library " + libname + " already exist", 0)
+        # library of each component, first library found is kept
+        owners = {}
+        for libraryname in libraries:
+            for component in self.list_components(libraryname):
+                owners.setdefault(component, libraryname)
         # check if components under library are new
-        componentlist = sy.list_dir(path)
-        for component in componentlist:
-            for libraryname in self.libraries:
-                if component in self.list_components(libraryname):
-                    raise PodError("Library " + libname +
-                                   " contain a component that exist in '" +
-                                   libraryname + "' : " + component, 0)
+        for component in INDEX.list_dir(path):
+            if component in owners:
+                raise PodError("Library " + libname +
+                               " contain a component that exist in '" +
+                               owners[component] + "' : " + component, 0)
 
     @classmethod
     def get_component_lib_path(cls, name=None):
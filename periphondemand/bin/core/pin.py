@@ -48,9 +48,12 @@ class Pin(WrapperXml):
 
         if "node" in keys:
             WrapperXml.__init__(self, node=keys["node"])
+            # connections are read from xml on first access
+            self._connectionslist = None
         elif "num" in keys:
             WrapperXml.__init__(self, nodename="pin")
             self.num = keys["num"]
+            self._connectionslist = []
         else:
             raise PodError("Keys unknown in Pin", 0)
 
@@ -67,10 +70,16 @@ class Pin(WrapperXml):
                     "port_dest":string,
                     "pin_dest":string)
         """
-        connectionslist = []
-        if(self.get_node("connect") is not None):
+        return list(self._connections)
+
+    @property
+    def _connections(self):
+        """ connections list owned by this pin, filled from xml on
+            first access """
+        if self._connectionslist is None:
+            self._connectionslist = []
             for element in self.get_nodes("connect"):
-                connectionslist.append(
+                self._connectionslist.append(
                     {"instance_dest":
                         str(element.get_attr_value("instance_dest")),
                      "interface_dest":
@@ -79,17 +88,58 @@ class Pin(WrapperXml):
                         str(element.get_attr_value("port_dest")),
                      "pin_dest":
                         str(element.get_attr_value("pin_dest"))})
-        return connectionslist
+        return self._connectionslist
+
+    @property
+    def _pin_graph(self):
+        """ Return the project pins index, None if pin is not
+            in a project """
+        try:
+            return self.project.pin_graph
+        except AttributeError:
+            return None
+
+    def _touch_connections(self):
+        """ Record connections modification, xml is written on project
+            save """
+        pin_graph = self._pin_graph
+        if pin_graph is None:
+            self.write_connections()
+        else:
+            pin_graph.touch(self)
+
+    def write_connections(self):
+        """ Write connections list in xml tree """
+        if self._connectionslist is None:
+            return
+        self.del_node("connect")
+        for connection in self._connectionslist:
+            attributes = dict(connection)
+            if attributes["pin_dest"] == "None":
+                del attributes["pin_dest"]
+            self.add_node(nodename="connect", attributedict=attributes)
+
+    def _connection_to(self, pin_dest):
+        """ Return connection dictionnary pointing to pin_dest """
+        return {"instance_dest":
+                pin_dest.parent.parent.parent.instancename,
+                "interface_dest": pin_dest.parent.parent.name,
+                "port_dest": pin_dest.parent.name,
+                "pin_dest": str(pin_dest.num)}
+
+    def _remove_connection(self, connection):
+        """ Remove all connections equal to connection """
+        connections = self._connections
+        if connection in connections:
+            connections[:] = [connect for connect in connections
+                              if connect != connection]
+            self._touch_connections()
 
     def del_connections_forces(self):
         """ Delete all connections in this pin without any check """
-        for connection in self.connections:
-            self.del_node(
-                "connect",
-                {"instance_dest": connection["instance_dest"],
-                 "interface_dest": connection["interface_dest"],
-                 "port_dest": connection["port_dest"],
-                 "pin_dest": connection["pin_dest"]})
+        if self._connections != []:
+            del self._connections[:]
+            self._touch_connections()
 
     def del_connections(self):
         """ Delete all connection from or to this pin """
@@ -113,46 +163,30 @@ class Pin(WrapperXml):
 
     def del_connection_force(self, pin_dest):
         """ Delete connection from this pin to pin_dest """
-        self.del_node(
-            "connect",
-            {"instance_dest":
-             pin_dest.parent.parent.parent.instancename,
-             "interface_dest": pin_dest.parent.parent.name,
-             "port_dest": pin_dest.parent.name,
-             "pin_dest": str(pin_dest.num)})
-
-        pin_dest.del_node(
-            "connect",
-            {"instance_dest":
-                self.parent.parent.parent.instancename,
-             "interface_dest": self.parent.parent.name,
-             "port_dest": self.parent.name,
-             "pin_dest": str(self.num)})
+        self._remove_connection(self._connection_to(pin_dest))
+        pin_dest._remove_connection(pin_dest._connection_to(self))
         return True
 
     @property
     def connected_pins(self):
         """ return list of pins connected to this pin """
+        pin_graph = self._pin_graph
         pinlist = []
-        for connect in self.connections:
-            pinlist.append(self.project.get_instance(
-                connect["instance_dest"]).get_interface(
-                    connect["interface_dest"]).get_port(
-                        connect["port_dest"]).get_pin(
-                            connect["pin_dest"]))
+        for connect in self._connections:
+            if pin_graph is not None:
+                pinlist.append(pin_graph.get_pin(connect))
+            else:
+                pinlist.append(self.project.get_instance(
+                    connect["instance_dest"]).get_interface(
+                        connect["interface_dest"]).get_port(
+                            connect["port_dest"]).get_pin(
+                                connect["pin_dest"]))
         return pinlist
 
     def is_connection_exists(self, pin_dest):
         """ check if this connection exists
         """
-        for connect in self.connections:
-            if connect == {"instance_dest":
-                           pin_dest.parent.parent.parent.instancename,
-                           "interface_dest": pin_dest.parent.parent.name,
-                           "port_dest": pin_dest.parent.name,
-                           "pin_dest": str(pin_dest.num)}:
-                return True
-        return False
+        return self._connection_to(pin_dest) in self._connections
 
     def connect_pin(self, pin_dest):
         """ Make connection between two pin
@@ -207,16 +241,12 @@ class Pin(WrapperXml):
                            port_destname, pin_destnum=None):
         """ add pin connection and check direction compatibility
         """
-        if pin_destnum is not None:
-            attributes = {"instance_dest": str(instance_destname),
-                          "interface_dest": str(interface_destname),
-                          "port_dest": str(port_destname),
-                          "pin_dest": str(pin_destnum)}
-        else:
-            attributes = {"instance_dest": str(instance_destname),
-                          "interface_dest": str(interface_destname),
-                          "port_dest": str(port_destname)}
-        self.add_node(nodename="connect", attributedict=attributes)
+        self._connections.append(
+            {"instance_dest": str(instance_destname),
+             "interface_dest": str(interface_destname),
+             "port_dest": str(port_destname),
+             "pin_dest": str(pin_destnum)})
+        self._touch_connections()
 
     def autoconnect_pin(self):
         """ connect all platform connection, if connection is not
@@ -240,7 +270,7 @@ class Pin(WrapperXml):
 
     def is_connected(self):
         """ Return True if pin is connected to something, else return False """
-        if len(self.connected_pins) > 0:
+        if len(self._connections) > 0:
             return True
         else:
             return False
@@ -250,7 +280,7 @@ class Pin(WrapperXml):
         else return False
         """
         instance_name = instance.instancename
-        for connexion in self.connections:
+        for connexion in self._connections:
             if connexion["instance_dest"] == instance_name:
                 return True
         return False
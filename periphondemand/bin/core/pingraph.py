@@ -0,0 +1,64 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     pingraph.py
+# Purpose:  Project wide index of pins connections
+#
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+#
+# Created:  18/10/2026
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" Project wide index of pins connections """
+
+
+class PinGraph(object):
+    """ Adjacency index of pins connections for a project.
+        Connections are kept by each Pin object, this index resolves
+        connection destinations to pins objects and records which pins
+        must be written back in xml tree on save.
+
+        attributes:
+            project -- the project indexed
+            _pins   -- pin objects cache, key is
+                       (instance, interface, port, pin num)
+            _dirty  -- pins with connections not yet written in xml
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self._pins = {}
+        self._dirty = {}
+
+    @classmethod
+    def key(cls, connection):
+        """ Return the index key of a connection dictionnary """
+        return (connection["instance_dest"],
+                connection["interface_dest"],
+                connection["port_dest"],
+                connection["pin_dest"])
+
+    def get_pin(self, connection):
+        """ Return the pin object pointed by connection """
+        key = self.key(connection)
+        pin = self._pins.get(key)
+        if pin is None:
+            pin = self.project.get_instance(key[0]).get_interface(
+                key[1]).get_port(key[2]).get_pin(key[3])
+            self._pins[key] = pin
+        return pin
+
+    def touch(self, pin):
+        """ Mark pin connections as modified """
+        self._dirty[pin] = None
+
+    def forget_instance(self, instancename):
+        """ Drop all cached pins of instance named instancename """
+        for key in [key for key in self._pins if key[0] == instancename]:
+            del self._pins[key]
+
+    def flush(self):
+        """ Write modified pins connections in xml trees """
+        for pin in self._dirty:
+            pin.write_connections()
+        self._dirty = {}
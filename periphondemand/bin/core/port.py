@@ -53,9 +53,11 @@ class Port(WrapperXml):
             raise PodError("Keys not known in Port ", 0)
 
         self.pinlist = []
+        self._pinsdict = {}
         for element in self.get_nodes("pin"):
             pin = Pin(self, node=element)
             self.pinlist.append(pin)
+            self._pinsdict.setdefault(pin.num, pin)
 
     @property
     def extended_name(self):
@@ -74,14 +76,26 @@ class Port(WrapperXml):
         """ return pin node """
         if int(num) >= self.size:
             raise PodError("Pin number " + str(num) + " not in port size")
-        for pin in self.pins:
-            if pin.num == str(num):
-                return pin
+        pin = self._pinsdict.get(str(num))
+        if pin is not None:
+            return pin
         pin = Pin(self, num=str(num))
         self.pinlist.append(pin)
+        self._pinsdict[pin.num] = pin
         self.add_node(node=pin)
         return pin
 
+    @property
+    def name(self):
+        """ get name of port """
+        return self.get_attr_value("name")
+
+    @name.setter
+    def name(self, value):
+        """ set name of port """
+        self.set_attr("name", value)
+        self._invalidate_parent_index()
+
     @property
     def porttype(self):
         """ get type of port """
@@ -91,6 +105,12 @@ class Port(WrapperXml):
     def porttype(self, the_type):
         """ set type of port """
         self.set_attr("type", the_type)
+        self._invalidate_parent_index()
+
+    def _invalidate_parent_index(self):
+        """ port name or type changed, parent interface index is obsolete """
+        if self.parent is not None:
+            self.parent.invalidate_ports_index()
 
     @property
     def direction(self):
@@ -17,6 +17,7 @@ __author__ = "Fabien Marteau <fabien.marteau@armadeus.com>"
 
 import os
 import re
+from contextlib import contextmanager
 from periphondemand.bin.define import XMLEXT
 from periphondemand.bin.define import BINARYPROJECTPATH
 from periphondemand.bin.define import COMPONENTSPATH
@@ -34,10 +35,14 @@ from periphondemand.bin.utils.display import Display
 from periphondemand.bin.utils.poderror import PodError
 
 from periphondemand.bin.utils import wrappersystem as sy
+from periphondemand.bin.utils import xmlbackend
+from periphondemand.bin.utils.plugins import SYNTHESIS_PLUGINS
+from periphondemand.bin.utils.dirindex import INDEX
 
 from periphondemand.bin.core.component import Component
 from periphondemand.bin.core.platform import Platform
 from periphondemand.bin.core.library import Library
+from periphondemand.bin.core.pingraph import PinGraph
 
 from periphondemand.bin.toolchain.simulation import Simulation
 from periphondemand.bin.toolchain.synthesis import synthesis_factory
@@ -64,6 +69,9 @@ class Project(WrapperXml):
         self.void = void
         WrapperXml.__init__(self, nodename="void")
         self._instanceslist = []
+        self._instancesdict = None
+        # master-slave links are set on first use after load
+        self._busses_wired = True
         self._vhdl_version = "vhdl87"
 
         self.simulation = None
@@ -71,6 +79,11 @@ class Project(WrapperXml):
         self.driver = None
 
         self._library = Library(self)
+        self._pin_graph = PinGraph(self)
+
+        # batch mode, saves are deferred until last commit_batch()
+        self._batch_level = 0
+        self._save_pending = False
 
         self.bspdir = None
         self.bspos = None
@@ -124,13 +137,18 @@ class Project(WrapperXml):
         components = self.get_node("components")
         # load components
         if(components):
-            for node in components.get_nodes("component"):
-                if node.get_attr_value("platform") is None:
-                    comp = Component(self)
-                else:
-                    comp = Platform(self, node=self.get_node("platform"))
+            nodes = components.get_nodes("component")
+            trees = self.parse_instances_files(nodes)
+            for node in nodes:
                 try:
-                    comp.load(node.get_attr_value("name"))
+                    if node.get_attr_value("platform") is None:
+                        # instance is loaded on first access
+                        comp = Component(self)
+                        comp.load(node.get_attr_value("name"), lazy=True,
+                                  tree=trees.get(node.get_attr_value("name")))
+                    else:
+                        comp = Platform(self, node=self.get_node("platform"))
+                        comp.load(node.get_attr_value("name"))
                 except IOError:
                     self.del_subnode("components",
                                      "component",
@@ -140,6 +158,7 @@ class Project(WrapperXml):
                                    " directory", 0)
                 else:
                     self._instanceslist.append(comp)
+                    self._instancesdict = None
 
         # load toolchains
         toolchains = self.get_node("toolchain")
@@ -151,12 +170,8 @@ class Project(WrapperXml):
             if node is not None:
                 self.synthesis = synthesis_factory(self, node.name)
 
-        # Set bus master-slave
-        for masterinterface in self.interfaces_master:
-            for slave in masterinterface.slaves:
-                slaveinterface = slave.get_interface()
-                masterinterface.alloc_mem.add_slave_interface(slaveinterface)
-                slaveinterface.master = masterinterface
+        # bus master-slave are set by wire_busses() when first needed
+        self._busses_wired = False
 
         # set bsp directory
         if self.get_node(nodename="bsp") is not None:
@@ -164,11 +179,57 @@ class Project(WrapperXml):
                 nodename="bsp").get_attr_value("directory")
         self.void = 0
 
+    def instance_filename(self, instancename):
+        """ Get the xml file name of instance named instancename """
+        return self.projectpath + COMPONENTSPATH + "/" +\
+            instancename + "/" + instancename + XMLEXT
+
+    def parse_instances_files(self, nodes):
+        """ Parse instances xml files in SETTINGS.load_jobs processes,
+            return a dictionnary of trees, key is instance name.
+            Dictionnary is empty if files must be parsed on first use:
+            with one job, or with lxml which trees must be serialized
+            to leave worker processes and parsed again
+        """
+        if SETTINGS.load_jobs < 2 or xmlbackend.BACKEND == "lxml":
+            return {}
+        names = []
+        filenames = []
+        for node in nodes:
+            name = node.get_attr_value("name")
+            filename = self.instance_filename(name)
+            if node.get_attr_value("platform") is None and\
+                    sy.file_exist(filename):
+                names.append(name)
+                filenames.append(filename)
+        if len(filenames) < 2:
+            return {}
+        return dict(zip(names, WrapperXml.parse_files(filenames,
+                                                       SETTINGS.load_jobs)))
+
+    def wire_busses(self):
+        """ Set bus master-slave links of loaded project, called by
+            interfaces on first access to master or memory allocator
+        """
+        if self._busses_wired:
+            return
+        self._busses_wired = True
+        for masterinterface in self.interfaces_master:
+            for slave in masterinterface.slaves:
+                slaveinterface = slave.get_interface()
+                masterinterface.alloc_mem.add_slave_interface(slaveinterface)
+                slaveinterface.master = masterinterface
+
     @property
     def library(self):
         """ Get library """
         return self._library
 
+    @property
+    def pin_graph(self):
+        """ Get pins connections index """
+        return self._pin_graph
+
     @property
     def projectpath(self):
         """ Get projectpath directory name """
@@ -374,7 +435,9 @@ class Project(WrapperXml):
             raise PodError("Key not known in add_instance", 0)
 
         # Add component to project
+        self._pin_graph.forget_instance(instancename)
         self._instanceslist.append(comp)
+        self._instancesdict = None
         if comp.is_platform() is False:
             self.add_subnode(nodename="components",
                              subnodename="component",
@@ -413,9 +476,14 @@ class Project(WrapperXml):
     def get_instance(self, instancename=None):
         """ Return the instance by name
         """
-        for instance in self.instances:
-            if instance.instancename == instancename:
-                return instance
+        if self._instancesdict is None:
+            index = {}
+            for instance in self._instanceslist:
+                index.setdefault(instance.instancename, instance)
+            self._instancesdict = index
+        instance = self._instancesdict.get(instancename)
+        if instance is not None and instance.instancename == instancename:
+            return instance
         raise PodError("Instance " + instancename + " doesn't exists")
 
     @property
@@ -423,6 +491,13 @@ class Project(WrapperXml):
         """ Get instances list of project """
         return self._instanceslist
 
+    def invalidate_instances_index(self, oldname=None):
+        """ Forget instances name index and cached pins of instance
+            oldname, to call when an instance is renamed """
+        self._instancesdict = None
+        if oldname is not None:
+            self._pin_graph.forget_instance(oldname)
+
     @property
     def variable_ports(self):
         """ Get list of all variable ports available in project
@@ -548,7 +623,7 @@ class Project(WrapperXml):
     def availables_plat(cls):
         """ List all supported platforms names
         """
-        platformlist = sy.list_dir(SETTINGS.path + PLATFORMPATH)
+        platformlist = INDEX.list_dir(SETTINGS.path + PLATFORMPATH)
         return platformlist
 
     def del_instance(self, instancename):
@@ -566,6 +641,8 @@ class Project(WrapperXml):
                 comp.del_bus(instanceslavename=instancename)
         # Remove components from project
         self._instanceslist.remove(instance)
+        self._instancesdict = None
+        self._pin_graph.forget_instance(instance.instancename)
         self.reorder_instances(instance.name)
         self.del_subnode("components",
                          "component",
@@ -575,13 +652,61 @@ class Project(WrapperXml):
         DISPLAY.msg("Component " + instancename + " deleted")
         self.save()
 
+    @property
+    def in_batch(self):
+        """ True if a batch is running """
+        return self._batch_level > 0
+
+    def begin_batch(self):
+        """ Begin a batch, project saves are deferred until
+            the matching commit_batch()
+        """
+        self._batch_level = self._batch_level + 1
+
+    def commit_batch(self):
+        """ End a batch, deferred saves are done in one flush when the
+            outermost batch is committed
+        """
+        if self._batch_level == 0:
+            raise PodError("No batch begun", 0)
+        self._batch_level = self._batch_level - 1
+        if self._batch_level == 0 and self._save_pending:
+            try:
+                self.save()
+            except Exception:
+                # batch is kept open, its changes are not saved yet
+                self._batch_level = 1
+                raise
+
+    @contextmanager
+    def batch(self):
+        """ Context manager for batch mode:
+            with project.batch():
+                project.add_instance(...)
+                project.connect_bus(...)
+            If the body raises, the batch is left without saving,
+            deferred saves are done by the next save.
+        """
+        self.begin_batch()
+        try:
+            yield self
+        except BaseException:
+            self._batch_level = self._batch_level - 1
+            raise
+        self.commit_batch()
+
     def save(self):
-        """ Save the project """
+        """ Save the project, deferred while a batch is running """
+        if self._batch_level > 0:
+            self._save_pending = True
+            return
+        self._pin_graph.flush()
         for comp in self._instanceslist:
             comp.save()
         if self.simulation is not None:
             self.simulation.save()
         self.save_xml(self.projectpath + "/" + self.name + XMLEXT)
+        self._save_pending = False
 
     def connect_pin_cmd(self, pin_source, pin_dest):
         """ connect pin between two instances
@@ -646,28 +771,123 @@ class Project(WrapperXml):
 
     def generate_intercon(self, interfacedict):
         """ generate intercon for interface interface_name """
-        # test if intercon already exists
         from periphondemand.bin.code.intercon import Intercon
-        try:
-            intercon = self.get_instance(interfacedict["instance"] + "_" +
-                                         interfacedict["interface"] +
-                                         "_intercon")
-        except PodError:
-            pass
-        else:
-            self.del_instance(intercon.instancename)
         instance = self.get_instance(interfacedict["instance"])
         interface = instance.get_interface(interfacedict["interface"])
+        # test if intercon already exists
+        if self.del_old_intercon(interface):
+            return
 
         if len(interface.slaves) == 0:
             DISPLAY.msg(interfacedict["instance"] + "." +
                         interfacedict["interface"] +
                         " not generated because no slaves")
             return
-        intercon = Intercon(self, interface)
-        self.add_instance(component=intercon)
+        self.add_intercon(interface)
         self.save()
 
+    def add_intercon(self, interface):
+        """ Generate intercon of master interface and add it in project,
+            what a failed generation left is removed and any error is
+            raised as PodError
+        """
+        from periphondemand.bin.code.intercon import Intercon
+        intercon = Intercon(self, interface, generate=False)
+        try:
+            intercon.generate()
+        except Exception as error:
+            self.del_failed_intercon(intercon,
+                                     Intercon.intercon_name(interface))
+            if isinstance(error, PodError):
+                raise
+            raise PodError(Intercon.failure_message(interface, error), 0)
+        self.add_instance(component=intercon)
+
+    def del_failed_intercon(self, intercon, instancename):
+        """ Delete pins connections and directory of an intercon which
+            generation failed """
+        for interface in intercon.interfaces:
+            for port in interface.ports:
+                for pin in port.pins:
+                    for connection in list(pin.connections):
+                        pin_dest = self.get_instance(
+                            connection["instance_dest"]).get_interface(
+                                connection["interface_dest"]).get_port(
+                                    connection["port_dest"]).get_pin(
+                                        connection["pin_dest"])
+                        pin.del_connection_force(pin_dest)
+        directory = self.projectpath + COMPONENTSPATH + "/" + instancename
+        if sy.dir_exist(directory):
+            sy.rm_dir(directory)
+
+    def del_old_intercon(self, interface):
+        """ Delete intercon of master interface, unless bus configuration
+            didn't change since it was generated.
+            Return True if intercon is kept
+        """
+        from periphondemand.bin.code.intercon import Intercon
+        try:
+            intercon = self.get_instance(Intercon.intercon_name(interface))
+        except PodError:
+            return False
+        if len(interface.slaves) != 0 and\
+                Intercon.is_up_to_date(intercon, interface):
+            DISPLAY.msg("Intercon " + intercon.instancename +
+                        " is up to date")
+            return True
+        self.del_instance(intercon.instancename)
+        return False
+
+    def generate_intercons(self):
+        """ generate intercons of all master interfaces, project is
+            saved once. Intercons xml is generated one after the other,
+            their code is written by SETTINGS.jobs processes. Errors are
+            raised in one PodError at the end
+        """
+        from periphondemand.bin.code.intercon import Intercon
+        parallel = SETTINGS.jobs > 1 and sy.can_fork()
+        errors = []
+        with self.batch():
+            intercons = []
+            for interface in self.interfaces_master:
+                if self.del_old_intercon(interface):
+                    continue
+                if len(interface.slaves) == 0:
+                    DISPLAY.msg(interface.parent.instancename + "." +
+                                interface.name +
+                                " not generated because no slaves")
+                    continue
+                if not parallel:
+                    try:
+                        self.add_intercon(interface)
+                    except PodError as error:
+                        errors.append(error.message)
+                    continue
+                intercon = Intercon(self, interface, generate=False)
+                try:
+                    intercon.generate_xml(interface)
+                except Exception as error:
+                    self.del_failed_intercon(
+                        intercon, Intercon.intercon_name(interface))
+                    errors.append(Intercon.failure_message(interface,
+                                                           error))
+                    continue
+                intercons.append(intercon)
+            if intercons:
+                messages = Intercon.generate_codes(intercons,
+                                                  SETTINGS.jobs)
+                for intercon, message in zip(intercons, messages):
+                    if message is not None:
+                        self.del_failed_intercon(intercon,
+                                                 intercon.instancename)
+                        errors.append(message)
+                        continue
+                    DISPLAY.msg("Intercon with name : " +
+                                intercon.instancename + " Done")
+                    self.add_instance(component=intercon)
+        if errors:
+            raise PodError("\n".join(errors), 0)
+
     def connect_port(self, sourcedict, destdict):
         """ Connect all pins of a port source on all pins of
             port dest
@@ -766,8 +986,17 @@ class Project(WrapperXml):
         self.save()
 
     def check(self):
-        """ This function check all the project wiring
+        """ This function check all the project wiring,
+            return the list of problems found, each problem is a
+            dictionnary with a "type" key:
+            "unconnected"      -- slave interface without master
+                                  (instance, interface)
+            "window_overlap"   -- slaves addresses windows overlap
+                                  (master, slaves, address, size)
+            "register_conflict" -- registers at the same address
+                                  (master, address, registers)
         """
+        report = []
 
         ##########################################
         # Check connections on variable ports
@@ -783,49 +1012,34 @@ class Project(WrapperXml):
         ###########################################
         # check Busses, all slaves bus need a master
         listmaster = self.interfaces_master
-        listslave = self.interfaces_slave
-
-        # Delete all slaves component from listslave
+        connected = set()
         for master in listmaster:
             for slave in master.slaves:
-                for slave2 in listslave:
-                    if slave2.parent.instancename ==\
-                        slave.instancename and \
-                            slave2.name == slave.interfacename:
-                        listslave.remove(slave2)
+                connected.add((slave.instancename, slave.interfacename))
+        listslave = [slave for slave in self.interfaces_slave
+                     if (slave.parent.instancename, slave.name)
+                     not in connected]
 
         for slave in listslave:
             DISPLAY.msg(slave.parent.instancename +
                         " is not connected on a master bus", 1)
+            report.append({"type": "unconnected",
+                           "instance": slave.parent.instancename,
+                           "interface": slave.name})
         if len(listslave) != 0:
             DISPLAY.msg("Some slave bus are not connected", 1)
 
         ##########################################
         # Check bus address
-        dict_reg = {}
-        newmaster = []
         for master in listmaster:
-            if (master.name != "candroutput"):
-                newmaster.append(master)
-        for master in newmaster:
-            for slave in master.slaves:
-                for register in slave.get_interface().registers_map:
-                    if register["offset"] in dict_reg:
-                        DISPLAY.msg(
-                            "Register conflict at " +
-                            hex(register["offset"]) + " between " +
-                            str(slave.instancename) + "." +
-                            str(register["name"]) + " and " +
-                            str(dict_reg[register["offset"]][0]) + "." +
-                            str(dict_reg[register["offset"]][1]), 0)
-                        dict_reg[register["offset"]] =\
-                            (str(dict_reg[register["offset"]][0]) + "," +
-                             slave.instancename + "/!\\",
-                             str(dict_reg[register["offset"]][1]) + "," +
-                             register["name"] + "/!\\")
-                    else:
-                        dict_reg[register["offset"]] =\
-                            (slave.instancename, register["name"])
+            if master.name == "candroutput":
+                continue
+            mastername = master.parent.instancename + "." + master.name
+            interfaces = [slave.get_interface() for slave in master.slaves]
+            for problem in self._check_windows(interfaces) +\
+                    self._check_registers(interfaces):
+                problem["master"] = mastername
+                report.append(problem)
             DISPLAY.msg("")
             DISPLAY.msg("Mapping for interface " + master.name + ":")
             DISPLAY.msg("Address  | instance.interface             |" +
@@ -838,6 +1052,65 @@ class Project(WrapperXml):
                             " | " + "%10s" % register[2])
             DISPLAY.msg("----------------------------" +
                         "-----------------------------")
+        return report
+
+    @classmethod
+    def _check_windows(cls, interfaces):
+        """ Sweep slaves interfaces sorted by base address,
+            return the list of addresses windows overlaps.
+            Every interface must have a base address, else PodError
+            is raised """
+        problems = []
+        windows = sorted((interface.base_addr,
+                          interface.base_addr + interface.mem_size,
+                          interface.parent.instancename + "." +
+                          interface.name)
+                         for interface in interfaces)
+        active = []
+        for base, end, name in windows:
+            active = [window for window in active if window[1] > base]
+            for _, activeend, activename in active:
+                size = min(end, activeend) - base
+                if size <= 0:
+                    continue
+                DISPLAY.msg("Address windows of " + activename + " and " +
+                            name + " overlap at " + hex(base), 0)
+                problems.append({"type": "window_overlap",
+                                 "slaves": [activename, name],
+                                 "address": base,
+                                 "size": size})
+            active.append((base, end, name))
+        return problems
+
+    @classmethod
+    def _check_registers(cls, interfaces):
+        """ Sort registers by address, return the list of addresses
+            used by more than one register """
+        problems = []
+        registers = []
+        for interface in interfaces:
+            for register in interface.registers_map:
+                registers.append((int(register["offset"]), len(registers),
+                                  interface.parent.instancename + "." +
+                                  str(register["name"])))
+        registers.sort()
+        index = 0
+        while index < len(registers):
+            last = index
+            while last + 1 < len(registers) and\
+                    registers[last + 1][0] == registers[index][0]:
+                last = last + 1
+            if last > index:
+                names = [register[2] for register in
+                         registers[index:last + 1]]
+                DISPLAY.msg("Register conflict at " +
+                            hex(registers[index][0]) + " between " +
+                            " and ".join(names), 0)
+                problems.append({"type": "register_conflict",
+                                 "address": registers[index][0],
+                                 "registers": names})
+            index = last + 1
+        return problems
 
     @classmethod
     def get_simulation_toolchains(cls):
@@ -849,9 +1122,7 @@ class Project(WrapperXml):
     @classmethod
     def get_synthesis_toolchains(cls):
         """ list all toolchains availables """
-        filelist = sy.list_dir(SETTINGS.path +
-                               TOOLCHAINPATH + SYNTHESISPATH)
-        return filelist
+        return SYNTHESIS_PLUGINS.names
 
     @classmethod
     def get_driver_toolchains(cls):
@@ -875,8 +1146,8 @@ class Project(WrapperXml):
     def get_components_versions(self, libraryname, componentname):
         """ list component version name in archive
         """
-        filelist = sy.list_files(self.library.library_path(libraryname) +
-                                 "/" + componentname)
+        filelist = INDEX.list_files(self.library.library_path(libraryname) +
+                                    "/" + componentname)
         outlist = []
         for name in filelist:
             # take only xml file
@@ -5,6 +5,8 @@ import periphondemand
 
 # global
 POD_CONFIG = "~/.podrc"
+POD_INDEX = "~/.podindex"
+POD_SOCKET = "~/.podsocket"
 POD_PATH = periphondemand.__path__[0]
 PLATFORMPATH = "/platforms"
 BUSPATH = "/busses/"
@@ -38,6 +40,9 @@ DRIVERS_TEMPLATES_PATH = "/drivers_templates"
 # for project
 BINARYPROJECTPATH = "/binaries"
 OBJSPATH = "/objs"
+STOREPATH = "/.store"
+TOPFINGERPRINTFILE = "/top.fingerprint"
+SYNTHESISDIRSFILE = "/synthesis.dirs"
 BINARY_PREFIX = "top_"
 ALTERA_BINARY_SUFFIX = ".rbf"
 XILINX_BINARY_SUFFIX = ".bin"
@@ -31,8 +31,12 @@
 """ Starting point of POD """
 
 from periphondemand.bin.commandline.projectcli import ProjectCli
+from periphondemand.bin.commandline.scriptrunner import ScriptRunner
+from periphondemand.bin.commandline.podserver import PodServer
+from periphondemand.bin.define import POD_SOCKET
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils import wrappersystem as sy
+from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.version import VERSION
 
 import sys
@@ -40,7 +44,6 @@ import os
 import getopt
 
 SETTINGS = Settings()
-TMPFILENAME = "podtmp"
 
 
 def usage():
@@ -50,7 +53,12 @@ Usage: pod [OPTION...]
 
     -h, --help             give this help list
     -s, --source=filename  load a script
+    -b, --batch=filename   run a script without command loop, project
+                           is saved once at the end, exit status is 1
+                           if a command failed
     -l, --load=projectname load a project
+    -d, --daemon           keep POD loaded and run commands sent by podc
+                           on """ + POD_SOCKET + """
     -v, --version          print program version
 
 Report bugs to http://periphondemand.sourceforge.net/
@@ -60,10 +68,12 @@ Report bugs to http://periphondemand.sourceforge.net/
 def main(argv):
     """ Main command line prog for pod """
     try:
-        opts, _ = getopt.getopt(argv[1:], "hvs:l:", ["help",
-                                                     "version",
-                                                     "source=",
-                                                     "load="])
+        opts, _ = getopt.getopt(argv[1:], "hvs:l:b:d", ["help",
+                                                        "version",
+                                                        "source=",
+                                                        "load=",
+                                                        "batch=",
+                                                        "daemon"])
     except getopt.GetoptError as error:
         print(error)
         usage()
@@ -82,6 +92,35 @@ def main(argv):
     SETTINGS.projectpath = sy.pwd()
     SETTINGS.version = VERSION
 
+    # serve commands of podc clients
+    if "--daemon" in options or "-d" in options:
+        try:
+            server = PodServer(POD_SOCKET)
+        except (PodError, OSError) as error:
+            print(error)
+            sys.exit(1)
+        try:
+            server.serve()
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    # run script without command loop
+    if "--batch" in options or "-b" in options:
+        for opt, arg in opts:
+            if opt == "--batch" or opt == "-b":
+                argument = arg
+                break
+        runner = ScriptRunner(cli)
+        try:
+            runner.parse(argument)
+        except PodError as error:
+            print(error)
+            sys.exit(1)
+        runner.run()
+        print(runner.report())
+        sys.exit(runner.status)
+
     # load command file if in command params
     if "--source" in options or "-s" in options:
         for opt, arg in opts:
@@ -104,11 +143,8 @@ def main(argv):
                 usage()
                 return
 
-        tmpfile = open(TMPFILENAME, "w")
-        tmpfile.write("load " + argument)
-        tmpfile.close()
         print("Loading project " + argument + " :\n")
-        cli.do_source(TMPFILENAME)
+        cli.onecmd(cli.precmd("load " + argument))
 
     # infinite command loop
     cli.cmdloop()
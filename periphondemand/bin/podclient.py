@@ -0,0 +1,109 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     podclient.py
+# Purpose:  Thin client of the POD daemon
+#
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+#
+# Created:  18/10/2026
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" Send commands to the POD daemon started with pod -d and print its
+    output while commands run.
+
+    Only the standard library is imported here, POD itself is loaded once
+    in the daemon.
+"""
+
+import getopt
+import json
+import os
+import socket
+import sys
+
+from periphondemand.bin.define import POD_SOCKET
+
+
+def usage():
+    """ print podc arg usage """
+    print("""\
+Usage: podc [OPTION...] [COMMAND]
+
+    -h, --help             give this help list
+    -s, --source=filename  send commands of a script
+    -S, --socket=filename  daemon socket (default """ + POD_SOCKET + """)
+    -t, --timings          print commands timings
+    -k, --kill             stop the daemon
+
+Without command nor script, commands are read on standard input.
+""")
+
+
+def send(filename, request):
+    """ Send request to daemon listening on filename, print its output,
+        return exit status """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(os.path.expanduser(filename))
+    except OSError as error:
+        print("[ERROR]  : no POD daemon on " + filename + ": " + str(error))
+        return 2
+    status = 2
+    try:
+        client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        for line in client.makefile("rb"):
+            message = json.loads(line.decode("utf-8"))
+            if "out" in message:
+                sys.stdout.write(message["out"])
+                sys.stdout.flush()
+            else:
+                status = message["status"]
+    finally:
+        client.close()
+    return status
+
+
+def main(argv):
+    """ Main command line prog for podc """
+    try:
+        opts, args = getopt.getopt(argv[1:], "hs:S:tk", ["help",
+                                                         "source=",
+                                                         "socket=",
+                                                         "timings",
+                                                         "kill"])
+    except getopt.GetoptError as error:
+        print(error)
+        usage()
+        sys.exit(2)
+    filename = POD_SOCKET
+    request = {"cwd": os.getcwd(),
+               "color": 1 if sys.stdout.isatty() else 0}
+    lines = None
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            usage()
+            sys.exit(0)
+        elif opt in ("-s", "--source"):
+            try:
+                with open(arg, "r") as script:
+                    lines = script.readlines()
+            except IOError as error:
+                print("[ERROR]  : " + str(error))
+                sys.exit(2)
+        elif opt in ("-S", "--socket"):
+            filename = arg
+        elif opt in ("-t", "--timings"):
+            request["timings"] = True
+        elif opt in ("-k", "--kill"):
+            request["stop"] = True
+    if args:
+        lines = [" ".join(args)]
+    elif lines is None and not request.get("stop"):
+        lines = sys.stdin.readlines()
+    request["lines"] = lines or []
+    sys.exit(send(filename, request))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
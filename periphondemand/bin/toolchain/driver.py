@@ -25,7 +25,8 @@
 # ----------------------------------------------------------------------------
 """ Manage driver code generation """
 
-import re
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
 from periphondemand.bin.define import XMLEXT
 from periphondemand.bin.define import DRIVERSPATH
@@ -38,9 +39,23 @@ from periphondemand.bin.utils.wrapperxml import WrapperXml
 from periphondemand.bin.utils import wrappersystem as sy
 from periphondemand.bin.utils.display import Display
 
+from periphondemand.bin.code.drivertemplate import DriverTemplate
+
 SETTINGS = Settings()
 DISPLAY = Display()
 
+# (driver, component, templates) filled by the running pool, forked
+# workers inherit them
+_POOL_TASKS = []
+
+
+def _fill_component_templates(index):
+    """ process pool worker, fill templates of task number index.
+        return (messages, error)
+    """
+    driver, component, templatefiles = _POOL_TASKS[index]
+    return driver.fill_component_templates(component, templatefiles)
+
 
 class Driver(WrapperXml):
     """ Generate driver class """
@@ -81,159 +96,76 @@ class Driver(WrapperXml):
                     DISPLAY.msg("No driver for " + component.name)
 
     def fill_all_templates(self):
-        """ fill template """
+        """ fill template, components templates are filled by
+            SETTINGS.jobs processes """
         project = self.project
         op_sys = self.name
         if op_sys is None:
             raise PodError("Operating system must be selected", 0)
+        components = []
         for component in project.instances:
             if component.num == "0":
                 driver_template = component.get_driver_template(op_sys)
                 if driver_template is not None:
-                    DISPLAY.msg("Copy and fill template for " +
-                                component.name)
-                    for templatefile in driver_template.template_names:
-                        try:
-                            template = open(
-                                self.project.projectpath + COMPONENTSPATH +
-                                "/" + component.instancename + "/" +
-                                DRIVERS_TEMPLATES_PATH + "/" +
-                                op_sys + "/" +
-                                templatefile, "r")
-                            destfile = open(
-                                self.project.projectpath + DRIVERSPATH + "/" +
-                                component.name + "/" + templatefile,
-                                "w")
-                        except IOError as error:
-                            raise PodError(str(error), 0)
-                        self.fill_template(template, destfile, component)
-                        template.close()
-                        destfile.close()
-
-    def fill_template_for_each_instance(self, template, component):
-        """ fill template for each instance of component """
-        out = ""
-        for instance in\
-                self.project.get_instances_list_of_component(component.name):
-            for writeline in template.split("\n"):
-                # instance_name
-                writeline = re.sub(r'\/\*\$instance_name\$\*\/',
-                                   instance.instancename.upper(),
-                                   writeline)
-                # instance_num
-                writeline = re.sub(r'\/\*\$instance_num\$\*\/',
-                                   instance.num,
-                                   writeline)
-                # generic:generic_name
-                exp = re.compile(r'\/\*\$generic\:(.*?)\$\*\/')
-                iterator = exp.finditer(writeline)
-                for generic in iterator:
-                    writeline = re.sub(
-                        r'\/\*\$generic:' + generic.group(1) + r'\$\*\/',
-                        instance.get_generic(generic.group(1)).value,
-                        writeline)
-                # register_base_address:interface_name
-                exp = re.compile(r'\/\*\$registers_base_address:(.*?)\$\*\/')
-                iterator = exp.finditer(writeline)
-                for interface in iterator:
-                    writeline = re.sub(
-                        r'\/\*\$registers_base_address:' +
-                        interface.group(1) + r'\$\*\/',
-                        hex(instance.get_interface(
-                            interface.group(1)).base_addr),
-                        writeline)
-                # register:interfacename:registername:attribute
-                exp = re.compile(r'\/\*\$register:(.*?):(.*?):(.*?)\$\*\/')
-                iterator = exp.finditer(writeline)
-                for match in iterator:
-                    attributevalue = instance.get_interface(
-                        match.group(1)).get_register(
-                            match.group(2)).get_attr_value(
-                                match.group(3))
-                    if not attributevalue:
-                        raise PodError(
-                            "Wrong register value -> " +
-                            match.group(1) + ":" + match.group(2) +
-                            ":" + match.group(3) + "\n", 0)
-                    writeline = re.sub(
-                        r'\/\*\$register:' + match.group(1) +
-                        r':' + match.group(2) + r':' +
-                        match.group(3) + r'\$\*\/',
-                        attributevalue, writeline)
-                # interrupt_number
-                if re.search(r'\/\*\$interrupt_number\$\*\/',
-                             writeline) is not None:
-                    interruptlist = instance.interrupts
-                    if len(interruptlist) == 0:
-                        raise PodError("No interruption port in " +
-                                       instance.instancename, 0)
-                    elif len(interruptlist) > 1:
-                        DISPLAY.msg(
-                            "More than one interrupt port in " +
-                            instance.instancename +
-                            "." + interruptlist[0].name + " is used")
-                    interruptport = interruptlist[0]
-
-                    try:
-                        connect = interruptport.get_pin(0).connections
-                    except PodError:
-                        raise PodError(
-                            "Interrupt " + interruptport.name +
-                            " not connected in " +
-                            interruptport.parent.parent.instancename +
-                            "." + interruptport.parent.name, 0)
-                    if len(connect) == 0:
-                        raise PodError("Interrupt " + interruptport.name +
-                                       " is not connected", 0)
-                    elif len(connect) > 1:
-                        DISPLAY.msg(
-                            "More than one connection for interruption port " +
-                            interruptport.name + ". " +
-                            connect[0]["port_dest"] + " is used")
-                    writeline = re.sub(r'\/\*\$interrupt_number\$\*\/',
-                                       connect[0]["pin_dest"],
-                                       writeline)
-                out = out + writeline + "\n"
-        return out
-
-    def fill_template(self, template, destfile, component):
-        """ fill template file """
-        project = self.project
-        state = "STANDARD"
-        foreach_template = ""
-
-        for line in template:
-            if state == "STANDARD":
-                begintag = re.match(r'^\/\*\$foreach\:instance\$\*\/', line)
-                if begintag is not None:
-                    state = "FOREACH_INSTANCE"
-                    foreach_template = ""
-                    continue
-                # number_of_instances
-                if re.search(r'\/\*\$number_of_instances\$\*\/',
-                             line) is not None:
-                    instances_list =\
-                        project.get_instances_list_of_component(
-                            component.name)
-                    line = re.sub(r'\/\*\$number_of_instances\$\*\/',
-                                  str(len(instances_list)),
-                                  line)
-                # main clock speed
-                if re.search(r'\/\*\$main_clock\$\*\/', line) is not None:
-                    frequency = project.platform.main_clock
-                    line = re.sub(r'\/\*\$main_clock\$\*\/', frequency, line)
-                destfile.write(line)
-            elif state == "FOREACH_INSTANCE":
-                endtag = re.match(r'^\/\*\$foreach\:instance\:end\$\*\/', line)
-                if endtag is not None:
-                    state = "STANDARD"
-                    destfile.write(
-                        self.fill_template_for_each_instance(foreach_template,
-                                                             component))
-                else:
-                    foreach_template = foreach_template + line
-            else:
-                raise PodError("State error in toolchain driver\n", 0)
+                    components.append(
+                        (component, driver_template.template_names))
+        if SETTINGS.jobs > 1 and sy.can_fork():
+            results = self.fill_templates_pool(components)
+        else:
+            results = [self.fill_component_templates(*task)
+                       for task in components]
+        errors = []
+        for (component, _), (messages, error) in zip(components, results):
+            DISPLAY.msg("Copy and fill template for " + component.name)
+            for message in messages:
+                DISPLAY.msg(*message)
+            if error is not None:
+                errors.append(error)
+        if len(errors) == 1:
+            raise errors[0]
+        elif errors:
+            raise PodError("\n".join([error.message for error in errors]), 0)
+
+    def fill_templates_pool(self, components):
+        """ fill (component, templates) list with a pool of SETTINGS.jobs
+            forked processes, each one writing its own component driver
+            directory. Return the list of (messages, error)
+        """
+        global _POOL_TASKS
+        _POOL_TASKS = [(self, component, templatefiles)
+                       for component, templatefiles in components]
+        context = multiprocessing.get_context("fork")
+        try:
+            with ProcessPoolExecutor(max_workers=SETTINGS.jobs,
+                                     mp_context=context) as executor:
+                return list(executor.map(_fill_component_templates,
+                                         range(len(components))))
+        finally:
+            _POOL_TASKS = []
+
+    def fill_component_templates(self, component, templatefiles):
+        """ fill templatefiles of component,
+            return (messages, error) """
+        messages = []
+        try:
+            for templatefile in templatefiles:
+                template = DriverTemplate.load(
+                    self.project.projectpath + COMPONENTSPATH +
+                    "/" + component.instancename + "/" +
+                    DRIVERS_TEMPLATES_PATH + "/" +
+                    self.name + "/" + templatefile)
+                code = template.render(self.project, component, messages)
+                try:
+                    destfile = open(
+                        self.project.projectpath + DRIVERSPATH + "/" +
+                        component.name + "/" + templatefile, "w")
+                except IOError as error:
+                    raise PodError(str(error), 0)
+                destfile.write(code)
+                destfile.close()
+        except PodError as error:
+            return (messages, error)
+        return (messages, None)
 
     def copy_bsp_drivers(self):
         """ delete all directories under POD dir, then copy
@@ -27,13 +27,13 @@
 
 from periphondemand.bin.define import XMLEXT
 from periphondemand.bin.define import SIMULATIONPATH
-from periphondemand.bin.define import TOOLCHAINPATH
 
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils.wrapperxml import WrapperXml
 from periphondemand.bin.utils import wrappersystem as sy
 from periphondemand.bin.utils.display import Display
 from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.utils.plugins import SIMULATION_PLUGINS
 
 SETTINGS = Settings()
 DISPLAY = Display()
@@ -68,33 +68,11 @@ class Simulation(WrapperXml):
 
     def generate_template(self):
         """ Generate simulation template """
-        import sys
-        sys.path.append(SETTINGS.path + TOOLCHAINPATH +
-                        SIMULATIONPATH + "/" + self.name)
-        try:
-            plugin = __import__(self.name)
-        except ImportError as error:
-            sys.path.remove(SETTINGS.path + TOOLCHAINPATH +
-                            SIMULATIONPATH + "/" + self.name)
-            raise PodError(str(error), 0)
-        sys.path.remove(SETTINGS.path + TOOLCHAINPATH +
-                        SIMULATIONPATH + "/" + self.name)
-        return plugin.generate_template()
+        return SIMULATION_PLUGINS.get(self.name).generate_template()
 
     def generate_makefile(self):
         """ Generate simulation makefile """
-        import sys
-        sys.path.append(SETTINGS.path + TOOLCHAINPATH +
-                        SIMULATIONPATH + "/" + self.name)
-        try:
-            plugin = __import__(self.name)
-        except ImportError as error:
-            sys.path.remove(SETTINGS.path + TOOLCHAINPATH +
-                            SIMULATIONPATH + "/" + self.name)
-            raise PodError(str(error), 0)
-        sys.path.remove(SETTINGS.path + TOOLCHAINPATH +
-                        SIMULATIONPATH + "/" + self.name)
-        return plugin.generate_makefile()
+        return SIMULATION_PLUGINS.get(self.name).generate_makefile()
 
     def save(self):
         """ save project """
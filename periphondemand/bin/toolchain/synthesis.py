@@ -25,22 +25,31 @@
 # ----------------------------------------------------------------------------
 """ Synthesis toolchain """
 
+import os
+
 from periphondemand.bin.define import SYNTHESISPATH
 from periphondemand.bin.define import TCLEXT
 from periphondemand.bin.define import OBJSPATH
 from periphondemand.bin.define import VHDLEXT
 from periphondemand.bin.define import COMPONENTSPATH
+from periphondemand.bin.define import SYNTHESISDIRSFILE
 
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils import wrappersystem as sy
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.utils.display import Display
-
-import importlib
+from periphondemand.bin.utils.plugins import SYNTHESIS_PLUGINS
 
 SETTINGS = Settings()
 DISPLAY = Display()
 
+# how generate_project put hdl files in synthesis directory:
+# copy: directories are deleted and all files copied again
+# sync: only changed files are copied, stale files are deleted
+# link: like sync, with hard links instead of copies when possible
+# mode is saved in project synthesis_sync_mode attribute
+SYNC_MODES = ["copy", "sync", "link"]
+
 
 class Synthesis(object):
     """ Synthesis tool generator
@@ -55,6 +64,44 @@ class Synthesis(object):
         """ Return parent object """
         return self._parent
 
+    @property
+    def sync_mode(self):
+        """ Get how hdl files are put in synthesis directory """
+        mode = self.project.get_attr_value("synthesis_sync_mode")
+        if mode is None:
+            return "copy"
+        return mode
+
+    @sync_mode.setter
+    def sync_mode(self, mode):
+        """ Set how hdl files are put in synthesis directory """
+        if mode not in SYNC_MODES:
+            raise PodError("Unknown synchronisation mode " + str(mode) +
+                           ", modes are " + ", ".join(SYNC_MODES), 0)
+        self.project.set_attr("synthesis_sync_mode", mode)
+
+    @property
+    def generated_dirs_filename(self):
+        """ Get file name of components directories list written by last
+            generate_project """
+        return self.project.projectpath + OBJSPATH + SYNTHESISDIRSFILE
+
+    @property
+    def generated_dirs(self):
+        """ Get components directories written by last generate_project """
+        try:
+            with open(self.generated_dirs_filename, "r") as afile:
+                return [name for name in afile.read().split("\n") if name]
+        except IOError:
+            return []
+
+    @generated_dirs.setter
+    def generated_dirs(self, names):
+        """ Record components directories written by generate_project """
+        if sy.dir_exist(os.path.dirname(self.generated_dirs_filename)):
+            with open(self.generated_dirs_filename, "w") as afile:
+                afile.write("".join([name + "\n" for name in names]))
+
     @classmethod
     def constraints_file_extension(cls):
         """ return file constraints extension
@@ -302,8 +349,13 @@ class Synthesis(object):
     def generate_project(self):
         """ copy all hdl file in synthesis project directory
         """
+        if self.sync_mode != "copy":
+            self.sync_project()
+            return
+        names = []
         for component in self.parent.instances:
             if component.num == "0":
+                names.append(component.name)
                 # Make directory
                 compdir = self.parent.projectpath +\
                     SYNTHESISPATH + "/" +\
@@ -325,6 +377,39 @@ class Synthesis(object):
                     except IOError as error:
                         print(DISPLAY)
                         raise PodError(str(error), 0)
+        self.generated_dirs = names
+
+    def sync_project(self):
+        """ copy changed hdl files in synthesis project directory and
+            delete files and components directories no more used.
+            Only directories written by an earlier generate_project are
+            deleted, synthesis tools directories are kept
+        """
+        synthesisdir = self.parent.projectpath + SYNTHESISPATH
+        names = []
+        for component in self.parent.instances:
+            if component.num == "0":
+                names.append(component.name)
+                filepaths = [self.parent.projectpath + COMPONENTSPATH +
+                             "/" + component.instancename + "/hdl/" +
+                             hdlfile.filename
+                             for hdlfile in component.hdl_files]
+                try:
+                    copied, deleted = sy.sync_dir(
+                        filepaths, synthesisdir + "/" + component.name,
+                        link=(self.sync_mode == "link"))
+                except (IOError, OSError) as error:
+                    raise PodError(str(error), 0)
+                DISPLAY.msg("Synchronize directory for " + component.name +
+                            " : " + str(len(copied)) + " copied, " +
+                            str(len(deleted)) + " deleted")
+        for directory in self.generated_dirs:
+            if directory not in names and\
+                    sy.dir_exist(synthesisdir + "/" + directory):
+                DISPLAY.msg("Directory " + synthesisdir + "/" + directory +
+                            " no more used, will be deleted")
+                sy.rm_dir(synthesisdir + "/" + directory)
+        self.generated_dirs = names
 
 #    def generate_pinout(self, filename):
 #        """ Generate pinout constraints file """
@@ -337,10 +422,8 @@ class Synthesis(object):
 
 def synthesis_factory(parent, toolchainname):
     """ return the toolchain object """
-    base_lib = "periphondemand.toolchains.synthesis"
     module_name = str.upper(toolchainname[0]) + toolchainname[1:]
-    module = importlib.import_module(base_lib + "." + toolchainname + "." +
-                                     toolchainname)
+    module = SYNTHESIS_PLUGINS.get(toolchainname)
     my_class = getattr(module, module_name)
 
     return my_class(parent)
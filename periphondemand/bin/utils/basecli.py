@@ -12,6 +12,7 @@
 # ----------------------------------------------------------------------------
 """Basic Command Line Interface"""
 
+import bisect
 import cmd
 import re
 import os
@@ -24,9 +25,35 @@ from periphondemand.bin.define import BASE_PROMPT
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils import wrappersystem as sy
+from periphondemand.bin.utils.dirindex import INDEX
+from periphondemand.bin.utils.wrapperxml import XmlDocument
+
+from periphondemand.bin.core.allocmem import ALLOC_STRATEGIES
+from periphondemand.bin.toolchain.synthesis import SYNC_MODES
 
 SETTINGS = Settings()
 
+# completion lists read from directories are not cached, directories
+# listings are already kept by dirindex
+UNCACHED_COMPLETIONS = ["libraryname", "componentname", "componentversion",
+                        "platformlib", "platformname", "simulationtoolchain",
+                        "synthesistoolchain", "drivertoolchain"]
+
+
+class PrefixIndex(object):
+    """ Sorted completion names, names beginning with a prefix are found
+        by bisection
+    """
+
+    def __init__(self, names):
+        self.names = sorted(set(names))
+
+    def startswith(self, prefix):
+        """ return names beginning with prefix """
+        start = bisect.bisect_left(self.names, prefix)
+        end = bisect.bisect_left(self.names, prefix + chr(0x10ffff), start)
+        return self.names[start:end]
+
 
 class BaseCli(cmd.Cmd):
     """ Command line management """
@@ -56,6 +83,11 @@ class BaseCli(cmd.Cmd):
         self.continuation_prompt = ""
         self._locals = {}
         self._globals = {}
+        # completion lists, valid while project and xml trees are the same
+        self._completions = {}
+        self._completions_stamp = None
+        # an error was printed by a command
+        self.failed = False
 
     def finishStatement(self, firstline):
         """ finish the statement """
@@ -69,6 +101,15 @@ class BaseCli(cmd.Cmd):
         # but statementHasEnded needs a string arg; anyway, we're getting
         # user input and users are slow.
 
+    def print_error(self, error):
+        """ Print error of a command, command failed even if error is a
+            warning: the command was refused """
+        print(error)
+        cli = self
+        while cli is not None:
+            cli.failed = True
+            cli = cli.parent
+
     def write(self, message):
         """ Write a message """
         self.stdout.write(message)
@@ -129,6 +170,11 @@ class BaseCli(cmd.Cmd):
                         line = self.pseudo_input(self.prompt)
                     line = self.precmd(line)
                     if line == "exit":
+                        try:
+                            self.commit_batches()
+                        except PodError as error:
+                            print(error)
+                            continue
                         sys.exit(0)
                     if SETTINGS.is_script():
                         print("$ " + line)
@@ -252,6 +298,13 @@ class BaseCli(cmd.Cmd):
         """Do nothing on empty line."""
         pass
 
+    def commit_batches(self):
+        """ Commit batches left open in project, deferred saves are done.
+            Raise PodError if project can't be saved """
+        if self._project is not None:
+            while self._project.in_batch:
+                self._project.commit_batch()
+
     def do_quit(self, arg):
         """Exits from the command line interpreter.\n"""
         return True
@@ -290,6 +343,8 @@ class BaseCli(cmd.Cmd):
 
     def completelist(self, line, text, alist):
         """ Complete list """
+        if isinstance(alist, PrefixIndex):
+            return alist.startswith(text)
         completion = [a for a in alist if a.startswith(text)]
         return completion
 
@@ -315,9 +370,29 @@ class BaseCli(cmd.Cmd):
             if i < len(subargline) - 1:
                 listargs.append([subargt, subargl])
             else:
-                return self.completelist(line, text,
-                                         self.listcompletion(listargs,
-                                                             subargl, subargt))
+                return self.completelist(
+                    line, text,
+                    self.cached_listcompletion(listargs, subargl, subargt))
+
+    def cached_listcompletion(self, listargs, subargl, subargt):
+        """ return listcompletion list, lists computed from project are
+            kept until project or its xml trees change
+        """
+        if subargt in UNCACHED_COMPLETIONS:
+            return self.listcompletion(listargs, subargl, subargt)
+        if self._completions_stamp is None or\
+                self._completions_stamp[0] is not self._project or\
+                self._completions_stamp[1] != XmlDocument.mutations:
+            self._completions = {}
+        key = (subargt, tuple([tuple(arg) for arg in listargs]))
+        completion = self._completions.get(key)
+        if completion is None:
+            completion = PrefixIndex(
+                self.listcompletion(listargs, subargl, subargt))
+            # listcompletion can load lazy components or wire busses
+            self._completions_stamp = (self._project, XmlDocument.mutations)
+            self._completions[key] = completion
+        return completion
 
     def listcompletion(self, listargs, subargl, subargt):
         """ return a list of possibility using template:
@@ -340,6 +415,8 @@ simulationtoolchain: give list of toolchain available for simulation
 drivertoolchain    : give list of toolchain available for driver
 synthesistoolchain : give list of toolchain available for synthesis
 forcename          : give list of pin where value can be forced
+allocstrategy      : give list of bus address allocation strategies
+syncmode           : give list of synthesis files synchronisation modes
 IO_name            : give list of platform IO pin name
 fpga_attributes    : give list of fpga attributes in platform
         """
@@ -415,6 +492,10 @@ fpga_attributes    : give list of fpga attributes in platform
             return arglist
         elif subargt == "forcestate":
             return ["gnd", "vcc", "undef"]
+        elif subargt == "allocstrategy":
+            return ALLOC_STRATEGIES
+        elif subargt == "syncmode":
+            return SYNC_MODES
         elif subargt == "componentname":
             try:
                 libraryname.lower()
@@ -443,7 +524,7 @@ fpga_attributes    : give list of fpga attributes in platform
             else:
                 return [platformlib + "." + name
                         for name in
-                        sy.list_files(
+                        INDEX.list_files(
                             SETTINGS.get_platform_lib_path(platformlib))]
 
         elif subargt == "genericname":
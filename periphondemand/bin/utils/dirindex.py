@@ -0,0 +1,111 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     dirindex.py
+# Purpose:  Persistent index of libraries and platforms directories
+#
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+#
+# Created:  18/10/2026
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" Persistent index of directories content.
+
+    Directories listings are kept in memory and in a json file, a
+    directory is read again only when its modification time changed, that
+    is when an entry was added, removed or renamed in it. The json file is
+    written at exit, when some listings were read.
+"""
+
+import atexit
+import json
+import os
+import time
+
+from periphondemand.bin.define import POD_INDEX
+
+# change it when the index file layout changes
+INDEX_VERSION = 1
+# directories changed less than RACY_DELAY ns ago are read again
+RACY_DELAY = 2000000000
+
+
+class DirIndex(object):
+    """ Directories listings index
+        attributes:
+            filename -- json file where index is kept
+    """
+
+    def __init__(self, filename):
+        self.filename = os.path.expanduser(filename)
+        self._entries = None
+        self._changed = False
+
+    def _load(self):
+        """ read index file """
+        self._entries = {}
+        try:
+            with open(self.filename, "r") as afile:
+                content = json.load(afile)
+            if content.get("version") == INDEX_VERSION:
+                self._entries = content["entries"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def save(self):
+        """ write index file if listings were read, entries of deleted
+            directories are dropped. Index is only a cache so errors are
+            ignored """
+        if not self._changed:
+            return
+        self._changed = False
+        for dirpath in list(self._entries):
+            if not os.path.isdir(dirpath):
+                del self._entries[dirpath]
+        tmpname = self.filename + ".tmp." + str(os.getpid())
+        try:
+            with open(tmpname, "w") as afile:
+                json.dump({"version": INDEX_VERSION,
+                           "entries": self._entries}, afile)
+            os.replace(tmpname, self.filename)
+        except OSError:
+            try:
+                os.remove(tmpname)
+            except OSError:
+                pass
+
+    def entry(self, dirpath):
+        """ Return [mtime, names, directories] of dirpath, names of not
+            hidden entries are in os.listdir order """
+        if self._entries is None:
+            self._load()
+        dirpath = os.path.abspath(os.path.expanduser(dirpath))
+        mtime = os.stat(dirpath).st_mtime_ns
+        entry = self._entries.get(dirpath)
+        if entry is not None and entry[0] == mtime:
+            return entry
+        names = [name for name in os.listdir(dirpath)
+                 if not name.startswith(".")]
+        directories = [name for name in names
+                       if os.path.isdir(os.path.join(dirpath, name))]
+        # a directory changed in the same clock tick as it is read
+        # could change again with the same modification time
+        if time.time_ns() - mtime < RACY_DELAY:
+            mtime = None
+        entry = [mtime, names, directories]
+        self._entries[dirpath] = entry
+        self._changed = True
+        return entry
+
+    def list_dir(self, dirpath):
+        """ list directories in dirpath, like wrappersystem.list_dir """
+        return list(self.entry(dirpath)[2])
+
+    def list_files(self, dirpath):
+        """ list files and directories in dirpath, like
+            wrappersystem.list_files """
+        return list(self.entry(dirpath)[1])
+
+
+INDEX = DirIndex(POD_INDEX)
+atexit.register(INDEX.save)
@@ -0,0 +1,153 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     plugins.py
+# Purpose:  Find and import busses and toolchains plugins
+#
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+#
+# Created:  18/10/2026
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" Registries of busses and toolchains code generation plugins.
+
+    Plugins are found once, in POD directory <dir>/<name>/<name>.py and
+    in the python entry points group of the registry. A plugin module is
+    imported the first time it is asked then kept.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+from importlib import metadata
+
+from periphondemand.bin.define import BUSPATH
+from periphondemand.bin.define import TOOLCHAINPATH
+from periphondemand.bin.define import SIMULATIONPATH
+from periphondemand.bin.define import SYNTHESISPATH
+
+from periphondemand.bin.utils.settings import Settings
+from periphondemand.bin.utils.poderror import PodError
+
+SETTINGS = Settings()
+
+
+def entry_points(group):
+    """ Get entry points of group, python < 3.10 has no group argument
+        and gives a dictionnary of groups """
+    try:
+        return metadata.entry_points(group=group)
+    except TypeError:
+        return metadata.entry_points().get(group, [])
+
+
+class PluginRegistry(object):
+    """ Plugins of one kind
+        attributes:
+            kind      -- plugin kind used in messages
+            directory -- plugins directory, relative to POD path
+            package   -- python package of plugins directory, plugins are
+                         imported from their file if None
+            group     -- entry points group of out-of-tree plugins
+    """
+
+    def __init__(self, kind, directory, group, package=None):
+        self.kind = kind
+        self.directory = directory
+        self.group = group
+        self.package = package
+        self._sources = None
+        self._modules = {}
+
+    def discover(self):
+        """ Scan plugins directory and entry points again """
+        sources = {}
+        directory = SETTINGS.path + self.directory
+        if os.path.isdir(directory):
+            for name in sorted(os.listdir(directory)):
+                filename = os.path.join(directory, name, name + ".py")
+                if not name.startswith((".", "_")) and\
+                        os.path.isfile(filename):
+                    sources[name] = filename
+        for entry_point in entry_points(self.group):
+            sources.setdefault(entry_point.name, entry_point)
+        self._sources = sources
+
+    @property
+    def sources(self):
+        """ Get plugins sources, key is plugin name """
+        if self._sources is None:
+            self.discover()
+        return self._sources
+
+    @property
+    def names(self):
+        """ Get sorted plugins names """
+        return sorted(set(self.sources) | set(self._modules))
+
+    def register(self, name, module):
+        """ Register an already imported module as plugin name """
+        self._modules[name] = module
+
+    def get(self, name):
+        """ Get the plugin module name, import it if needed """
+        module = self._modules.get(name)
+        if module is not None:
+            return module
+        source = self.sources.get(name)
+        if source is None:
+            raise PodError("No " + self.kind + " plugin named " + name, 0)
+        try:
+            if not isinstance(source, str):
+                module = source.load()
+            elif self.package is not None:
+                module = importlib.import_module(
+                    self.package + "." + name + "." + name)
+            else:
+                module = self._import_file(self.module_name(name), source)
+        except ImportError as error:
+            raise PodError(str(error), 0)
+        self._modules[name] = module
+        return module
+
+    def module_name(self, name):
+        """ Get the sys.modules key of plugin name imported from its file,
+            plugins names can't hide other modules """
+        return "periphondemand_plugin_" + self.kind + "_" + name
+
+    @classmethod
+    def _import_file(cls, name, filename):
+        """ import module name from filename """
+        module = sys.modules.get(name)
+        if module is not None and\
+                getattr(module, "__file__", None) == filename:
+            return module
+        spec = importlib.util.spec_from_file_location(name, filename)
+        if spec is None:
+            raise ImportError("Can't import " + filename)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+        return module
+
+    def directory_of(self, name):
+        """ Get the directory where plugin name files are """
+        source = self.sources.get(name)
+        if isinstance(source, str):
+            return os.path.dirname(source)
+        return os.path.dirname(self.get(name).__file__)
+
+
+BUS_PLUGINS = PluginRegistry("bus", BUSPATH, "periphondemand.busses")
+SYNTHESIS_PLUGINS = PluginRegistry("synthesis", TOOLCHAINPATH + SYNTHESISPATH,
+                                   "periphondemand.synthesis",
+                                   package="periphondemand.toolchains." +
+                                   "synthesis")
+SIMULATION_PLUGINS = PluginRegistry("simulation",
+                                    TOOLCHAINPATH + SIMULATIONPATH,
+                                    "periphondemand.simulation")
@@ -53,6 +53,10 @@ class PodError(Exception):
     def __repr__(self):
         return self.message
 
+    def __reduce__(self):
+        """ keep level when error is sent between processes """
+        return (self.__class__, (self.message, self.level))
+
     @property
     def message(self):
         """ get message """
@@ -49,6 +49,10 @@ class Settings(object):
             self.script = 0
             self.projectpath = None
             self.color_status = 1
+            # number of processes writing intercons code and drivers
+            self.jobs = 1
+            # number of processes parsing instances files on project load
+            self.load_jobs = 1
             # init personnal libraries path:
             try:
                 self.configfile = ConfigFile(POD_CONFIG)
@@ -88,6 +92,26 @@ class Settings(object):
         """ set color status """
         self.color_status = value
 
+    def set_jobs(self, value):
+        """ set number of processes writing intercons and drivers """
+        try:
+            jobs = int(value)
+        except ValueError:
+            raise PodError("Wrong number of jobs " + str(value), 0)
+        if jobs < 1:
+            raise PodError("Number of jobs must be at least 1", 0)
+        self.jobs = jobs
+
+    def set_load_jobs(self, value):
+        """ set number of processes parsing project files """
+        try:
+            jobs = int(value)
+        except ValueError:
+            raise PodError("Wrong number of jobs " + str(value), 0)
+        if jobs < 1:
+            raise PodError("Number of jobs must be at least 1", 0)
+        self.load_jobs = jobs
+
     def get_directory(self, sub_dir=None):
         """ get directory """
         if sub_dir:
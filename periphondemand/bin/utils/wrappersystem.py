@@ -29,10 +29,13 @@
 import os  # rename, copyfile, ...
 import re  # regexp
 import shutil
+import stat
 from os.path import join
 from os.path import split
 from os.path import exists
 import glob
+import hashlib
+import multiprocessing
 from periphondemand.bin.utils.poderror import PodError
 
 
@@ -110,6 +113,12 @@ def cmd_exist(commandname):
         return 1
 
 
+def can_fork():
+    """ test if processes can be forked, pool workers then inherit
+        the project in memory """
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
 def rename_file(oldfilepath, newfilepath):
     """ rename file
     """
@@ -160,6 +169,71 @@ def cp_dir(source, target):
             shutil.copyfile(from_, to_)
 
 
+def store_file(filepath, storepath):
+    """ Put a read only copy of filepath in content addressed store
+        directory storepath if not already there, return the stored
+        file name
+    """
+    digest = hashlib.sha1()
+    with open(filepath, "rb") as afile:
+        for block in iter(lambda: afile.read(65536), b""):
+            digest.update(block)
+    blobdir = join(storepath, digest.hexdigest()[:2])
+    blobpath = join(blobdir, digest.hexdigest())
+    if not exists(blobpath):
+        if not exists(blobdir):
+            os.makedirs(blobdir)
+        shutil.copyfile(filepath, blobpath + ".tmp")
+        os.chmod(blobpath + ".tmp", stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        os.replace(blobpath + ".tmp", blobpath)
+    return blobpath
+
+
+def cp_dir_stored(source, target, storepath, materialize=(".xml",)):
+    """ Copy directory like cp_dir, but files are hard links to their
+        content in store directory storepath. Top level files with an
+        extension in materialize are copied, they are instance files.
+        Linked files are shared by all instances of a component, they
+        are read only: an editor replacing the file gives the instance
+        its own copy, an in place write is refused.
+    """
+    source = os.path.expanduser(source).rstrip("/")
+    target = os.path.expanduser(target)
+    target = target + "/" + source.split("/")[-1]
+    if not os.path.exists(target):
+        os.mkdir(target)
+    for root, dirs, files in os.walk(source):
+        if '.svn' in dirs:
+            dirs.remove('.svn')  # don't visit .svn directories
+        for afile in files:
+            from_ = join(root, afile)
+            to_ = target + from_[len(source):]
+            to_directory = split(to_)[0]
+            if not exists(to_directory):
+                os.makedirs(to_directory)
+            if root == source and afile.endswith(materialize):
+                shutil.copyfile(from_, to_)
+                continue
+            blobpath = store_file(from_, storepath)
+            rm_file(to_)
+            try:
+                os.link(blobpath, to_)
+            except OSError:
+                shutil.copyfile(blobpath, to_)
+
+
+def prune_store(storepath):
+    """ Delete stored files no more linked by any instance """
+    if not os.path.isdir(storepath):
+        return
+    for blobdir in os.listdir(storepath):
+        for blob in os.listdir(join(storepath, blobdir)):
+            if os.stat(join(storepath, blobdir, blob)).st_nlink < 2:
+                os.remove(join(storepath, blobdir, blob))
+        if os.listdir(join(storepath, blobdir)) == []:
+            os.rmdir(join(storepath, blobdir))
+
+
 def copy_all_files(source, target):
     """ Copy all file in directory to another directory
     """
@@ -177,6 +251,77 @@ def cp_file(filepath, dirpath):
     return shutil.copy(filepath, dirpath + "/")
 
 
+def same_file(filepath, targetpath):
+    """ test if targetpath has the same content as filepath, files with
+        the same size and modification time are not read """
+    try:
+        source = os.stat(filepath)
+        target = os.stat(targetpath)
+    except OSError:
+        return False
+    if source.st_size != target.st_size:
+        return False
+    if source.st_mtime_ns == target.st_mtime_ns or\
+            os.path.samefile(filepath, targetpath):
+        return True
+    with open(filepath, "rb") as sourcefile:
+        with open(targetpath, "rb") as targetfile:
+            while True:
+                block = sourcefile.read(65536)
+                if block != targetfile.read(65536):
+                    return False
+                if not block:
+                    return True
+
+
+def sync_file(filepath, dirpath, link=False):
+    """ Copy file from filepath to dirpath if it changed, hard link it
+        instead of copying if link is True.
+        return True if file was copied
+    """
+    filepath = os.path.expanduser(filepath)
+    targetpath = os.path.join(os.path.expanduser(dirpath),
+                              os.path.basename(filepath))
+    if same_file(filepath, targetpath):
+        return False
+    tmppath = targetpath + ".tmp"
+    rm_file(tmppath)
+    if link:
+        try:
+            os.link(filepath, tmppath)
+        except OSError:
+            link = False
+    if not link:
+        shutil.copy2(filepath, tmppath)
+    os.replace(tmppath, targetpath)
+    return True
+
+
+def sync_dir(filepaths, dirpath, link=False):
+    """ Make dirpath content the same as filepaths files, files are copied
+        only if they changed and files not in filepaths are deleted.
+        return (copied, deleted) files names lists
+    """
+    dirpath = os.path.expanduser(dirpath)
+    if not os.path.isdir(dirpath):
+        mkdir(dirpath)
+    copied = []
+    names = set()
+    for filepath in filepaths:
+        names.add(os.path.basename(filepath))
+        if sync_file(filepath, dirpath, link):
+            copied.append(os.path.basename(filepath))
+    deleted = []
+    for name in sorted(os.listdir(dirpath)):
+        if name not in names:
+            if os.path.isdir(os.path.join(dirpath, name)):
+                shutil.rmtree(os.path.join(dirpath, name))
+            else:
+                os.remove(os.path.join(dirpath, name))
+            deleted.append(name)
+    return (copied, deleted)
+
+
 def rm_dir(dirpath):
     """ delete a directory
     """
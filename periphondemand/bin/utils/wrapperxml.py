@@ -16,15 +16,63 @@
 # ----------------------------------------------------------------------------
 """ main xml object """
 
-import xml.etree.cElementTree as ET
+import os
+from concurrent.futures import ProcessPoolExecutor
 
+from periphondemand.bin.utils import xmlbackend
+from periphondemand.bin.utils.xmlbackend import ET
 from periphondemand.bin.utils.poderror import PodError
 
 
+class XmlDocument(object):
+    """ Modification state shared by all wrappers of one xml tree.
+        When a tree is appended in another one, its document is
+        attached to the document of the new root.
+
+        attributes:
+            modified -- tree changed since last read or write
+            filename -- file the tree was last read from or written to
+            wrappers -- wrappers already given for tree elements
+
+        class attributes:
+            mutations -- count of trees changes, cached values computed
+                         from trees are obsolete when it changes
+    """
+
+    mutations = 0
+
+    def __init__(self, filename=None):
+        self.modified = filename is None
+        self.filename = None
+        if filename is not None:
+            self.filename = os.path.abspath(filename)
+        self._owner = None
+        self.wrappers = {}
+
+    def resolve(self):
+        """ return the document of the root tree """
+        document = self
+        while document._owner is not None:
+            document = document._owner
+        return document
+
+    def attach(self, owner):
+        """ attach this document to owner document """
+        document = self.resolve()
+        owner = owner.resolve()
+        if document is not owner:
+            document._owner = owner
+            owner.modified = True
+            XmlDocument.mutations = XmlDocument.mutations + 1
+            owner.wrappers.update(document.wrappers)
+            document.wrappers = {}
+
+
 class WrapperXml(object):
     """Simple class manage XML
         attributes:
-            tree -- root tree xml component
+            tree      -- root tree xml component
+            _document -- modification state of the tree
     """
 
     def __init__(self, **args):
@@ -34,6 +82,7 @@ class WrapperXml(object):
             __init__(self,nodename)
             __init__(self,nodestring)
             __init__(self,file)
+            __init__(self,file,parsed) # parsed is the tree read from file
         """
 
         if not hasattr(self, 'parent'):
@@ -46,18 +95,22 @@ class WrapperXml(object):
         if "node" in args:
             self.__initnode(args["node"])
         elif "etnode" in args:
-            self.__initetnode(args["etnode"])
+            self.__initetnode(args["etnode"], args.get("document"))
         elif "nodename" in args:
             self.__initnodename(args["nodename"])
         elif "nodestring" in args:
             self.__initnodestring(args["nodestring"])
         elif "file" in args:
-            self.__initfile(args["file"])
+            self.__initfile(args["file"], args.get("parsed"))
         else:
             raise PodError("Keys unknown in WrapperXml", 0)
 
-    def __initfile(self, filename):
+    def __initfile(self, filename, parsed=None):
         """ initialize with filename"""
+        if parsed is not None:
+            self.tree = parsed
+            self._document = XmlDocument(filename)
+            return
         try:
             self.open_xml(filename)
         except IOError as error:
@@ -66,25 +119,31 @@ class WrapperXml(object):
     def __initnode(self, node):
         """ initilize with node """
         self.tree = node.tree
+        self._document = node._document
 
-    def __initetnode(self, etnode):
+    def __initetnode(self, etnode, document=None):
         """ initialize with etnode """
         self.tree = etnode
+        if document is None:
+            document = XmlDocument()
+        self._document = document
 
     def __initnodename(self, nodename):
         """ initialize with nodename """
         self.tree = ET.Element(nodename)
+        self._document = XmlDocument()
 
     def __initnodestring(self, nodestring):
         """ initialize with nodestring """
         try:
-            self.tree = ET.fromstring(nodestring)
+            self.tree = xmlbackend.fromstring(nodestring)
         except SyntaxError as error:
             raise PodError("XML malformed :\n" + str(error), 0)
+        self._document = XmlDocument()
 
     def __str__(self):
         return ('<?xml version="1.0" encoding="utf-8"?>\n' +
-                ET.tostring(self.tree, "utf-8").decode("utf-8"))
+                xmlbackend.tostring(self.tree))
 
     @property
     def text(self):
@@ -100,33 +159,56 @@ class WrapperXml(object):
     def text(self, text):
         """ set node's text content
         """
-        self.tree.text = text
+        if self.tree.text != text:
+            self.tree.text = text
+            self.set_modified()
+
+    @property
+    def modified(self):
+        """ True if the xml tree changed since it was read or saved """
+        return self._document.resolve().modified
+
+    def set_modified(self):
+        """ Mark the xml tree as changed """
+        self._document.resolve().modified = True
+        XmlDocument.mutations = XmlDocument.mutations + 1
 
     def get_subnodes(self, nodename, subnodename):
         """ Return a list of subnodes
         """
-        nodelist = []
-        try:
-            for element in self.get_node(nodename).get_nodes(subnodename):
-                nodelist.append(element)
-            return nodelist
-        except AttributeError:
+        node = self.tree.find(nodename)
+        if node is None:
             return []
+        return [self._wrap(element) for element in node.findall(subnodename)]
 
     def get_nodes(self, nodename):
         """ Return a list of nodes """
-        nodelist = []
-        for node in self.tree.findall(nodename):
-            tmp = WrapperXml(etnode=node)
-            nodelist.append(tmp)
-        return nodelist
+        return [self._wrap(element) for element in self.tree.findall(nodename)]
 
     def get_node(self, nodename):
         """ return the first node found """
-        try:
-            return self.get_nodes(nodename)[0]
-        except IndexError:
+        element = self.tree.find(nodename)
+        if element is None:
             return None
+        return self._wrap(element)
+
+    def _wrap(self, element):
+        """ Return the wrapper of element, the same wrapper is given
+            while element is in tree """
+        wrappers = self._document.resolve().wrappers
+        try:
+            return wrappers[element]
+        except KeyError:
+            wrapper = WrapperXml(etnode=element, document=self._document)
+            wrappers[element] = wrapper
+            return wrapper
+
+    def _forget(self, element):
+        """ element removed from tree, forget wrappers of element and
+            of its subelements """
+        wrappers = self._document.resolve().wrappers
+        for subelement in element.iter():
+            wrappers.pop(subelement, None)
 
     def add_subnode(self, **keys):
         """ Add a subnode in the object tree
@@ -180,6 +262,12 @@ class WrapperXml(object):
             self.tree.append(node.tree)
         except AttributeError:  # if tree doesn't exits
             self.tree = node.tree
+            self._document = node._document
+            self.set_modified()
+        else:
+            node._document.attach(self._document)
+            if "nodename" in keys:
+                self._document.resolve().wrappers[node.tree] = node
         return node
 
     def del_node(self, node, attribute=None, value=None):
@@ -189,24 +277,22 @@ class WrapperXml(object):
            del_node(self, node_name, {attribute1:value1, attribute1:value1,..})
         """
         if type(node) == str:
-            nodename = node
-            for element in self.get_nodes(nodename):
-                if(element.tree.tag == nodename):
-                    if attribute is None:
-                        self.tree.remove(element.tree)
-                    elif (type(attribute) == str) and\
-                            (element.get_attr_value(attribute) == value):
-                        self.tree.remove(element.tree)
-                    elif type(attribute) == dict:
-                        match = 1
-                        for key in attribute:
-                            if element.get_attr_value(key) !=\
-                                    attribute[key]:
-                                match = 0
-                        if match == 1:
-                            self.tree.remove(element.tree)
+            if attribute is None:
+                attribute = {}
+            elif type(attribute) == str:
+                attribute = {attribute: value}
+            elif type(attribute) != dict:
+                return
+            for element in xmlbackend.find_matching(self.tree, node,
+                                                    attribute):
+                if element.tag == node:
+                    self.tree.remove(element)
+                    self._forget(element)
+                    self.set_modified()
         else:
             self.tree.remove(node.tree)
+            self._forget(node.tree)
+            self.set_modified()
 
     def del_subnode(self, nodename, subnodename, attribute=None, value=None):
         """ Delete a subnode """
@@ -239,13 +325,16 @@ class WrapperXml(object):
     def set_attr(self, key, value, subname=None):
         """ set an attribute value """
         if subname is None:
-            self.tree.attrib[key] = value
-            return value
+            node = self.tree
         else:
-            if self.tree.find(subname) is None:
-                ET.SubElement(self.tree, subname)
-            self.tree.find(subname).attrib[key] = value
-            return value
+            node = self.tree.find(subname)
+            if node is None:
+                node = ET.SubElement(self.tree, subname)
+                self.set_modified()
+        if node.get(key) != value:
+            node.attrib[key] = value
+            self.set_modified()
+        return value
 
     @property
     def description(self):
@@ -258,11 +347,13 @@ class WrapperXml(object):
     @description.setter
     def description(self, description):
         """ set description """
-        if self.tree.find("description") is not None:
-            self.tree.find("description").text = description
-        else:
+        desc = self.tree.find("description")
+        if desc is None:
             desc = ET.SubElement(self.tree, "description")
-            desc.text = description
+        elif desc.text == description:
+            return description
+        desc.text = description
+        self.set_modified()
         return description
 
     @property
@@ -300,38 +391,71 @@ class WrapperXml(object):
         """ set the version """
         return self.set_attr("version", version)
 
+    @classmethod
+    def parse_files(cls, filenames, jobs):
+        """ Parse xml files with a pool of jobs processes,
+            return the list of trees
+        """
+        chunksize = max(1, len(filenames) // (jobs * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(xmlbackend.parse_file,
+                                            filenames, chunksize=chunksize))
+        except IOError as error:
+            raise PodError(str(error), 0)
+        trees = []
+        for filename, (tree, error) in zip(filenames, results):
+            if error is not None:
+                raise PodError("Xml malformed in " +
+                               filename + " :\n" + error)
+            trees.append(tree)
+        return trees
+
     def open_xml(self, filename, string=None):
         """ open xml, parameters can be filename or xml string
         """
         if type(filename) == str and string is not None:
             try:
-                self.tree = ET.fromstring(filename)
+                self.tree = xmlbackend.fromstring(filename)
             except SyntaxError as error:
                 raise PodError("Xml malformed in " +
                                filename + " : \n" + str(error))
+            self._document = XmlDocument()
         else:
             try:
                 xmlfile = open(filename, 'r')
             except IOError as error:
                 raise PodError(str(error), 0)
             content =\
-                xmlfile.read().replace(
-                    r'<?xml version="1.0" encoding="utf-8"?>', '')
+                xmlfile.read().replace(xmlbackend.XML_DECLARATION, '')
             try:
-                self.tree = ET.fromstring(content)
+                self.tree = xmlbackend.fromstring(content)
             except SyntaxError as error:
                 raise PodError("Xml malformed in " +
                                filename + " :\n" + str(error))
+            self._document = XmlDocument(filename)
 
     def create_xml(self, tag):
         """ create xml with tag as top"""
         self.tree = ET.Element(tag)
+        self._document = XmlDocument()
 
     def save_xml(self, pathname):
-        """ save xml in file """
-        fxml = open(pathname, "w")
+        """ save xml in file if tree changed since it was read or written,
+            file is replaced atomically
+        """
+        document = self._document.resolve()
+        pathname = os.path.abspath(pathname)
+        if not document.modified and document.filename == pathname and\
+                os.path.exists(pathname):
+            return
+        tmpname = pathname + ".tmp"
+        fxml = open(tmpname, "w")
         fxml.write(str(self))
         fxml.close()
+        os.replace(tmpname, pathname)
+        document.modified = False
+        document.filename = pathname
 
     @property
     def num(self):
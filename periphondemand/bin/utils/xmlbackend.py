@@ -0,0 +1,109 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     xmlbackend.py
+# Purpose:  Select the xml library used by WrapperXml
+#
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+#
+# Created:  18/10/2026
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" xml library used by WrapperXml: lxml if installed, else ElementTree.
+    POD_XML_BACKEND=etree environment variable forces ElementTree.
+    Files are always written by ElementTree, so they are the same with
+    both libraries.
+"""
+
+import os
+import xml.etree.ElementTree as StdET
+
+ET = None
+if os.environ.get("POD_XML_BACKEND", "lxml") == "lxml":
+    try:
+        from lxml import etree as ET
+    except ImportError:
+        ET = None
+
+if ET is None:
+    import xml.etree.ElementTree as ET
+    BACKEND = "etree"
+else:
+    BACKEND = "lxml"
+
+XML_DECLARATION = r'<?xml version="1.0" encoding="utf-8"?>'
+
+# compiled xpath expressions, key is (tag, attributes names)
+_XPATHS = {}
+
+
+def fromstring(text):
+    """ parse xml string, return the root element """
+    if BACKEND == "lxml" and isinstance(text, str):
+        # lxml refuses unicode strings with encoding declaration
+        text = text.encode("utf-8")
+    return ET.fromstring(text)
+
+
+def parse_file(filename):
+    """ process pool worker, parse filename.
+        return (tree, error message), only ElementTree trees can be sent
+        between processes
+    """
+    with open(filename, 'r') as xmlfile:
+        content = xmlfile.read().replace(XML_DECLARATION, '')
+    try:
+        tree = fromstring(content)
+    except SyntaxError as error:
+        return (None, str(error))
+    return (tree, None)
+
+
+def to_etree(element):
+    """ copy lxml element as an ElementTree element, comments and
+        processing instructions are dropped like ElementTree parser does
+    """
+    copy = StdET.Element(element.tag, dict(element.attrib))
+    copy.text = element.text
+    copy.tail = element.tail
+    last = None
+    for child in element:
+        if isinstance(child.tag, str):
+            last = to_etree(child)
+            copy.append(last)
+        elif child.tail:
+            # text around a dropped node is joined
+            if last is None:
+                copy.text = (copy.text or "") + child.tail
+            else:
+                last.tail = (last.tail or "") + child.tail
+    return copy
+
+
+def tostring(element):
+    """ serialize element, without xml declaration """
+    if BACKEND == "lxml":
+        element = to_etree(element)
+    return StdET.tostring(element, encoding="unicode")
+
+
+def find_matching(element, tag, attributes):
+    """ return the list of children of element named tag with all
+        attributes values given in attributes dictionnary
+    """
+    if not attributes:
+        return element.findall(tag)
+    if BACKEND == "lxml" and None not in attributes.values():
+        keys = tuple(sorted(attributes))
+        xpath = _XPATHS.get((tag, keys))
+        if xpath is None:
+            predicate = " and ".join("@%s=$v%d" % (key, num)
+                                     for num, key in enumerate(keys))
+            xpath = ET.XPath(tag + "[" + predicate + "]")
+            _XPATHS[(tag, keys)] = xpath
+        values = dict(("v%d" % num, attributes[key])
+                      for num, key in enumerate(keys))
+        return xpath(element, **values)
+    return [child for child in element.findall(tag)
+            if all(child.get(key) == value
+                   for key, value in attributes.items())]
@@ -35,6 +35,7 @@ from periphondemand.bin.define import ONETAB
 from periphondemand.bin.define import COMPONENTSPATH
 from periphondemand.bin.define import HDLDIR
 
+from periphondemand.bin.code.codewriter import CodeWriter
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.utils import wrappersystem as sy
@@ -529,28 +530,6 @@ def generate_intercon(masterinterface, intercon):
     """
     masterinstance = masterinterface.parent
 
-    # comment and header
-    vhdl_code = header(SETTINGS.author, intercon)
-    # entity
-    vhdl_code += entity(intercon)
-    vhdl_code += architecture_head(masterinterface, intercon)
-    vhdl_code += gen_case_byte_enable(masterinterface)
-
-    listslave = masterinterface.slaves
-    listinterfacesyscon = []
-    for slaveinstance in [slave.get_instance() for slave in listslave]:
-        listinterfacesyscon.append(slaveinstance.get_one_syscon())
-    listinterfacesyscon.append(masterinstance.get_one_syscon())
-    # Clock and Reset connection
-    vhdl_code += connect_clock_and_reset(masterinterface)
-    # address decoding
-    vhdl_code += addressdecoding(masterinterface, masterinstance)
-    # controls slaves
-    vhdl_code += controlslave(masterinterface)
-    # controls master
-    vhdl_code += controlmaster(masterinterface)
-    # Foot
-    vhdl_code += architecture_foot(intercon)
     # saving
     if not sy.dir_exist(SETTINGS.projectpath +
                         COMPONENTSPATH + "/" +
@@ -558,15 +537,34 @@ def generate_intercon(masterinterface, intercon):
         sy.mkdir(SETTINGS.projectpath +
                  COMPONENTSPATH + "/" +
                  intercon.instancename + "/" + HDLDIR)
-    afile = open(SETTINGS.projectpath + COMPONENTSPATH + "/" +
-                 intercon.instancename +
-                 "/" + HDLDIR + "/" + intercon.instancename + VHDLEXT,
-                 "w")
-    afile.write(vhdl_code)
-    afile.close()
+    filename = SETTINGS.projectpath + COMPONENTSPATH + "/" +\
+        intercon.instancename + "/" + HDLDIR + "/" +\
+        intercon.instancename + VHDLEXT
+    with CodeWriter(filename) as writer:
+        # comment and header
+        writer.write(header(SETTINGS.author, intercon))
+        # entity
+        writer.write(entity(intercon))
+        writer.write(architecture_head(masterinterface, intercon))
+        writer.write(gen_case_byte_enable(masterinterface))
+        listslave = masterinterface.slaves
+        listinterfacesyscon = []
+        for slaveinstance in [slave.get_instance() for slave in listslave]:
+            listinterfacesyscon.append(slaveinstance.get_one_syscon())
+        listinterfacesyscon.append(masterinstance.get_one_syscon())
+        # Clock and Reset connection
+        writer.write(connect_clock_and_reset(masterinterface))
+        # address decoding
+        writer.write(addressdecoding(masterinterface, masterinstance))
+        # controls slaves
+        writer.write(controlslave(masterinterface))
+        # controls master
+        writer.write(controlmaster(masterinterface))
+        # Foot
+        writer.write(architecture_foot(intercon))
+
     # hdl file path
     hdl = HdlFile(intercon,
                   filename=intercon.instancename + VHDLEXT,
                   istop=1, scope="both")
     intercon.add_hdl_file(hdl)
-    return vhdl_code
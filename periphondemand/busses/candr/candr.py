@@ -35,6 +35,7 @@ from periphondemand.bin.define import COMPONENTSPATH
 from periphondemand.bin.define import HDLDIR
 from periphondemand.bin.define import VHDLEXT
 
+from periphondemand.bin.code.codewriter import CodeWriter
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.utils import wrappersystem as sy
@@ -130,17 +131,6 @@ def generate_intercon(masterinterface, intercon):
     masterinstance = masterinterface.parent
     project = masterinstance.parent
 
-    # comment and header
-    VHDLcode = header(SETTINGS.author, intercon)
-    # entity
-    VHDLcode = VHDLcode + entity(intercon)
-    VHDLcode = VHDLcode + architectureHead(masterinterface, intercon)
-    # Clock and Reset connection
-    VHDLcode = VHDLcode + connectClockandReset(masterinterface, intercon)
-
-    # Foot
-    VHDLcode = VHDLcode + architectureFoot(intercon)
-
     # saving
     if not sy.dir_exist(SETTINGS.projectpath +
                         COMPONENTSPATH + "/" +
@@ -148,15 +138,23 @@ def generate_intercon(masterinterface, intercon):
         sy.mkdir(SETTINGS.projectpath +
                  COMPONENTSPATH + "/" +
                  intercon.instancename + "/" + HDLDIR)
-    afile = open(SETTINGS.projectpath + COMPONENTSPATH + "/" +
-                 intercon.instancename +
-                 "/" + HDLDIR + "/" + intercon.instancename + VHDLEXT,
-                 "w")
-    afile.write(VHDLcode)
-    afile.close()
+    filename = SETTINGS.projectpath + COMPONENTSPATH + "/" +\
+        intercon.instancename + "/" + HDLDIR + "/" +\
+        intercon.instancename + VHDLEXT
+    with CodeWriter(filename) as writer:
+        # comment and header
+        writer.write(header(SETTINGS.author, intercon))
+        # entity
+        writer.write(entity(intercon))
+        writer.write(architectureHead(masterinterface, intercon))
+        # Clock and Reset connection
+        writer.write(connectClockandReset(masterinterface, intercon))
+
+        # Foot
+        writer.write(architectureFoot(intercon))
+
     # hdl file path
     hdl = HdlFile(intercon,
                   filename=intercon.instancename + VHDLEXT,
                   istop=1, scope="both")
     intercon.add_hdl_file(hdl)
-    return VHDLcode
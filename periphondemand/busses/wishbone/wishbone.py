@@ -37,6 +37,7 @@ from periphondemand.bin.define import ONETAB
 from periphondemand.bin.define import COMPONENTSPATH
 from periphondemand.bin.define import HDLDIR
 
+from periphondemand.bin.code.codewriter import CodeWriter
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.utils import wrappersystem as sy
@@ -588,36 +589,6 @@ def generate_intercon(masterinterface, intercon):
     masterinstance = masterinterface.parent
     project = masterinstance.parent
 
-    # comment and header
-    VHDLcode = header(SETTINGS.author, intercon)
-    # entity
-    VHDLcode = VHDLcode + entity(intercon)
-    VHDLcode = VHDLcode + architectureHead(masterinterface, intercon)
-    VHDLcode = VHDLcode + genCaseByteEnable(masterinterface)
-    VHDLcode = VHDLcode + gen_byte_enable(masterinterface)
-    listslave = masterinterface.slaves
-    listinterfacesyscon = []
-    for slaveinstance in [slave.get_instance() for slave in listslave]:
-        listinterfacesyscon.append(slaveinstance.get_one_syscon())
-    listinterfacesyscon.append(masterinstance.get_one_syscon())
-
-    # Clock and Reset connection
-    VHDLcode = VHDLcode + connectClockandReset(masterinterface,
-                                               intercon)
-
-    # address decoding
-    VHDLcode = VHDLcode + addressdecoding(masterinterface,
-                                          masterinstance, intercon)
-
-    # controls slaves
-    VHDLcode = VHDLcode + controlslave(masterinterface, intercon)
-    # controls master
-    VHDLcode = VHDLcode + controlmaster(masterinterface, intercon)
-    # readdata mux
-    VHDLcode = VHDLcode + selectWrite(masterinterface, intercon)
-    # Foot
-    VHDLcode = VHDLcode + architectureFoot(intercon)
-
     # saving
     if not sy.dir_exist(SETTINGS.projectpath +
                         COMPONENTSPATH + "/" +
@@ -625,15 +596,42 @@ def generate_intercon(masterinterface, intercon):
         sy.mkdir(SETTINGS.projectpath +
                  COMPONENTSPATH + "/" +
                  intercon.instancename + "/" + HDLDIR)
-    afile = open(SETTINGS.projectpath + COMPONENTSPATH + "/" +
-                 intercon.instancename +
-                 "/" + HDLDIR + "/" + intercon.instancename + VHDLEXT,
-                 "w")
-    afile.write(VHDLcode)
-    afile.close()
+    filename = SETTINGS.projectpath + COMPONENTSPATH + "/" +\
+        intercon.instancename + "/" + HDLDIR + "/" +\
+        intercon.instancename + VHDLEXT
+    with CodeWriter(filename) as writer:
+        # comment and header
+        writer.write(header(SETTINGS.author, intercon))
+        # entity
+        writer.write(entity(intercon))
+        writer.write(architectureHead(masterinterface, intercon))
+        writer.write(genCaseByteEnable(masterinterface))
+        writer.write(gen_byte_enable(masterinterface))
+
+        listslave = masterinterface.slaves
+        listinterfacesyscon = []
+        for slaveinstance in [slave.get_instance() for slave in listslave]:
+            listinterfacesyscon.append(slaveinstance.get_one_syscon())
+        listinterfacesyscon.append(masterinstance.get_one_syscon())
+
+        # Clock and Reset connection
+        writer.write(connectClockandReset(masterinterface, intercon))
+
+        # address decoding
+        writer.write(addressdecoding(masterinterface,
+                                     masterinstance, intercon))
+
+        # controls slaves
+        writer.write(controlslave(masterinterface, intercon))
+        # controls master
+        writer.write(controlmaster(masterinterface, intercon))
+        # readdata mux
+        writer.write(selectWrite(masterinterface, intercon))
+        # Foot
+        writer.write(architectureFoot(intercon))
+
     # hdl file path
     hdl = HdlFile(intercon,
                   filename=intercon.instancename + VHDLEXT,
                   istop=1, scope="both")
     intercon.add_hdl_file(hdl)
-    return VHDLcode
@@ -4,6 +4,23 @@ rm -rf .coverage
 rm -rf coverage.xml
 python3-coverage run -a --source periphondemand --branch units_tests/test_project.py
 python3-coverage run -a --source periphondemand --branch units_tests/test_port.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_allocmem.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_codewriter.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_drivertemplate.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_dirindex.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_scriptrunner.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_podserver.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_pingraph.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_projectcli.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_wrapperxml.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_xmlbackend.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_topgen.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_intercon.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_driver.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_bus.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_plugins.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_wrappersystem.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_synthesis.py
 python3-coverage run -a --source periphondemand --branch functionals_tests/test_launcher.py
 python3 -m coverage xml
 python3 -m coverage html
@@ -38,8 +38,8 @@ sys.path.append("periphondemand/bin/")
 from version import VERSION
 
 (major, minor) = (sys.version_info.major, sys.version_info.minor)
-if major < 3 or (major == 3 and minor < 4):
-    raise Exception("POD need python >= 3.4")
+if major < 3 or (major == 3 and minor < 8):
+    raise Exception("POD need python >= 3.8")
 
 
 def package_files(directory):
@@ -69,6 +69,6 @@ setup(name='PeriphOnDemand',
           package_files("periphondemand/library"),
       },
       zip_safe=False,
-      scripts=['periphondemand/bin/pod'],
+      scripts=['periphondemand/bin/pod', 'periphondemand/bin/podc'],
       license='GPL',
 )
@@ -0,0 +1,168 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_allocmem
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+from mock import MagicMock
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.core.allocmem import AllocMem
+from periphondemand.bin.core.project import Project
+
+
+class FakeSlave(object):
+    """ slave interface with only what AllocMem use """
+
+    def __init__(self, name, size, base=None):
+        self.name = name
+        self.interface_class = "slave"
+        self.mem_size = size
+        self.unique_id = 0
+        self.parent = MagicMock()
+        self.parent.instancename = name
+        self._base = base
+
+    @property
+    def base_addr(self):
+        if self._base is None:
+            raise PodError("Base address register not set", 0)
+        return self._base
+
+    @base_addr.setter
+    def base_addr(self, base):
+        if type(base) is str:
+            base = int(base, 16)
+        self._base = base
+
+
+class test_allocmem(unittest.TestCase):
+    """ unit tests bin.core.allocmem.py
+    """
+
+    def allocmem(self, strategy):
+        master = MagicMock()
+        master.get_attr_value.return_value = strategy
+        return AllocMem(master)
+
+    def test_append(self):
+        """ new slaves are placed after the highest one """
+        alloc = self.allocmem(None)
+        alloc.add_slave_interface(FakeSlave("a", 8))
+        alloc.add_slave_interface(FakeSlave("b", 8, 0x40))
+        slave = FakeSlave("c", 16)
+        alloc.add_slave_interface(slave)
+        self.assertEqual(slave.base_addr, 0x50)
+        self.assertEqual(alloc.voids, [(0x8, 0x38), (0x48, 0x8)])
+
+    def test_first_and_best_fit(self):
+        """ holes are reused """
+        alloc = self.allocmem("first_fit")
+        alloc.add_slave_interface(FakeSlave("a", 8, 0x10))
+        alloc.add_slave_interface(FakeSlave("b", 4, 0x24))
+        slave = FakeSlave("c", 4)
+        alloc.add_slave_interface(slave)
+        self.assertEqual(slave.base_addr, 0x0)
+        alloc = self.allocmem("best_fit")
+        alloc.add_slave_interface(FakeSlave("a", 8, 0x10))
+        alloc.add_slave_interface(FakeSlave("b", 4, 0x24))
+        slave = FakeSlave("c", 4)
+        alloc.add_slave_interface(slave)
+        self.assertEqual(slave.base_addr, 0x18)
+
+    def test_compact(self):
+        """ compact strategy repack all slaves """
+        alloc = self.allocmem("compact")
+        small = FakeSlave("a", 4, 0x40)
+        alloc.add_slave_interface(small)
+        big = FakeSlave("b", 16)
+        alloc.add_slave_interface(big)
+        self.assertEqual(big.base_addr, 0x0)
+        self.assertEqual(small.base_addr, 0x10)
+        self.assertEqual(alloc.voids, [])
+
+    def test_compact_keeps_addresses(self):
+        """ slaves with base address are not moved when added """
+        alloc = self.allocmem("compact")
+        small = FakeSlave("a", 4, 0x40)
+        big = FakeSlave("b", 16, 0x80)
+        alloc.add_slave_interface(small)
+        alloc.add_slave_interface(big)
+        self.assertEqual(small.base_addr, 0x40)
+        self.assertEqual(big.base_addr, 0x80)
+        alloc.repack()
+        self.assertEqual(big.base_addr, 0x0)
+        self.assertEqual(small.base_addr, 0x10)
+
+    def test_del_slave_maxsize(self):
+        """ overlaps search follows largest slave size """
+        alloc = self.allocmem(None)
+        small = FakeSlave("a", 4, 0x0)
+        big = FakeSlave("b", 0x100, 0x100)
+        alloc.add_slave_interface(small)
+        alloc.add_slave_interface(big)
+        self.assertEqual(alloc._maxsize, 0x100)
+        alloc.del_slave_interface(big)
+        self.assertEqual(alloc._maxsize, 4)
+        alloc.del_slave_interface(small)
+        self.assertEqual(alloc._maxsize, 0)
+
+    def test_compact_reload(self):
+        """ reloading a compact project keeps its addresses """
+        directory = tempfile.mkdtemp()
+        try:
+            project = Project(os.path.join(directory, "UnitTest"))
+            project.add_instance(libraryname="components",
+                                 componentname="cpu", instancename="cpua")
+            master = project.get_instance("cpua").get_interface("mwb16")
+            master.alloc_mem.strategy = "compact"
+            for name in ["gpioa", "gpiob"]:
+                project.add_instance(libraryname="components",
+                                     componentname="gpio",
+                                     instancename=name)
+                project.connect_bus({"instance": "cpua",
+                                     "interface": "mwb16"},
+                                    {"instance": name, "interface": "swb16"})
+            slave = project.get_instance("gpiob").get_interface("swb16")
+            master.alloc_mem.set_slave_addr(slave, "0x40")
+            project.save()
+            project = Project(os.path.join(directory, "UnitTest",
+                                           "UnitTest.xml"))
+            project.wire_busses()
+            bases = [project.get_instance(name).get_interface(
+                "swb16").base_addr for name in ["gpioa", "gpiob"]]
+            self.assertEqual(bases, [0x0, 0x40])
+            self.assertFalse(project.get_instance("gpiob").modified)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_set_slave_addr(self):
+        """ mapping follows address changes """
+        alloc = self.allocmem(None)
+        first = FakeSlave("a", 8)
+        second = FakeSlave("b", 8)
+        alloc.add_slave_interface(first)
+        alloc.add_slave_interface(second)
+        alloc.set_slave_addr(first, "0x20")
+        self.assertEqual([line[1] for line in alloc.mapping],
+                         ["--void--", "b.b", "--void--", "a.a"])
+        self.assertEqual(alloc.overlaps(0x24, 8), [first])
+
+
+if __name__ == "__main__":
+    print("test_allocmem class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,100 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_bus
+"""
+
+import sys
+sys.path.append("./")
+from periphondemand.bin.utils.poderror import PodError
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+from mock import patch
+from mock import MagicMock
+
+from periphondemand.bin.core import bus
+from periphondemand.bin.core.bus import Bus
+from periphondemand.bin.core.bus import BusDefinition
+from periphondemand.bin.utils.plugins import BUS_PLUGINS
+
+BUSXML = """<?xml version="1.0" encoding="utf-8"?>
+<bus name="testbus" version="1.0" datasize="%d">
+    <class name="TM" type="master">
+        <type name="CLK" type="clock" dir="out" />
+    </class>
+</bus>
+"""
+
+
+class test_bus(unittest.TestCase):
+    """ unit tests bin.core.bus.py
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.directory, "busses", "testbus"))
+        self.filename = os.path.join(self.directory, "busses", "testbus",
+                                     "testbus.xml")
+        self.write(16)
+        self.path = patch.object(bus.SETTINGS, "path", self.directory)
+        self.path.start()
+
+    def tearDown(self):
+        self.path.stop()
+        BusDefinition.registry.pop("testbus", None)
+        # plugins could be found in test path
+        BUS_PLUGINS.discover()
+        shutil.rmtree(self.directory)
+
+    def write(self, datasize):
+        """ write test bus xml file """
+        with open(self.filename, "w") as busfile:
+            busfile.write(BUSXML % datasize)
+
+    def test_signals(self):
+        """ signal names are found by class and type """
+        abus = Bus(MagicMock(), "testbus")
+        self.assertEqual(abus.sig_name("master", "clock"), "CLK")
+        self.assertIsNone(abus.sig_name("slave", "clock"))
+        self.assertEqual(abus.data_size, "16")
+
+    def test_isolation(self):
+        """ changing a bus doesn't change the others """
+        first = Bus(MagicMock(), "testbus")
+        second = Bus(MagicMock(), "testbus")
+        first.set_attr("datasize", "8")
+        self.assertEqual(second.data_size, "16")
+        self.assertEqual(Bus(MagicMock(), "testbus").data_size, "16")
+
+    def test_reparse(self):
+        """ bus file is parsed again when it changed """
+        definition = BusDefinition.get("testbus")
+        with patch("os.stat", wraps=os.stat) as stat:
+            self.assertIs(BusDefinition.get("testbus"), definition)
+            self.assertEqual(stat.call_count, 0)
+        with patch.object(bus, "CHECK_DELAY", 0):
+            self.assertIs(BusDefinition.get("testbus"), definition)
+            self.write(128)
+            changed = BusDefinition.get("testbus")
+        self.assertIsNot(changed, definition)
+        self.assertEqual(Bus(MagicMock(), "testbus").data_size, "128")
+
+    def test_missing(self):
+        """ unknown bus raises PodError """
+        with self.assertRaises(PodError):
+            BusDefinition.get("nobus")
+
+
+if __name__ == "__main__":
+    print("test_bus class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,70 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_codewriter
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+
+from periphondemand.bin.code import codewriter
+from periphondemand.bin.code.codewriter import CodeWriter
+
+
+class test_codewriter(unittest.TestCase):
+    """ unit tests bin.code.codewriter.py
+    """
+
+    def test_trim(self):
+        """ trim remove last characters, not before start """
+        writer = CodeWriter()
+        writer.line("port (", tabs=1)
+        start = writer.position
+        writer.write("a : in std_logic;\n", tabs=2)
+        writer.write("b : out std_logic;\n", tabs=2)
+        writer.trim(2, start)
+        self.assertEqual(writer.getvalue(),
+                         "    port (\n" +
+                         "        a : in std_logic;\n" +
+                         "        b : out std_logic")
+        start = writer.position
+        writer.trim(2, start)
+        self.assertEqual(writer.position, start)
+
+    def test_file(self):
+        """ file is replaced only when generation succeed """
+        directory = tempfile.mkdtemp()
+        filename = os.path.join(directory, "top.vhd")
+        buffersize = codewriter.BUFFERSIZE
+        codewriter.BUFFERSIZE = 10
+        with CodeWriter(filename) as writer:
+            for num in range(100):
+                writer.line("signal s" + str(num) + " : std_logic;")
+            writer.trim(2)
+        codewriter.BUFFERSIZE = buffersize
+        content = open(filename).read()
+        self.assertTrue(content.endswith("signal s99 : std_logic"))
+        with self.assertRaises(ValueError):
+            with CodeWriter(filename) as writer:
+                writer.line("broken")
+                raise ValueError("generation failed")
+        self.assertEqual(open(filename).read(), content)
+        self.assertEqual(os.listdir(directory), ["top.vhd"])
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    print("test_codewriter class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,84 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_dirindex
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import json
+import tempfile
+
+from periphondemand.bin.utils import dirindex
+from periphondemand.bin.utils.dirindex import DirIndex
+
+
+class test_dirindex(unittest.TestCase):
+    """ unit tests bin.utils.dirindex.py
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.directory, "gpio"))
+        open(os.path.join(self.directory, "README"), "w").close()
+        os.utime(self.directory, ns=(0, 1000000000))
+        self.racy_delay = dirindex.RACY_DELAY
+        dirindex.RACY_DELAY = 0
+        self.indexfile = os.path.join(tempfile.mkdtemp(), "index.json")
+
+    def tearDown(self):
+        dirindex.RACY_DELAY = self.racy_delay
+        shutil.rmtree(self.directory)
+        shutil.rmtree(os.path.dirname(self.indexfile))
+
+    def test_invalidation(self):
+        """ directory is read again only when its mtime changed """
+        index = DirIndex(self.indexfile)
+        self.assertEqual(index.list_dir(self.directory), ["gpio"])
+        self.assertEqual(sorted(index.list_files(self.directory)),
+                         ["README", "gpio"])
+        index.save()
+        # index file is read back by another index
+        os.mkdir(os.path.join(self.directory, "uart"))
+        os.utime(self.directory, ns=(0, 1000000000))
+        self.assertEqual(DirIndex(index.filename).list_dir(self.directory),
+                         ["gpio"])
+        os.utime(self.directory, ns=(0, 2000000000))
+        self.assertEqual(sorted(index.list_dir(self.directory)),
+                         ["gpio", "uart"])
+
+    def test_save(self):
+        """ index file is written once, without deleted directories """
+        index = DirIndex(self.indexfile)
+        gpiodir = os.path.join(self.directory, "gpio")
+        index.list_dir(self.directory)
+        index.list_dir(gpiodir)
+        self.assertFalse(os.path.exists(self.indexfile))
+        index.save()
+        mtime = os.stat(self.indexfile).st_mtime_ns
+        index.list_dir(self.directory)
+        index.save()
+        self.assertEqual(os.stat(self.indexfile).st_mtime_ns, mtime)
+        os.rmdir(gpiodir)
+        os.utime(self.directory, ns=(0, 2000000000))
+        index.list_dir(self.directory)
+        index.save()
+        with open(self.indexfile) as afile:
+            entries = json.load(afile)["entries"]
+        self.assertEqual(list(entries), [self.directory])
+
+
+if __name__ == "__main__":
+    print("test_dirindex class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,100 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_driver
+"""
+
+import sys
+sys.path.append("./")
+from periphondemand.bin.utils.poderror import PodError
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+from mock import patch
+
+from periphondemand.bin.core.project import Project
+from periphondemand.bin.code.drivertemplate import DriverTemplate
+from periphondemand.bin.utils.settings import Settings
+
+SETTINGS = Settings()
+
+
+class test_driver(unittest.TestCase):
+    """ unit tests bin.toolchain.driver.py
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.project = Project(os.path.join(self.directory, "unittest"))
+        self.project.add_instance(libraryname="components",
+                                  componentname="cpu",
+                                  instancename="cpua")
+        self.project.add_instance(libraryname="components",
+                                  componentname="gpio",
+                                  instancename="gpioa")
+        self.project.connect_bus({"instance": "cpua", "interface": "mwb16"},
+                                 {"instance": "gpioa", "interface": "swb16"})
+        self.project.driver_toolchain = "armadeus"
+        self.project.driver.generate_project()
+        self.driversdir = os.path.join(self.directory, "unittest",
+                                       "drivers")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read_drivers(self):
+        """ get content of drivers files """
+        contents = {}
+        for name in ("cpu/cpu.h", "gpio/gpio.h"):
+            with open(os.path.join(self.driversdir, name)) as driverfile:
+                contents[name] = driverfile.read()
+        return contents
+
+    def test_fill_all_templates_jobs(self):
+        """ templates filled by processes are the same """
+        self.project.driver.fill_all_templates()
+        serial = self.read_drivers()
+        shutil.rmtree(os.path.join(self.driversdir, "gpio"))
+        self.project.driver.generate_project()
+        with patch.object(SETTINGS, "jobs", 2):
+            self.project.driver.fill_all_templates()
+        self.assertEqual(self.read_drivers(), serial)
+
+    def test_fill_all_templates_errors(self):
+        """ errors of processes are raised with their level """
+        with patch.object(SETTINGS, "jobs", 2):
+            with patch.object(DriverTemplate, "render",
+                              side_effect=PodError("bad template", 1)):
+                with self.assertRaises(PodError) as context:
+                    self.project.driver.fill_all_templates()
+        self.assertEqual(context.exception.message,
+                         "bad template\nbad template")
+        self.assertEqual(context.exception.level, 0)
+
+        def render(project, component, messages):
+            """ only gpio template is wrong """
+            if component.name == "gpio":
+                raise PodError("bad template", 1)
+            return "code"
+
+        with patch.object(SETTINGS, "jobs", 2):
+            with patch.object(DriverTemplate, "render", side_effect=render):
+                with self.assertRaises(PodError) as context:
+                    self.project.driver.fill_all_templates()
+        self.assertEqual(context.exception.level, 1)
+        with open(os.path.join(self.driversdir, "cpu/cpu.h")) as driverfile:
+            self.assertEqual(driverfile.read(), "code")
+
+
+if __name__ == "__main__":
+    print("test_driver class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
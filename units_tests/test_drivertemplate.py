@@ -0,0 +1,72 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_drivertemplate
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+from mock import MagicMock
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.code.drivertemplate import DriverTemplate
+from periphondemand.bin.code.drivertemplate import INSTANCE_FIELDS
+from periphondemand.bin.code.drivertemplate import tokenize
+
+
+class test_drivertemplate(unittest.TestCase):
+    """ unit tests bin.code.drivertemplate.py
+    """
+
+    def test_tokenize(self):
+        """ only known placeholders with good arguments are kept """
+        self.assertEqual(
+            tokenize("#define /*$instance_name$*/_REG " +
+                     "/*$register:swb:reg:offset$*/ /*$generic$*/ " +
+                     "/*$ x /*$instance_num$*/", INSTANCE_FIELDS),
+            ["#define ", ("instance_name", ()), "_REG ",
+             ("register", ("swb", "reg", "offset")),
+             " /*$generic$*/ /*$ x ", ("instance_num", ())])
+
+    def test_render(self):
+        """ foreach blocks are rendered for each instance """
+        instances = []
+        for num in range(2):
+            instance = MagicMock()
+            instance.instancename = "gpio" + str(num)
+            instance.num = str(num)
+            instances.append(instance)
+        project = MagicMock()
+        project.get_instances_list_of_component.return_value = instances
+        template = DriverTemplate(
+            "#define NB /*$number_of_instances$*/\n" +
+            "/*$foreach:instance$*/ ignored\n" +
+            "#define /*$instance_name$*/ /*$instance_num$*/\n" +
+            "/*$foreach:instance:end$*/\n" +
+            "/*$foreach:instance$*/\n" +
+            "not ended\n")
+        self.assertEqual(template.render(project, MagicMock()),
+                         "#define NB 2\n" +
+                         "#define GPIO0 0\n\n" +
+                         "#define GPIO1 1\n\n")
+        template = DriverTemplate("/*$foreach:instance$*/\n" +
+                                  "/*$register:swb:reg:offset$*/\n" +
+                                  "/*$foreach:instance:end$*/\n")
+        instances[0].get_interface().get_register().get_attr_value.\
+            return_value = None
+        with self.assertRaises(PodError):
+            template.render(project, MagicMock())
+
+
+if __name__ == "__main__":
+    print("test_drivertemplate class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,143 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_intercon
+"""
+
+import sys
+sys.path.append("./")
+from periphondemand.bin.utils.poderror import PodError
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+from mock import patch
+
+from periphondemand.bin.core.project import Project
+from periphondemand.bin.core.bus import Bus
+from periphondemand.bin.utils.settings import Settings
+
+SETTINGS = Settings()
+
+INTERCON = "cpua_mwb16_intercon"
+
+
+class test_intercon(unittest.TestCase):
+    """ unit tests bin.code.intercon.py
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.project = Project(os.path.join(self.directory, "UnitTest"))
+        self.project.add_instance(libraryname="components",
+                                  componentname="cpu",
+                                  instancename="cpua")
+        self.project.add_instance(libraryname="components",
+                                  componentname="gpio",
+                                  instancename="gpioa")
+        self.project.connect_bus({"instance": "cpua", "interface": "mwb16"},
+                                 {"instance": "gpioa", "interface": "swb16"})
+        self.intercondir = os.path.join(self.directory, "UnitTest",
+                                        "components", INTERCON)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def slave_connections(self):
+        """ count pins connections of gpioa bus interface """
+        interface = self.project.get_instance("gpioa").get_interface("swb16")
+        return sum([len(pin.connections) for port in interface.ports
+                    for pin in port.pins])
+
+    def test_generate_intercons(self):
+        """ all intercons are generated and added in project """
+        self.project.generate_intercons()
+        self.assertEqual(self.project.get_instance(INTERCON).instancename,
+                         INTERCON)
+        self.assertTrue(os.path.isdir(os.path.join(self.intercondir, "hdl")))
+        self.assertNotEqual(self.slave_connections(), 0)
+
+    def test_generate_intercons_jobs(self):
+        """ intercons code written by processes is added in project """
+        self.project.generate_intercons()
+        vhdl = os.path.join(self.intercondir, "hdl", INTERCON + ".vhd")
+        with open(vhdl) as vhdlfile:
+            serial = vhdlfile.read()
+        self.project.del_instance(INTERCON)
+        with patch.object(SETTINGS, "jobs", 2):
+            self.project.generate_intercons()
+        intercon = self.project.get_instance(INTERCON)
+        self.assertEqual([hdl_file.filename
+                          for hdl_file in intercon.hdl_files],
+                         [INTERCON + ".vhd"])
+        self.assertTrue(intercon.hdl_files[0].istop())
+        with open(vhdl) as vhdlfile:
+            self.assertEqual(vhdlfile.read(), serial)
+        self.assertNotEqual(self.slave_connections(), 0)
+
+        self.project.del_instance(INTERCON)
+        with patch.object(SETTINGS, "jobs", 2):
+            with patch.object(Bus, "generate_intercon",
+                              side_effect=ValueError("plugin bug")):
+                with self.assertRaises(PodError) as context:
+                    self.project.generate_intercons()
+        self.assertIn("plugin bug", context.exception.message)
+        self.assertFalse(os.path.exists(self.intercondir))
+        self.assertEqual(self.slave_connections(), 0)
+
+    def test_failed_intercon(self):
+        """ a failed intercon leaves nothing in project """
+        with patch.object(Bus, "generate_intercon",
+                          side_effect=ValueError("plugin bug")):
+            with self.assertRaises(PodError) as context:
+                self.project.generate_intercons()
+        self.assertIn("plugin bug", context.exception.message)
+        with self.assertRaises(PodError):
+            self.project.get_instance(INTERCON)
+        self.assertFalse(os.path.exists(self.intercondir))
+        self.assertEqual(self.slave_connections(), 0)
+
+        with patch.object(Bus, "generate_intercon",
+                          side_effect=PodError("bus error")):
+            with self.assertRaises(PodError):
+                self.project.generate_intercon({"instance": "cpua",
+                                                "interface": "mwb16"})
+        self.assertFalse(os.path.exists(self.intercondir))
+        self.project.generate_intercon({"instance": "cpua",
+                                        "interface": "mwb16"})
+        self.assertTrue(os.path.exists(self.intercondir))
+
+    def test_configuration_skip(self):
+        """ intercon is generated again only when its bus changed """
+        master = {"instance": "cpua", "interface": "mwb16"}
+        self.project.generate_intercon(master)
+        intercon = self.project.get_instance(INTERCON)
+        self.project.generate_intercon(master)
+        self.assertIs(self.project.get_instance(INTERCON), intercon)
+
+        slave = self.project.get_instance("gpioa").get_interface("swb16")
+        slave.master.alloc_mem.set_slave_addr(slave, "0x40")
+        self.project.generate_intercon(master)
+        regenerated = self.project.get_instance(INTERCON)
+        self.assertIsNot(regenerated, intercon)
+        self.project.generate_intercons()
+        self.assertIs(self.project.get_instance(INTERCON), regenerated)
+
+        hdldir = os.path.join(self.intercondir, "hdl")
+        for filename in os.listdir(hdldir):
+            os.remove(os.path.join(hdldir, filename))
+        self.project.generate_intercon(master)
+        self.assertIsNot(self.project.get_instance(INTERCON), regenerated)
+
+
+if __name__ == "__main__":
+    print("test_intercon class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
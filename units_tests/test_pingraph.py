@@ -0,0 +1,70 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_pingraph
+"""
+
+import sys
+sys.path.append("./")
+from periphondemand.bin.utils.poderror import PodError
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+
+from periphondemand.bin.core import project
+
+
+class test_pingraph(unittest.TestCase):
+    """ unit tests bin.core.pingraph.py
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.project = project.Project(os.path.join(self.directory,
+                                                    "UnitTest"))
+        self.project.add_instance(libraryname="components",
+                                  componentname="gpio",
+                                  instancename="gpioa")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_get_pin(self):
+        """ pins are cached by connection destination """
+        connection = {"instance_dest": "gpioa",
+                      "interface_dest": "gpio",
+                      "port_dest": "gpio",
+                      "pin_dest": "1"}
+        pin = self.project.pin_graph.get_pin(connection)
+        self.assertEqual(pin.num, "1")
+        self.assertEqual(pin.parent.name, "gpio")
+        self.assertIs(self.project.pin_graph.get_pin(connection), pin)
+
+    def test_rename(self):
+        """ pins of a renamed instance are forgotten """
+        connection = {"instance_dest": "gpioa",
+                      "interface_dest": "gpio",
+                      "port_dest": "gpio",
+                      "pin_dest": "0"}
+        pin = self.project.pin_graph.get_pin(connection)
+        instance = self.project.get_instance("gpioa")
+        instance.instancename = "gpiob"
+        with self.assertRaises(PodError):
+            self.project.pin_graph.get_pin(connection)
+        connection["instance_dest"] = "gpiob"
+        self.assertIs(self.project.pin_graph.get_pin(connection), pin)
+        self.assertIs(self.project.get_instance("gpiob"), instance)
+
+
+if __name__ == "__main__":
+    print("test_pingraph class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
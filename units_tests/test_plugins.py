@@ -0,0 +1,108 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_plugins
+"""
+
+import sys
+sys.path.append("./")
+from periphondemand.bin.utils.poderror import PodError
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+from mock import patch
+from mock import MagicMock
+
+from periphondemand.bin.utils import plugins
+from periphondemand.bin.utils.plugins import PluginRegistry
+
+
+class test_plugins(unittest.TestCase):
+    """ unit tests bin.utils.plugins.py
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        for name in ["alpha", "beta", "_private", "empty"]:
+            os.makedirs(os.path.join(self.directory, "plugins", name))
+            if name != "empty":
+                with open(os.path.join(self.directory, "plugins", name,
+                                       name + ".py"), "w") as source:
+                    source.write("NAME = '" + name + "'\n")
+        self.path = patch.object(plugins.SETTINGS, "path", self.directory)
+        self.path.start()
+        self.registry = PluginRegistry("test", "/plugins",
+                                       "periphondemand.test")
+
+    def tearDown(self):
+        self.path.stop()
+        for name in ["alpha", "beta"]:
+            sys.modules.pop(self.registry.module_name(name), None)
+        shutil.rmtree(self.directory)
+
+    def test_discover(self):
+        """ plugins are found in directory and entry points """
+        entry_point = MagicMock()
+        entry_point.name = "gamma"
+        with patch.object(plugins.metadata, "entry_points",
+                          return_value=[entry_point]) as entry_points:
+            self.assertEqual(self.registry.names,
+                             ["alpha", "beta", "gamma"])
+            self.assertEqual(self.registry.names,
+                             ["alpha", "beta", "gamma"])
+        entry_points.assert_called_once_with(group="periphondemand.test")
+        self.assertIs(self.registry.get("gamma"),
+                      entry_point.load.return_value)
+        self.assertEqual(self.registry.directory_of("alpha"),
+                         os.path.join(self.directory, "plugins", "alpha"))
+        with self.assertRaises(PodError):
+            self.registry.get("empty")
+
+    def test_entry_points_dictionnary(self):
+        """ entry points are found with python < 3.10 """
+        entry_point = MagicMock()
+        entry_point.name = "gamma"
+
+        def entry_points(**keys):
+            """ python < 3.10 entry_points """
+            if keys:
+                raise TypeError("entry_points() got an unexpected " +
+                                "keyword argument 'group'")
+            return {"periphondemand.test": [entry_point]}
+        with patch.object(plugins.metadata, "entry_points",
+                          side_effect=entry_points):
+            self.assertEqual(self.registry.names,
+                             ["alpha", "beta", "gamma"])
+            self.assertEqual(plugins.entry_points("other.group"), [])
+
+    def test_import_once(self):
+        """ plugin modules are imported once under a namespaced key """
+        module = self.registry.get("alpha")
+        self.assertEqual(module.NAME, "alpha")
+        self.assertIs(self.registry.get("alpha"), module)
+        self.assertIs(sys.modules["periphondemand_plugin_test_alpha"],
+                      module)
+        self.assertNotIn("alpha", sys.modules)
+        other = PluginRegistry("test", "/plugins", "periphondemand.test")
+        self.assertIs(other.get("alpha"), module)
+
+    def test_register(self):
+        """ registered modules are plugins """
+        module = MagicMock()
+        self.registry.register("delta", module)
+        self.assertIn("delta", self.registry.names)
+        self.assertIs(self.registry.get("delta"), module)
+
+
+if __name__ == "__main__":
+    print("test_plugins class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
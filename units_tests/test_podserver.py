@@ -0,0 +1,137 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_podserver
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from periphondemand.bin.commandline.podserver import PodServer
+from periphondemand.bin.commandline.podserver import StreamWriter
+from periphondemand.bin.core.project import Project
+from periphondemand.bin.utils.poderror import PodError
+
+
+class test_podserver(unittest.TestCase):
+    """ unit tests bin.commandline.podserver.py
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cwd = os.getcwd()
+        self.server = PodServer(os.path.join(self.directory, "socket"))
+
+    def tearDown(self):
+        self.server.server_close()
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+
+    def run_request(self, request):
+        """ return status and output of request """
+        stream = io.BytesIO()
+        status = self.server.run_request(request, StreamWriter(stream))
+        messages = [json.loads(line)
+                    for line in stream.getvalue().splitlines()]
+        return status, "".join([message["out"] for message in messages])
+
+    def test_run_request(self):
+        """ project of directory is kept between requests """
+        status, out = self.run_request({"cwd": self.directory,
+                                        "lines": ["foo"]})
+        self.assertEqual(status, 1)
+        self.assertIn("request:1: Unknown command foo", out)
+        stdout = sys.stdout
+        status, out = self.run_request({"cwd": self.directory,
+                                        "lines": ["create unittest"]})
+        self.assertEqual(status, 0)
+        project = self.server.get_project(self.directory)
+        self.assertEqual(project.name, "unittest")
+        status, out = self.run_request({"cwd": self.directory,
+                                        "lines": ["listinstances"]})
+        self.assertEqual(status, 0)
+        self.assertIs(self.server.get_project(self.directory), project)
+        self.assertIsNone(self.server.cli.project)
+        self.assertIs(sys.stdout, stdout)
+        status, out = self.run_request({"cwd": self.directory,
+                                        "lines": ["delinstance gpioa",
+                                                  "listinstances"]})
+        self.assertEqual(status, 1)
+
+    def test_shared_project(self):
+        """ a project is shared by directories and read again when its
+            file changed """
+        Project(os.path.join(self.directory, "unittest"))
+        filename = os.path.join(self.directory, "unittest", "unittest.xml")
+        subdirectory = os.path.join(self.directory, "unittest")
+        self.run_request({"cwd": self.directory,
+                          "lines": ["load " + filename]})
+        project = self.server.get_project(self.directory)
+        self.run_request({"cwd": subdirectory,
+                          "lines": ["load " + filename]})
+        shared = self.server.get_project(subdirectory)
+        self.assertIs(self.server.get_project(self.directory), shared)
+        self.assertIsNot(shared, project)
+        self.assertEqual(list(self.server.projects), [filename])
+        stamp = os.stat(filename).st_mtime_ns
+        os.utime(filename, ns=(stamp, stamp + 1000000000))
+        status, out = self.run_request({"cwd": self.directory,
+                                        "lines": ["listinstances"]})
+        self.assertEqual(status, 0)
+        self.assertIn("changed, read again", out)
+        self.assertIsNot(self.server.get_project(subdirectory), shared)
+        # an instance file changed by another program
+        project = Project(filename)
+        project.add_instance(libraryname="components",
+                             componentname="gpio", instancename="gpioa")
+        self.run_request({"cwd": self.directory,
+                          "lines": ["info gpioa"]})
+        loaded = self.server.get_project(self.directory)
+        self.assertTrue(loaded.get_instance("gpioa").is_loaded)
+        instancefile = loaded.instance_filename("gpioa")
+        stamp = os.stat(instancefile).st_mtime_ns
+        os.utime(instancefile, ns=(stamp, stamp + 1000000000))
+        status, out = self.run_request({"cwd": self.directory,
+                                        "lines": ["listinstances"]})
+        self.assertIn("changed, read again", out)
+        self.assertIsNot(self.server.get_project(self.directory), loaded)
+        for cwd in [self.directory, subdirectory]:
+            self.run_request({"cwd": cwd, "lines": ["closeproject"]})
+        self.assertEqual(self.server.projects, {})
+
+    def test_socket(self):
+        """ socket is created for user only """
+        umask = os.umask(0o022)
+        os.umask(umask)
+        self.assertEqual(os.stat(self.server.filename).st_mode & 0o777,
+                         0o600)
+        server = PodServer(os.path.join(self.directory, "other"))
+        server.server_close()
+        self.assertEqual(os.umask(umask), umask)
+
+    def test_stop(self):
+        """ a client can stop the daemon """
+        with self.assertRaises(PodError):
+            PodServer(self.server.filename)
+        status, _ = self.run_request({"stop": True})
+        self.assertEqual(status, 0)
+        self.assertTrue(self.server.stopped)
+
+
+if __name__ == "__main__":
+    print("test_podserver class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
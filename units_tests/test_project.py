@@ -53,6 +53,140 @@ class test_project(unittest.TestCase):
         self.assertTrue("apf27" in aproject.availables_plat())
         os.system("rm -rf " + projectname)
 
+    def test_batch(self):
+        """ saves are deferred until the end of batch """
+        projectname = "UnitTest"
+        os.system("rm -rf " + projectname)
+        aproject = project.Project(projectname)
+        aproject.save_xml = MagicMock()
+        with aproject.batch():
+            aproject.vhdl_version = "vhdl93"
+            with aproject.batch():
+                aproject.vhdl_version = "vhdl87"
+            self.assertEqual(aproject.save_xml.call_count, 0)
+        self.assertEqual(aproject.save_xml.call_count, 1)
+        self.assertFalse(aproject.in_batch)
+        with self.assertRaises(PodError):
+            aproject.commit_batch()
+        # a failed body is not saved
+        with self.assertRaises(ValueError):
+            with aproject.batch():
+                aproject.vhdl_version = "vhdl93"
+                raise ValueError("failed")
+        self.assertFalse(aproject.in_batch)
+        self.assertEqual(aproject.save_xml.call_count, 1)
+        os.system("rm -rf " + projectname)
+
+    def test_indexes(self):
+        """ names indexes follow renames """
+        projectname = "UnitTest"
+        os.system("rm -rf " + projectname)
+        aproject = project.Project(projectname)
+        aproject.add_instance(libraryname="components",
+                              componentname="gpio",
+                              instancename="gpioa")
+        instance = aproject.get_instance("gpioa")
+        instance.instancename = "gpiob"
+        self.assertIs(aproject.get_instance("gpiob"), instance)
+        with self.assertRaises(PodError):
+            aproject.get_instance("gpioa")
+
+        interface = instance.get_interface("gpio")
+        interface.name = "io"
+        self.assertIs(instance.get_interface("io"), interface)
+        with self.assertRaises(PodError):
+            instance.get_interface("gpio")
+
+        port = interface.get_port("int_o")
+        port.name = "irq"
+        self.assertIs(interface.get_port("irq"), port)
+        with self.assertRaises(PodError):
+            interface.get_port("int_o")
+        port.porttype = "IRQ"
+        self.assertIs(interface.get_port_by_type("IRQ"), port)
+
+        pin = port.get_pin(0)
+        self.assertIs(port.get_pin("0"), pin)
+        self.assertEqual(len(port.pins), 1)
+        os.system("rm -rf " + projectname)
+
+    def test_parse_instances_files(self):
+        """ instances files are parsed in processes only with load_jobs
+            and ElementTree, else they are parsed on first use """
+        projectname = "UnitTest"
+        os.system("rm -rf " + projectname)
+        aproject = project.Project(projectname)
+        for name in ["gpioa", "gpiob"]:
+            aproject.add_instance(libraryname="components",
+                                  componentname="gpio",
+                                  instancename=name)
+        nodes = aproject.get_node("components").get_nodes("component")
+        settings = project.SETTINGS
+        with patch.object(project.WrapperXml, "parse_files",
+                          return_value=[sentinel.a, sentinel.b]) as parse:
+            self.assertEqual(aproject.parse_instances_files(nodes), {})
+            settings.set_load_jobs(2)
+            try:
+                with patch.object(project.xmlbackend, "BACKEND", "lxml"):
+                    self.assertEqual(
+                        aproject.parse_instances_files(nodes), {})
+                self.assertEqual(parse.call_count, 0)
+                with patch.object(project.xmlbackend, "BACKEND", "etree"):
+                    trees = aproject.parse_instances_files(nodes)
+            finally:
+                settings.set_load_jobs(1)
+        self.assertEqual(trees, {"gpioa": sentinel.a, "gpiob": sentinel.b})
+        parse.assert_called_once_with(
+            [aproject.instance_filename("gpioa"),
+             aproject.instance_filename("gpiob")], 2)
+        with self.assertRaises(PodError):
+            settings.set_load_jobs(0)
+        os.system("rm -rf " + projectname)
+
+    def slave(self, instancename, base, size, registers=None):
+        """ slave interface mock for check """
+        interface = Mock()
+        interface.parent.instancename = instancename
+        interface.name = "swb16"
+        interface.base_addr = base
+        interface.mem_size = size
+        if registers is None:
+            registers = [{"offset": base, "name": "swb16"}]
+        interface.registers_map = registers
+        return interface
+
+    def test_check_windows(self):
+        """ overlapping slaves windows are reported """
+        interfaces = [self.slave("c", 0x20, 0x10),
+                      self.slave("a", 0x0, 0x10),
+                      self.slave("b", 0x8, 0x10),
+                      self.slave("d", 0x30, 0x10)]
+        problems = project.Project._check_windows(interfaces)
+        self.assertEqual(problems,
+                         [{"type": "window_overlap",
+                           "slaves": ["a.swb16", "b.swb16"],
+                           "address": 0x8, "size": 0x8}])
+        self.assertEqual(project.Project._check_windows(interfaces[:2]),
+                         [])
+        unset = Mock()
+        type(unset).base_addr = property(
+            Mock(side_effect=PodError("Base address register not set")))
+        with self.assertRaises(PodError):
+            project.Project._check_windows([unset])
+
+    def test_check_registers(self):
+        """ registers sharing an address are reported """
+        interfaces = [self.slave("a", 0x0, 0x4,
+                                 [{"offset": 0, "name": "reg0"},
+                                  {"offset": 2, "name": "reg1"}]),
+                      self.slave("b", 0x2, 0x2,
+                                 [{"offset": 2, "name": "reg0"}]),
+                      self.slave("c", 0x4, 0x2)]
+        problems = project.Project._check_registers(interfaces)
+        self.assertEqual(problems,
+                         [{"type": "register_conflict",
+                           "address": 0x2,
+                           "registers": ["a.reg1", "b.reg0"]}])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,180 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_projectcli
+"""
+
+import sys
+sys.path.append("./")
+from periphondemand.bin.utils.poderror import PodError
+import xmlrunner
+import unittest
+import os
+import shutil
+import io
+import tempfile
+from mock import MagicMock
+from mock import patch
+
+from periphondemand.bin.core.project import Project
+from periphondemand.bin.commandline.projectcli import ProjectCli
+from periphondemand.bin.utils.settings import Settings
+from periphondemand.bin.utils.wrapperxml import XmlDocument
+from periphondemand.bin.utils import xmlbackend
+
+SETTINGS = Settings()
+
+
+class test_projectcli(unittest.TestCase):
+    """ unit tests bin.commandline.projectcli.py
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cli = ProjectCli()
+        self.cli._project = Project(os.path.join(self.directory,
+                                                 "UnitTest"))
+        self.cli._project.save_xml = MagicMock()
+
+    def tearDown(self):
+        SETTINGS.set_script(0)
+        shutil.rmtree(self.directory)
+
+    def test_quit_commits_batch(self):
+        """ quit and exit save a project left in batch """
+        project = self.cli._project
+        self.cli.onecmd("begin")
+        self.cli.onecmd("begin")
+        project.vhdl_version = "vhdl93"
+        self.assertEqual(project.save_xml.call_count, 0)
+        self.assertTrue(self.cli.onecmd("exit"))
+        self.assertFalse(project.in_batch)
+        self.assertEqual(project.save_xml.call_count, 1)
+
+    def test_exit_in_loop(self):
+        """ exit typed in command loop saves project before leaving """
+        project = self.cli._project
+        project.begin_batch()
+        project.vhdl_version = "vhdl93"
+        self.cli.cmdqueue = ["exit"]
+        with self.assertRaises(SystemExit):
+            self.cli.cmdloop()
+        self.assertFalse(project.in_batch)
+        self.assertEqual(project.save_xml.call_count, 1)
+
+    def test_eof(self):
+        """ end of sourced script keeps batch, end of input commits it """
+        project = self.cli._project
+        self.cli.onecmd("begin")
+        project.vhdl_version = "vhdl93"
+        SETTINGS.set_script(1)
+        self.assertTrue(self.cli.onecmd("EOF"))
+        self.assertTrue(project.in_batch)
+        SETTINGS.set_script(0)
+        self.assertTrue(self.cli.onecmd("EOF"))
+        self.assertFalse(project.in_batch)
+        self.assertEqual(project.save_xml.call_count, 1)
+
+    def test_quit_refused(self):
+        """ quit is refused when project can't be saved """
+        project = self.cli._project
+        self.cli.onecmd("begin")
+        project.vhdl_version = "vhdl93"
+        project.save_xml.side_effect = PodError("disk full", 0)
+        self.assertIsNone(self.cli.onecmd("quit"))
+        self.assertTrue(project.in_batch)
+        self.assertIsNone(self.cli.onecmd("quit"))
+        project.save_xml.side_effect = None
+        self.assertTrue(self.cli.onecmd("quit"))
+        self.assertFalse(project.in_batch)
+        self.assertEqual(project.save_xml.call_count, 3)
+
+    def test_load_base_addresses(self):
+        """ load keeps instances lazy, base addresses are displayed when
+            busses are used """
+        project = Project(os.path.join(self.directory, "Bus"))
+        project.add_instance(libraryname="components",
+                             componentname="cpu", instancename="cpua")
+        project.add_instance(libraryname="components",
+                             componentname="gpio", instancename="gpioa")
+        project.connect_bus({"instance": "cpua", "interface": "mwb16"},
+                            {"instance": "gpioa", "interface": "swb16"})
+        filename = os.path.join(self.directory, "Bus", "Bus.xml")
+        cli = ProjectCli()
+        with patch("sys.stdout", new_callable=io.StringIO) as out:
+            cli.onecmd("load " + filename)
+        self.assertNotIn("Base address", out.getvalue())
+        self.assertFalse(cli.project._busses_wired)
+        with patch("sys.stdout", new_callable=io.StringIO) as out:
+            cli.onecmd("getmapping cpua.mwb16")
+        self.assertIn("Base address is 0x0 for gpioa.swb16", out.getvalue())
+
+    def test_check_report(self):
+        """ check prints problems found """
+        self.cli._project.add_instance(libraryname="components",
+                                       componentname="gpio",
+                                       instancename="gpioa")
+        with patch("sys.stdout", new_callable=io.StringIO) as out:
+            self.cli.onecmd("check")
+        self.assertIn("Check found 1 problem(s):\n"
+                      "  gpioa.swb16 is not connected on a master bus",
+                      out.getvalue())
+
+    def test_settings_errors(self):
+        """ wrong settings values are failed commands """
+        with patch("sys.stdout", new_callable=io.StringIO) as out,\
+                patch.object(SETTINGS, "color_status"):
+            self.cli.onecmd("setcolor 0")
+            self.assertFalse(self.cli.failed)
+            self.cli.onecmd("setloadjobs 0")
+        self.assertIn("Number of jobs must be at least 1", out.getvalue())
+        self.assertTrue(self.cli.failed)
+
+    def test_load_jobs_lxml(self):
+        """ load jobs with lxml are accepted with a warning """
+        load_jobs = SETTINGS.load_jobs
+        try:
+            for backend in ["lxml", "etree"]:
+                with patch("sys.stdout", new_callable=io.StringIO) as out,\
+                        patch.object(xmlbackend, "BACKEND", backend):
+                    self.cli.onecmd("setloadjobs 4")
+                self.assertEqual(SETTINGS.load_jobs, 4)
+                self.assertEqual("not used with lxml" in out.getvalue(),
+                                 backend == "lxml")
+            self.assertFalse(self.cli.failed)
+        finally:
+            SETTINGS.load_jobs = load_jobs
+
+    def test_completion_cache(self):
+        """ completions are kept until xml trees change """
+        project = self.cli._project
+        project.add_instance(libraryname="components",
+                             componentname="gpio", instancename="gpioa")
+        line = "delinstance gp"
+        with patch.object(self.cli, "listcompletion",
+                          wraps=self.cli.listcompletion) as listcompletion:
+            self.assertEqual(self.cli.complete_delinstance("gp", line, 0, 0),
+                             ["gpioa"])
+            self.assertEqual(self.cli.complete_delinstance("gp", line, 0, 0),
+                             ["gpioa"])
+            self.assertEqual(listcompletion.call_count, 1)
+            mutations = XmlDocument.mutations
+            project.add_instance(libraryname="components",
+                                 componentname="gpio", instancename="gpiob")
+            self.assertNotEqual(XmlDocument.mutations, mutations)
+            self.assertEqual(
+                sorted(self.cli.complete_delinstance("gp", line, 0, 0)),
+                ["gpioa", "gpiob"])
+            self.assertEqual(listcompletion.call_count, 2)
+
+
+if __name__ == "__main__":
+    print("test_projectcli class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,107 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_scriptrunner
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import io
+import tempfile
+from mock import patch
+
+from periphondemand.bin.commandline.scriptrunner import ScriptRunner
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.utils.settings import Settings
+
+SETTINGS = Settings()
+
+
+class test_scriptrunner(unittest.TestCase):
+    """ unit tests bin.commandline.scriptrunner.py
+    """
+
+    def parse(self, text):
+        """ parse script text """
+        scriptfile = tempfile.mkstemp(suffix=".pod")[1]
+        with open(scriptfile, "w") as script:
+            script.write(text)
+        runner = ScriptRunner()
+        try:
+            runner.parse(scriptfile)
+        finally:
+            os.remove(scriptfile)
+        return runner
+
+    def test_parse(self):
+        """ comments are skipped and script ends on exit """
+        runner = self.parse("# comment\n\ncreate test\n" +
+                            "synthesis.selecttoolchain ise\n" +
+                            "driver generateproject\nexit\nfoo\n")
+        self.assertEqual([command for _, command, _ in runner.commands],
+                         [("create", None),
+                          ("synthesis", "selecttoolchain"),
+                          ("driver", "generateproject"),
+                          ("exit", None)])
+        self.assertEqual(runner.commands[0][0], 3)
+
+    def test_check(self):
+        """ all wrong commands are reported before running """
+        with self.assertRaises(PodError) as context:
+            self.parse("create test\nfoo\nsynthesis.bar\nsimulation\n")
+        message = str(context.exception)
+        self.assertIn(":2: Unknown command foo", message)
+        self.assertIn(":3: Unknown synthesis command bar", message)
+        self.assertIn(":4: No simulation command given", message)
+
+    def test_failures(self):
+        """ commands printing an error give script status """
+        directory = tempfile.mkdtemp()
+        project = os.path.join(directory, "unittest")
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            runner = self.parse("create unittest\nsetcolor 0\n")
+            with patch("sys.stdout", new_callable=io.StringIO):
+                runner.run()
+            self.assertEqual(runner.failures, [])
+            self.assertEqual(runner.status, 0)
+            runner = self.parse("load " + project + "/unittest.xml\n" +
+                                "delinstance gpioa\n" +
+                                "check\n")
+            with patch("sys.stdout", new_callable=io.StringIO):
+                runner.run()
+            self.assertEqual(runner.failures, [(2, "delinstance gpioa")])
+            self.assertEqual(runner.status, 1)
+            self.assertIn("Failed line 2: delinstance gpioa",
+                          runner.report())
+            self.assertEqual(runner.cli.project.name, "unittest")
+            # refused commands are failed, warnings too
+            runner = self.parse("load " + project + "/unittest.xml\n" +
+                                "synthesis generateproject\n" +
+                                "selectplatform standard.testplat\n" +
+                                "synthesis generateproject\n")
+            with patch("sys.stdout", new_callable=io.StringIO):
+                runner.run()
+            self.assertEqual([number for number, _ in runner.failures],
+                             [2, 4])
+        finally:
+            os.chdir(cwd)
+            SETTINGS.set_script(0)
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    print("test_scriptrunner class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
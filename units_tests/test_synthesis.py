@@ -0,0 +1,75 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_synthesis
+"""
+
+import sys
+sys.path.append("./")
+from periphondemand.bin.utils.poderror import PodError
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+
+from periphondemand.bin.core.project import Project
+from periphondemand.bin.toolchain.synthesis import Synthesis
+
+
+class test_synthesis(unittest.TestCase):
+    """ unit tests bin.toolchain.synthesis.py
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.projectpath = os.path.join(self.directory, "UnitTest")
+        self.project = Project(self.projectpath)
+        self.project.add_instance(libraryname="components",
+                                  componentname="gpio",
+                                  instancename="gpioa")
+        self.synthesisdir = os.path.join(self.projectpath, "synthesis")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_sync_mode(self):
+        """ sync mode is saved in project """
+        synthesis = Synthesis(self.project)
+        self.assertEqual(synthesis.sync_mode, "copy")
+        with self.assertRaises(PodError):
+            synthesis.sync_mode = "rsync"
+        synthesis.sync_mode = "sync"
+        self.project.save()
+        project = Project(os.path.join(self.projectpath, "UnitTest.xml"))
+        self.assertEqual(Synthesis(project).sync_mode, "sync")
+
+    def test_sync_project(self):
+        """ only components directories written by POD are deleted """
+        synthesis = Synthesis(self.project)
+        synthesis.generate_project()
+        self.assertEqual(synthesis.generated_dirs, ["gpio"])
+        synthesis.sync_mode = "sync"
+        tooldir = os.path.join(self.synthesisdir, "db")
+        os.mkdir(tooldir)
+        synthesis.generate_project()
+        self.assertTrue(os.path.isfile(os.path.join(self.synthesisdir,
+                                                    "gpio", "gpio.vhd")))
+        self.project.del_instance("gpioa")
+        synthesis.generate_project()
+        self.assertFalse(os.path.exists(os.path.join(self.synthesisdir,
+                                                     "gpio")))
+        self.assertTrue(os.path.isdir(tooldir))
+        self.assertEqual(synthesis.generated_dirs, [])
+
+
+if __name__ == "__main__":
+    print("test_synthesis class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,74 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_topgen
+"""
+
+import sys
+sys.path.append("./")
+from periphondemand.bin.utils.poderror import PodError
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+
+from periphondemand.bin.core.project import Project
+from periphondemand.bin.code.vhdl.topvhdl import TopVHDL
+
+
+class test_topgen(unittest.TestCase):
+    """ unit tests bin.code.topgen.py
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.project = Project(os.path.join(self.directory, "UnitTest"))
+        self.project.select_platform("testplat", "standard")
+        self.project.add_instance(libraryname="components",
+                                  componentname="gpio",
+                                  instancename="gpioa")
+        self.top = TopVHDL(self.project)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_fingerprint(self):
+        """ top is generated again only when its inputs change """
+        self.assertTrue(self.top.generate())
+        self.assertTrue(os.path.exists(self.top.fingerprint_filename))
+        stamp = os.stat(self.top.filename).st_mtime_ns
+        fingerprint = self.top.fingerprint()
+        self.assertFalse(self.top.generate())
+        self.assertEqual(os.stat(self.top.filename).st_mtime_ns, stamp)
+
+        pin = self.project.get_instance("gpioa").get_interface(
+            "gpio").get_port("gpio").get_pin(0)
+        platformpin = self.project.get_instance("testplat").get_interface(
+            "fpga").get_port("IO_0").get_pin(0)
+        self.project.connect_pin_cmd(pin, platformpin)
+        self.assertNotEqual(self.top.fingerprint(), fingerprint)
+        self.assertTrue(self.top.generate())
+        self.assertFalse(self.top.generate())
+
+        self.project.vhdl_version = "vhdl93"
+        self.assertTrue(self.top.generate())
+        self.assertTrue(self.top.generate(force=True))
+
+    def test_top_removed(self):
+        """ a removed top file is generated again """
+        self.assertTrue(self.top.generate())
+        os.remove(self.top.filename)
+        self.assertTrue(self.top.generate())
+
+
+if __name__ == "__main__":
+    print("test_topgen class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,138 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_wrappersystem
+"""
+
+import sys
+sys.path.append("./")
+from periphondemand.bin.utils.poderror import PodError
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+
+from periphondemand.bin.utils import wrappersystem as sy
+
+
+class test_wrappersystem(unittest.TestCase):
+    """ unit tests bin.utils.wrappersystem.py
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.source = os.path.join(self.directory, "source")
+        self.target = os.path.join(self.directory, "target")
+        os.mkdir(self.source)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, filename, text, mtime=None):
+        """ write text in filename, set its modification time """
+        with open(filename, "w") as afile:
+            afile.write(text)
+        if mtime is not None:
+            os.utime(filename, ns=(mtime, mtime))
+        return filename
+
+    def test_same_file(self):
+        """ files are compared by size, time, then content """
+        first = self.write(os.path.join(self.source, "a.vhd"), "abcd", 10)
+        second = self.write(os.path.join(self.directory, "a.vhd"), "abcd",
+                            20)
+        self.assertTrue(sy.same_file(first, second))
+        self.write(second, "abce", 20)
+        self.assertFalse(sy.same_file(first, second))
+        self.write(second, "abcde", 10)
+        self.assertFalse(sy.same_file(first, second))
+        # same size and time, content is not read
+        self.write(second, "zzzz", 10)
+        self.assertTrue(sy.same_file(first, second))
+        self.assertFalse(sy.same_file(first, second + ".none"))
+
+    def test_sync_file(self):
+        """ files are copied only when they changed """
+        os.mkdir(self.target)
+        source = self.write(os.path.join(self.source, "a.vhd"), "abcd")
+        target = os.path.join(self.target, "a.vhd")
+        self.assertTrue(sy.sync_file(source, self.target))
+        self.assertFalse(sy.sync_file(source, self.target))
+        self.assertFalse(os.path.samefile(source, target))
+        self.write(source, "efgh")
+        self.assertTrue(sy.sync_file(source, self.target))
+        with open(target) as afile:
+            self.assertEqual(afile.read(), "efgh")
+        os.remove(target)
+        self.assertTrue(sy.sync_file(source, self.target, link=True))
+        self.assertTrue(os.path.samefile(source, target))
+        self.assertFalse(os.path.exists(target + ".tmp"))
+
+    def test_sync_dir(self):
+        """ directory content follows files list """
+        first = self.write(os.path.join(self.source, "a.vhd"), "a")
+        second = self.write(os.path.join(self.source, "b.vhd"), "b")
+        self.assertEqual(sy.sync_dir([first, second], self.target),
+                         (["a.vhd", "b.vhd"], []))
+        os.mkdir(os.path.join(self.target, "old"))
+        self.write(second, "bb")
+        self.assertEqual(sy.sync_dir([second], self.target),
+                         (["b.vhd"], ["a.vhd", "old"]))
+        self.assertEqual(sorted(os.listdir(self.target)), ["b.vhd"])
+        self.assertEqual(sy.sync_dir([second], self.target), ([], []))
+
+    def test_cp_dir_stored(self):
+        """ instances share read only library files """
+        os.mkdir(os.path.join(self.source, "hdl"))
+        self.write(os.path.join(self.source, "source.xml"), "<component/>")
+        self.write(os.path.join(self.source, "hdl", "a.vhd"), "a")
+        store = os.path.join(self.directory, "store")
+        other = os.path.join(self.directory, "other")
+        for target in [self.target, other]:
+            os.mkdir(target)
+            sy.cp_dir_stored(self.source, target, store)
+        first = os.path.join(self.target, "source", "hdl", "a.vhd")
+        second = os.path.join(other, "source", "hdl", "a.vhd")
+        self.assertTrue(os.path.samefile(first, second))
+        self.assertEqual(os.stat(first).st_nlink, 3)
+        self.assertFalse(os.stat(first).st_mode & 0o222)
+        xmlfiles = [os.path.join(target, "source", "source.xml")
+                    for target in [self.target, other]]
+        self.assertFalse(os.path.samefile(*xmlfiles))
+        self.assertTrue(os.stat(xmlfiles[0]).st_mode & 0o200)
+        # replacing a file doesn't change other instance
+        os.remove(first)
+        self.write(first, "b")
+        with open(second) as afile:
+            self.assertEqual(afile.read(), "a")
+
+    def test_prune_store(self):
+        """ stored files are deleted with their last instance """
+        self.write(os.path.join(self.source, "a.vhd"), "a")
+        store = os.path.join(self.directory, "store")
+        other = os.path.join(self.directory, "other")
+        for target in [self.target, other]:
+            os.mkdir(target)
+            sy.cp_dir_stored(self.source, target, store)
+        sy.prune_store(store)
+        self.assertEqual(len(os.listdir(store)), 1)
+        sy.rm_dir(os.path.join(self.target, "source"))
+        sy.prune_store(store)
+        self.assertEqual(len(os.listdir(store)), 1)
+        sy.rm_dir(os.path.join(other, "source"))
+        sy.prune_store(store)
+        self.assertEqual(os.listdir(store), [])
+        sy.prune_store(os.path.join(self.directory, "none"))
+
+
+if __name__ == "__main__":
+    print("test_wrappersystem class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,128 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_wrapperxml
+"""
+
+import sys
+sys.path.append("./")
+from periphondemand.bin.utils.poderror import PodError
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+
+from periphondemand.bin.utils.wrapperxml import WrapperXml
+
+
+class test_wrapperxml(unittest.TestCase):
+    """ unit tests bin.utils.wrapperxml.py
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "test.xml")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_dirty_tracking(self):
+        """ only changes mark the tree as modified """
+        root = WrapperXml(nodestring='<project name="test"/>')
+        self.assertTrue(root.modified)
+        root.save_xml(self.filename)
+        self.assertFalse(root.modified)
+        root.set_attr("name", "test")
+        self.assertFalse(root.modified)
+        root.set_attr("name", "other")
+        self.assertTrue(root.modified)
+        root.save_xml(self.filename)
+
+        # a subnode modified marks the whole document
+        reloaded = WrapperXml(file=self.filename)
+        self.assertFalse(reloaded.modified)
+        node = reloaded.add_node(nodename="components")
+        reloaded.save_xml(self.filename)
+        node.set_attr("num", "1")
+        self.assertTrue(reloaded.modified)
+
+        # a tree appended is attached to its new root document
+        other = WrapperXml(nodestring='<component name="gpio"/>')
+        other.save_xml(os.path.join(self.directory, "other.xml"))
+        reloaded.save_xml(self.filename)
+        node.add_node(node=other)
+        self.assertTrue(reloaded.modified)
+        other.set_attr("name", "uart")
+        reloaded.save_xml(self.filename)
+        self.assertFalse(other.modified)
+
+    def test_save_unchanged(self):
+        """ unchanged file is not written again, changed file is replaced
+            atomically """
+        root = WrapperXml(nodestring='<project name="test"/>')
+        root.save_xml(self.filename)
+        inode = os.stat(self.filename).st_ino
+        root.save_xml(self.filename)
+        self.assertEqual(os.stat(self.filename).st_ino, inode)
+        root.set_attr("name", "other")
+        root.save_xml(self.filename)
+        self.assertNotEqual(os.stat(self.filename).st_ino, inode)
+        self.assertEqual(os.listdir(self.directory), ["test.xml"])
+        self.assertEqual(WrapperXml(file=self.filename).name, "other")
+        # saved in another file, written even if unchanged
+        copyname = os.path.join(self.directory, "copy.xml")
+        root.save_xml(copyname)
+        self.assertTrue(os.path.exists(copyname))
+
+    def test_wrappers_cache(self):
+        """ the same wrapper is given for an element while it is in the
+            tree """
+        root = WrapperXml(nodestring='<project><components>' +
+                          '<component name="a"/><component name="b"/>' +
+                          '</components></project>')
+        components = root.get_node("components")
+        self.assertIs(root.get_node("components"), components)
+        nodes = root.get_subnodes("components", "component")
+        self.assertEqual([node.name for node in nodes], ["a", "b"])
+        self.assertIs(components.get_nodes("component")[1], nodes[1])
+        # wrapper of a node added is the one given back
+        added = root.add_subnode(nodename="components",
+                                 subnodename="component",
+                                 attributename="name", value="c")
+        self.assertIs(components.get_nodes("component")[2], added)
+        # a node deleted and added again gets a new wrapper
+        element = nodes[0].tree
+        root.del_subnode("components", "component", "name", "a")
+        self.assertEqual([node.name for node in
+                          components.get_nodes("component")], ["b", "c"])
+        components.tree.append(element)
+        self.assertIsNot(components.get_nodes("component")[2], nodes[0])
+
+    def test_forget_subtree(self):
+        """ wrappers of a deleted node subnodes are forgotten """
+        root = WrapperXml(nodestring='<project><components>' +
+                          '<component name="a"><port name="p">' +
+                          '<pin num="0"/></port></component>' +
+                          '</components></project>')
+        component = root.get_subnodes("components", "component")[0]
+        port = component.get_node("port")
+        port.get_node("pin")
+        wrappers = root._document.resolve().wrappers
+        self.assertIn(port.tree, wrappers)
+        root.del_subnode("components", "component", "name", "a")
+        self.assertEqual([wrapper for wrapper in wrappers.values()
+                          if wrapper in (component, port)], [])
+        self.assertEqual(len(wrappers), 1)
+
+
+if __name__ == "__main__":
+    print("test_wrapperxml class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,96 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   Fabien Marteau <fabien.marteau@armadeus.com>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_xmlbackend
+"""
+
+import sys
+sys.path.append("./")
+from periphondemand.bin.utils.poderror import PodError
+import xmlrunner
+import unittest
+import xml.etree.ElementTree as ElementTree
+
+from periphondemand.bin.utils import xmlbackend
+
+
+class test_xmlbackend(unittest.TestCase):
+    """ unit tests bin.utils.xmlbackend.py
+    """
+
+    def setUp(self):
+        self.root = xmlbackend.fromstring(
+            '<?xml version="1.0" encoding="utf-8"?>' +
+            '<slaves>' +
+            '<slave instancename="gpio0" interfacename="swb16"/>' +
+            '<slave instancename="gpio0" interfacename="swb8"/>' +
+            '<slave instancename="it&apos;s" interfacename="swb16"/>' +
+            '<slave instancename="uart"/>' +
+            '<other instancename="gpio0" interfacename="swb16"/>' +
+            '</slaves>')
+
+    def names(self, elements):
+        return [(element.get("instancename"), element.get("interfacename"))
+                for element in elements]
+
+    def test_find_matching(self):
+        """ children with all attributes values """
+        self.assertEqual(
+            self.names(xmlbackend.find_matching(
+                self.root, "slave", {"instancename": "gpio0"})),
+            [("gpio0", "swb16"), ("gpio0", "swb8")])
+        self.assertEqual(
+            self.names(xmlbackend.find_matching(
+                self.root, "slave", {"instancename": "gpio0",
+                                     "interfacename": "swb16"})),
+            [("gpio0", "swb16")])
+        # values are not pasted in compiled xpath expressions
+        self.assertEqual(
+            self.names(xmlbackend.find_matching(
+                self.root, "slave", {"instancename": "it's"})),
+            [("it's", "swb16")])
+        self.assertEqual(xmlbackend.find_matching(
+            self.root, "slave", {"instancename": "nosuch"}), [])
+        self.assertEqual(len(xmlbackend.find_matching(self.root, "slave",
+                                                      {})), 4)
+
+    def test_find_matching_fallback(self):
+        """ None value matches children without the attribute, it is
+            not supported by compiled xpath and falls back on a scan """
+        self.assertEqual(
+            self.names(xmlbackend.find_matching(
+                self.root, "slave", {"interfacename": None})),
+            [("uart", None)])
+        backend = xmlbackend.BACKEND
+        xmlbackend.BACKEND = "etree"
+        try:
+            scanned = xmlbackend.find_matching(
+                self.root, "slave", {"interfacename": "swb16"})
+        finally:
+            xmlbackend.BACKEND = backend
+        self.assertEqual(
+            scanned, xmlbackend.find_matching(self.root, "slave",
+                                              {"interfacename": "swb16"}))
+
+    def test_tostring(self):
+        """ files are written like ElementTree writes them """
+        text = '<a x="1&#10;&gt;" y="&quot;&#9;"><b/>text<!-- c -->' +\
+            ' more<?pi data?><c>t&gt;</c> \n</a>'
+        self.assertEqual(
+            xmlbackend.tostring(xmlbackend.fromstring(text)),
+            ElementTree.tostring(ElementTree.fromstring(text),
+                                 encoding="unicode"))
+        self.assertIn("<b />text more<c>", xmlbackend.tostring(
+            xmlbackend.fromstring(text)))
+
+
+if __name__ == "__main__":
+    print("test_xmlbackend class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))